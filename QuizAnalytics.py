@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+# Streaming aggregate analytics over recorded quiz sessions
+# Reads the save files written by MainWidget.saveProgress one at a time and folds each into incremental
+# counts: per-question answer histograms, verdict ratios per questionnaire and a histogram of west - east
+# margins from which percentile ranks are taken. Memory is bounded by the size of the questionnaires, not
+# by the number of sessions; aggregates can be saved and updated later without rescanning old files. Saved
+# aggregates only hold for the questionnaires they were counted against; after any change to those, the next
+# update starts again from scratch.
+
+from operator import itemgetter
+import argparse
+import tempfile
+import json
+import sys
+import os
+
+from QuizScoring import minResponse, maxResponse, maxPoints, tallyResponses
+from QuizSessions import readSession, isSessionFile, getCatalogueHash
+
+# Bumped whenever the saved layout changes; older state files are rebuilt from scratch
+stateVersion = 1
+# One character per absID when remembering a file's contribution (index = response + 1)
+responseChars = "x012345"
+
+
+class SessionAggregates(object):
+    """Incremental aggregates over any number of recorded sessions.
+
+       answerCounts:  {questionnaire index: [[count of response -1, 0, ..., 5] for each absID]}
+       verdictCounts: {questionnaire index: [west wins, east wins, ties]} (completed sessions only)
+       marginCounts:  {questionnaire index: [count for each margin]}; list position = margin + 5 * number of questions
+    """
+    def __init__(self, questionnaires):
+        self.questionnaires = questionnaires
+        self.catalogueHash = getCatalogueHash(questionnaires)
+        self.answerCounts = {}
+        self.verdictCounts = {}
+        self.marginCounts = {}
+        # Files already folded in: {path: [size, mtime, questionnaire index, responses <str>]}
+        self.seenFiles = {}
+        # Pole flags ordered by absID, per questionnaire; 0 = West, 1 = East
+        self.poles = {}
+        for index in range(0, questionnaires.getSize()):
+            sortedQuestions = sorted(questionnaires.getQuestions(index), key=itemgetter(3))
+            self.poles[index] = [int(question[1]) for question in sortedQuestions]
+
+    def getOffset(self, index):
+        """Returns the list position of a zero margin in marginCounts for the given questionnaire.
+
+           Input: questionnaire index <int>
+           Output: offset <int>
+        """
+        return maxPoints * len(self.poles[index])
+
+    def ensureQuestionnaire(self, index):
+        """Creates empty count arrays for a questionnaire the first time one of its sessions is seen."""
+        if (index not in self.answerCounts):
+            numQuestions = len(self.poles[index])
+            self.answerCounts[index] = [[0] * (maxResponse - minResponse + 1) for i in range(0, numQuestions)]
+            self.verdictCounts[index] = [0, 0, 0]
+            self.marginCounts[index] = [0] * (2 * self.getOffset(index) + 1)
+
+    def getMargin(self, index, responses):
+        """Returns the west - east margin of a completed session, or None if any question is unanswered.
+
+           Input: questionnaire index <int>, responses ordered by absID [<int>]
+           Output: margin <int> or None
+        """
+        tallies = tallyResponses(self.poles[index], responses)
+        return None if (tallies is None) else tallies[0] - tallies[1]
+
+    def addSession(self, index, responses, weight=1):
+        """Folds a single session into the aggregates. A weight of -1 removes a previously-added session.
+
+           Input: questionnaire index <int>, responses ordered by absID [<int>], weight <int>
+           Output: none
+        """
+        self.ensureQuestionnaire(index)
+        counts = self.answerCounts[index]
+        for absID, response in enumerate(responses):
+            counts[absID][response - minResponse] += weight
+
+        margin = self.getMargin(index, responses)
+        if (margin is not None):
+            self.marginCounts[index][margin + self.getOffset(index)] += weight
+            if (margin > 0):
+                self.verdictCounts[index][0] += weight
+            elif (margin < 0):
+                self.verdictCounts[index][1] += weight
+            else:
+                self.verdictCounts[index][2] += weight
+
+    def addFile(self, path):
+        """Folds a save file into the aggregates, replacing its earlier contribution if it has changed since.
+
+           Input: path to save file <str>
+           Output: whether the file was (re)counted <bool>
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        previous = self.seenFiles.get(path)
+        if (previous is not None) and (previous[0] == stat.st_size) and (previous[1] == stat.st_mtime):
+            return False
+
+        # File changed since it was counted; retract its old contribution first
+        if (previous is not None):
+            self.removeFile(path)
+
+        session = readSession(path, self.questionnaires)
+        if (session is None):
+            # Remember invalid files too, so unchanged ones are not re-read on every update
+            self.seenFiles[path] = [stat.st_size, stat.st_mtime, -1, ""]
+            return False
+        index, responses = session
+        self.addSession(index, responses)
+        self.seenFiles[path] = [stat.st_size, stat.st_mtime, index, "".join(responseChars[r + 1] for r in responses)]
+        return True
+
+    def removeFile(self, path):
+        """Retracts a previously-counted file's contribution, e.g. after it has been deleted or rewritten.
+
+           Input: path to save file <str>
+           Output: none
+        """
+        record = self.seenFiles.pop(os.path.abspath(path), None)
+        if (record is not None) and (record[2] != -1):
+            self.addSession(record[2], [responseChars.index(c) - 1 for c in record[3]], weight=-1)
+
+    def update(self, directory):
+        """Folds in every new or changed save file in a directory and retracts deleted ones.
+           Files that are unchanged since the last update are not re-read.
+
+           Input: directory <str>
+           Output: number of sessions (re)counted <int>
+        """
+        directory = os.path.abspath(directory)
+        present = set()
+        counted = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and isSessionFile(entry.name):
+                    present.add(entry.path)
+                    if self.addFile(entry.path):
+                        counted += 1
+        for path in list(self.seenFiles):
+            if (os.path.dirname(path) == directory) and (path not in present):
+                self.removeFile(path)
+        return counted
+
+    def getHistogram(self, index, absID):
+        """Returns how many sessions gave each response to a question.
+
+           Input: questionnaire index <int>, absolute question ID <int>
+           Output: {response <int>: count <int>} for responses -1 to 5
+        """
+        self.ensureQuestionnaire(index)
+        counts = self.answerCounts[index][absID]
+        return {response: counts[response - minResponse] for response in range(minResponse, maxResponse + 1)}
+
+    def getVerdictRatios(self, index):
+        """Returns the share of completed sessions ending in each verdict.
+
+           Input: questionnaire index <int>
+           Output: (west share, east share, tie share) <float>, all 0 if no completed sessions
+        """
+        self.ensureQuestionnaire(index)
+        total = sum(self.verdictCounts[index])
+        if (total == 0):
+            return (0.0, 0.0, 0.0)
+        return tuple(count / total for count in self.verdictCounts[index])
+
+    def getPercentileRank(self, index, margin):
+        """Returns the percentile rank of a west - east margin among all completed sessions of a questionnaire:
+           the percentage of sessions with a smaller margin, counting equal margins as half.
+
+           Input: questionnaire index <int>, margin <int>
+           Output: percentile rank <float> in range 0-100, or None if there are no completed sessions
+        """
+        self.ensureQuestionnaire(index)
+        counts = self.marginCounts[index]
+        total = sum(counts)
+        if (total == 0):
+            return None
+        position = max(0, min(len(counts) - 1, margin + self.getOffset(index)))
+        below = sum(counts[:position])
+        return 100.0 * (below + 0.5 * counts[position]) / total
+
+    def save(self, path):
+        """Writes the aggregates to a JSON state file so a later update only reads new files. Written to a
+           temporary file and renamed, so an interrupted run leaves the previous state intact.
+
+           Input: path <str>
+           Output: none; raises OSError
+        """
+        state = {"version": stateVersion,
+                 "catalogueHash": self.catalogueHash,
+                 "answerCounts": self.answerCounts,
+                 "verdictCounts": self.verdictCounts,
+                 "marginCounts": self.marginCounts,
+                 "seenFiles": self.seenFiles}
+        descriptor, temporaryPath = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                                     dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(descriptor, 'w') as OUTFILE:
+                json.dump(state, OUTFILE)
+            os.replace(temporaryPath, path)
+        except OSError:
+            try:
+                os.remove(temporaryPath)
+            except OSError:
+                pass
+            raise
+
+    def load(self, path):
+        """Restores aggregates written by save(). JSON turns the questionnaire keys into strings, so convert back.
+           State counted against other questionnaires (or written by another version) is not used, so the next
+           update counts every file again.
+
+           Input: path <str>
+           Output: whether the saved aggregates were restored <bool>
+        """
+        try:
+            with open(path, 'r') as INFILE:
+                state = json.load(INFILE)
+            if (state.get("version") != stateVersion) or (state.get("catalogueHash") != self.catalogueHash):
+                return False
+            answerCounts = {int(index): counts for index, counts in state["answerCounts"].items()}
+            verdictCounts = {int(index): counts for index, counts in state["verdictCounts"].items()}
+            marginCounts = {int(index): counts for index, counts in state["marginCounts"].items()}
+            seenFiles = state["seenFiles"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            return False
+        self.answerCounts = answerCounts
+        self.verdictCounts = verdictCounts
+        self.marginCounts = marginCounts
+        self.seenFiles = seenFiles
+        return True
+
+
+def printReport(aggregates):
+    """Prints verdict ratios and per-question histograms for every questionnaire that has sessions."""
+    titles = aggregates.questionnaires.getAllShortTitles()
+    for index in sorted(aggregates.answerCounts):
+        west, east, tie = aggregates.getVerdictRatios(index)
+        print("[%d] %s: %d completed sessions (West %.1f%%, East %.1f%%, tie %.1f%%)"
+              % (index, titles[index], sum(aggregates.verdictCounts[index]), 100 * west, 100 * east, 100 * tie))
+        for absID in range(0, len(aggregates.answerCounts[index])):
+            histogram = aggregates.getHistogram(index, absID)
+            print("    %3d: " % absID + " ".join("%d:%d" % (response, count) for response, count in histogram.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate analytics over recorded quiz sessions.")
+    parser.add_argument("directory", help="directory of save files (.txt, .txt.gz, .txt.xz)")
+    parser.add_argument("--state", help="JSON file holding aggregates between runs; only new or changed saves are read")
+    parser.add_argument("--rank", metavar="SAVEFILE", help="print the percentile rank of this session's west - east margin")
+    args = parser.parse_args(argv)
+
+    # Deferred so --help does not pay for building the catalogue
+    from QuizCatalogue import questionnairesArray
+    aggregates = SessionAggregates(questionnairesArray())
+    if args.state and os.path.exists(args.state) and not (aggregates.load(args.state)):
+        print("%s is for other questionnaires or unreadable; counting every session again" % args.state, file=sys.stderr)
+    counted = aggregates.update(args.directory)
+    if args.state:
+        aggregates.save(args.state)
+
+    print("%d new or changed sessions counted" % counted)
+    printReport(aggregates)
+
+    if args.rank:
+        session = readSession(args.rank, aggregates.questionnaires)
+        margin = None if session is None else aggregates.getMargin(*session)
+        if (margin is None):
+            print("%s: not a completed, valid session" % args.rank)
+            return 1
+        print("%s: margin %+d, percentile rank %.1f" % (args.rank, margin, aggregates.getPercentileRank(session[0], margin)))
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+# Save archive audit
+# Checks every save file in a directory with the rules loadProgress applies (header, questionnaire index, number of
+# lines, each absID exactly once, responses from -1 to 5, and for version 2 saves the questionnaire hash) and
+# reports why each file that would be refused is refused. Results are cached next to the saves, keyed by path,
+# size and modification time, so auditing a large archive again only reads the files that changed. The cache is
+# discarded whenever the questionnaires themselves change, since a file's verdict depends on them.
+#
+# Exit status: 0 if every file is loadable, 1 if any is not.
+
+import argparse
+import tempfile
+import json
+import sys
+import os
+
+from QuizSessions import loadSession, isSessionFile, getCatalogueHash, SessionError
+
+defaultCacheName = ".quizAudit.json"
+# Bumped whenever the rules or the cache layout change, so old results are not trusted
+auditVersion = 2
+
+
+def auditFile(path, questionnaires):
+    """Checks one save file with full validation, even when its checksum matches, so a verdict never rests on the
+       loaders' fast path.
+
+       Input: path <str>, questionnaires <questionnairesArray>
+       Output: [questionnaire index <int> (-1 if not loadable), message loadProgress would show <str> or None,
+                the rule the file breaks <str> or None]
+    """
+    try:
+        index, answers = loadSession(path, questionnaires, trustChecksum=False)
+    except SessionError as error:
+        return [-1, str(error), error.detail]
+    return [index, None, None]
+
+
+class AuditCache(object):
+    """Audit results from earlier runs: {absolute path: [size, mtime_ns, result from auditFile()]}."""
+    def __init__(self, questionnaires):
+        self.catalogueHash = getCatalogueHash(questionnaires)
+        self.results = {}
+        self.isModified = False
+
+    def load(self, path):
+        """Restores results written by save(); results made against other questionnaires are dropped."""
+        try:
+            with open(path, 'r') as INFILE:
+                state = json.load(INFILE)
+            if (state.get("version") == auditVersion) and (state.get("catalogueHash") == self.catalogueHash):
+                self.results = state["results"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            self.results = {}
+
+    def save(self, path):
+        """Writes the results back if anything changed; a read-only archive simply gets audited in full next time."""
+        if not (self.isModified):
+            return
+        try:
+            descriptor, temporaryPath = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                                         dir=os.path.dirname(os.path.abspath(path)))
+        except OSError:
+            return
+        try:
+            with os.fdopen(descriptor, 'w') as OUTFILE:
+                json.dump({"version": auditVersion, "catalogueHash": self.catalogueHash, "results": self.results}, OUTFILE)
+            os.replace(temporaryPath, path)
+            self.isModified = False
+        except OSError:
+            try:
+                os.remove(temporaryPath)
+            except OSError:
+                pass
+
+    def get(self, path, stat):
+        record = self.results.get(path)
+        if (record is not None) and (record[0] == stat.st_size) and (record[1] == stat.st_mtime_ns):
+            return record[2]
+        return None
+
+    def put(self, path, stat, result):
+        self.results[path] = [stat.st_size, stat.st_mtime_ns, result]
+        self.isModified = True
+
+    def retain(self, paths):
+        """Forgets files that are no longer in the archive."""
+        for path in [path for path in self.results if path not in paths]:
+            del self.results[path]
+            self.isModified = True
+
+
+def auditDirectory(directory, questionnaires, cache, recursive=False, allFiles=False):
+    """Audits every save file in a directory, reading only files that are new or changed since they were cached.
+
+       Input: directory <str>, questionnaires <questionnairesArray>, cache <AuditCache>, include subdirectories <bool>,
+              check every file rather than only .txt/.txt.gz/.txt.xz <bool>
+       Output: [(path <str>, result from auditFile(), whether it was re-read <bool>)] in path order
+    """
+    paths = []
+    for root, dirNames, fileNames in os.walk(directory):
+        if not (recursive):
+            dirNames[:] = []
+        paths += [os.path.join(root, name) for name in fileNames
+                  if (allFiles or isSessionFile(name)) and (name != defaultCacheName)]
+    paths.sort()
+
+    audited = []
+    for path in paths:
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        result = cache.get(key, stat)
+        if (result is None):
+            result = auditFile(path, questionnaires)
+            cache.put(key, stat, result)
+            audited.append((path, result, True))
+        else:
+            audited.append((path, result, False))
+    cache.retain(set(os.path.abspath(path) for path in paths))
+    return audited
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check which save files loadProgress would accept, and why not.")
+    parser.add_argument("directory", help="directory of save files")
+    parser.add_argument("--cache", help="results cache (default: %s in the directory)" % defaultCacheName)
+    parser.add_argument("--no-cache", action="store_true", help="check every file again and do not write a cache")
+    parser.add_argument("--recursive", action="store_true", help="include subdirectories")
+    parser.add_argument("--all-files", action="store_true", help="check every file, not only .txt/.txt.gz/.txt.xz")
+    parser.add_argument("--failures-only", action="store_true", help="list only files that would be refused")
+    args = parser.parse_args(argv)
+
+    if not (os.path.isdir(args.directory)):
+        parser.error("%s is not a directory" % args.directory)
+    # Deferred so --help does not pay for building the catalogue
+    from QuizCatalogue import questionnairesArray
+    questionnaires = questionnairesArray()
+    cachePath = args.cache or os.path.join(args.directory, defaultCacheName)
+    cache = AuditCache(questionnaires)
+    if not (args.no_cache):
+        cache.load(cachePath)
+
+    audited = auditDirectory(args.directory, questionnaires, cache, args.recursive, args.all_files)
+    if not (args.no_cache):
+        cache.save(cachePath)
+
+    numFailed = 0
+    for path, (index, message, detail), isRead in audited:
+        if (message is not None):
+            numFailed += 1
+            print("FAIL  %s: %s" % (path, detail))
+        elif not (args.failures_only):
+            print("OK    %s (questionnaire %d)" % (path, index))
+    numRead = sum(1 for path, result, isRead in audited if isRead)
+    print("%d files: %d loadable, %d not; %d checked, %d unchanged since the last audit"
+          % (len(audited), len(audited) - numFailed, numFailed, numRead, len(audited) - numRead))
+    return 1 if numFailed else 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
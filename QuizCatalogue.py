@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+# Questionnaire catalogue
+# Every built-in questionnaire: questions, titles, descriptions and results. Kept free of Qt so the headless runner
+# and the command-line tools can read it without loading the GUI. A questionnaire's absIDs run from 0 to its number of
+# questions - 1, each used once: save files, the export columns and the analysis tools all rely on it.
+
+class questionnairesArray(object):
+    """Class of arrays to contain all questionnaire information.
+        Included information: questions, titles, shortened titles, descriptions, results titles, results text, results pictures paths.
+    """
+    def __init__(self):
+        # Actual questions
+        self.questions = []
+        # Titles for quizzes
+        self.titles = []
+        # Shortened quiz titles (for questionnaireBox)
+        self.shortTitles = []
+        # Descriptions for quizzes
+        self.descriptions = []
+        # Titles for quiz results
+        self.resultsTitles = []
+        # Text for quiz results
+        self.resultsText = []
+        # Pictures for quiz results, named relative to appDirectory (see loadPixmap)
+        self.resultsPicsDirs = []
+
+        # QUIZ 1: East Coast vs West Coast
+        self.questions.append([["Overall, I prefer cold rain over snow.", 0, -1, 0],
+                ["I would rather spend the day hiking in the forest than shopping downtown.", 0, -1, 1],
+                ["I would rather have more leisure time than work extra hours at my job to finish a project early.", 0, -1, 2],
+                ["In the summer, I prefer to wear flip flops over boat shoes.", 0, -1, 3],
+                ["My ideal career would be in a tech-related field.", 0, -1, 4],
+                ["I care deeply about recycling and composting.", 0, -1, 5],
+                ["I prefer to go to parties that start and end earlier in the night rather than later.", 0, -1, 6],
+                ["I like to drink cheap, local, and readily-available wine over more expensive and exotic brands.", 0, -1, 7],
+                ["I don't mind driving for an hour or two to get to the next big city nearest to my own.", 0, -1, 8],
+                ["I prefer fast-paced, urban energy to a more relaxed lifestyle.", 1, -1, 9],
+                ["A wide selection of local beers is not all that important to me.", 1, -1, 10],
+                ["My idea of fashion prioritizes layering over accessorizing.", 1, -1, 11],
+                ["Living near urban centers with lots of entertainment/shopping opportunities is important to me.", 1, -1, 12],
+                ["I am not very affected by bad weather.", 1, -1, 13],
+                ["I get irritated when people are walking too slowly in front of me and I have somewhere to be.", 1, -1, 14],
+                ["I think it is more important to be truthful than to avoid hurting someone's feelings.", 1, -1, 15],
+                ["In the winter, I would rather wear a nice pea coat than a flannel jacket.", 1, -1, 16],
+                ["I like the idea of dressing in a sophisticated and professional manner for my job.", 1, -1, 17]])
+        self.titles.append("Are You More Suited for the East\n   Coast or for the West Coast?")
+        self.shortTitles.append("East Coast vs West Coast")
+        self.descriptions.append("Would you prefer a life on the East Coast, or are you more suited for living on the West Coast? Answer a few questions about your lifestyle and this quiz will tell you which coast you truly belong on.")
+        self.resultsTitles.append(["Results: You Belong on the West Coast!", "Results: You Belong on the East Coast!"])
+        self.resultsText.append(["Duuude, you're definitely a West Coaster. You probably like hoodies and don't feel the need to dress up for work. You hate the snow, but you're fine with rain (ESPECIALLY if you like Portland or Seattle). You love outdoorsy activities like camping, hiking, and surfing. You believe that personal well-being, caring about the environment, and connecting with others are the most important things in life. You know what they say: West Coast best coast!", "You're an East Coaster at heart. You walk fast, talk fast, and don't put up with any BS. You like the idea of big cities being within feasible driving distance, and you can put up with cold weather just fine. You feel that big cities like New York and Boston have so much history and culture to them that you can't help but want to live on the East Coast. You're probably reading this in your pea coat on your way to work. You know what they say: work hard, play hard!"])
+        self.resultsPicsDirs.append(["img/WestCoastEDIT.jpg", "img/EastCoastEDIT.jpg"])
+
+        # QUIZ 2: Cat Person versus Dog Person
+        self.questions.append([["I was exposed to cats frequently as a child.", 0, -1, 0],
+                ["Dogs were a common pet in my childhood.", 1, -1, 1],
+                ["A night spent at home watching Netflix sounds more appealing than a night on the town.", 0, -1, 2],
+                ["When I go to the beach, I'd rather play frisbee with friends than watch the sunset alone.", 1, -1, 3],
+                ["I consider myself a creative, 'non-traditional' thinker.", 0, -1, 4],
+                ["I get anxious if I don't spend enough time outside being active.", 1, -1, 5],
+                ["I don't like playing by the rules, especially if the rules are illogical and impede my productivity.", 0, -1, 6],
+                ["I prefer group projects over independent work.", 1, -1, 7],
+                ["George Harrison was a better Beatle than Paul McCartney.", 0, -1, 8],
+                ["I find humor based on clever wordplay to be confusing and/or pretentious.", 1, -1, 9],
+                ["I can see myself living in a studio apartment.", 0, -1, 10],
+                ["I would enjoy living in a house with many roommates.", 1, -1, 11],
+                ["I am sometimes accused of being 'standoffish' or otherwise emotionally distant.", 0, -1, 12],
+                ["My viewpoints and beliefs tend to be more conservative than liberal.", 1, -1, 13],
+                ["I would rather live in an urban area near a coastline than in a rural area in the middle of the country.", 0, -1, 14],
+                ["I tend to live my life in a positive, uplifting mindset.", 1, -1, 15],
+                ["I sometimes feel like I worry about certain things more than most people do.", 0, -1, 16],
+                ["I am trusting of others, sometimes to a fault.", 1, -1, 17],
+                ["I tend to draw my energy from creative pursuits, rather than physical activity.", 0, -1, 18],
+                ["I dislike the idea of a long-distance relationship, and I wouldn't want to be in one.", 1, -1, 19]])
+        self.titles.append("  Are You More of a Cat\nPerson or a Dog Person?")
+        self.shortTitles.append("Cat Person vs Dog Person")
+        self.descriptions.append("Feline friends or canine companions? Which one suits you more? Based on a few questions about your personality and habits, this quiz will determine which animal you'd be better off having as a pet.")
+        self.resultsTitles.append(["Results: You Are a Cat Person!", "Results: You Are a Dog Person!"])
+        self.resultsText.append(["You definitely prefer the company of a feline friend. You're probably a creative soul who'd rather spend a day painting a picture or writing poetry than going out and being social. Not to say that you're not a social being -- just that you're not the kind of person to bounce around a party greeting everybody whether you know them or not. You would probably be fine living in a small apartment in or near a city, so long as you have a cat to sit on your lap in the evening.","You like your canine companions! You're the kind of person who feels energized through being sociable and connecting with a wide variety of friends. Staying inside all day sounds like a nightmare to you; you'd rather get out of the house and do something active, especially with friends! And if it were socially acceptable, you'd probably stick your head out the car window just like a dog. After all, life is a wild ride, and you're here to enjoy every second of it."])
+        self.resultsPicsDirs.append(["img/CatPersonEDIT.jpg", "img/DogPersonEDIT.jpg"])
+
+        # QUIZ 3: Wine Person vs Beer Person
+        self.questions.append([["I tend to enjoy dressing up and looking sharp for a night out.", 0, -1, 0],
+                ["I prefer a more laid-back drinking environment over a more formal tone.", 1, -1, 1],
+                ["I am not afraid to spend more money on a more exquisite drink.", 0, -1, 2],
+                ["When I buy booze, I tend to buy whatever has the highest alcohol content for the lowest price.", 1, -1, 3],
+                ["Most of my social interactions are with a significant other.", 0, -1, 4],
+                ["I tend to hang out with groups of friends rather than with individuals one on one.", 1, -1, 5],
+                ["I live (or would like to live) on the coast rather than the central area of the country.", 0, -1, 6],
+                ["Given the choice, I would rather live in Germany than in France.", 1, -1, 7],
+                ["I tend to worry about how many calories I consume in a day.", 0, -1, 8],
+                ["I am concerned about my daily sugar intake.", 1, -1, 9],
+                ["I prefer to drink alcohol that has been imported from other states or countries.", 0, -1, 10],
+                ["I enjoy drinking locally-produced beverages.", 1, -1, 11]])
+        self.titles.append("   Are You a Beer Person\n        or a Wine Person?")
+        self.shortTitles.append("Beer Person vs Wine Person")
+        self.descriptions.append("Do you enjoy the classy nature of wine, or are you more of a laid-back craft brew drinker? Answer a handful of questions and this quiz will determine which booze should be your go-to this weekend.")
+        self.resultsTitles.append(["Results: You Are A Wine Person!", "Results: You Are A Beer Person!"])
+        self.resultsText.append(["You prefer the finer things in life, and wine is certainly no exception. A refined drink for refined tastes, you enjoy the dignified nature and exotic charm of drinking an imported wine over the rambunctious energy of drinking a beer brewed down the street. Wine is perfect for a night spent at a fancy restaurant with your significant other or simply curling up with each other to watch a movie at home. You couldn't be happier about being a wine person!", "Whether it be lagers, ales, stouts, or any other manner of beer, chances are you prefer it over the more limited selection of wines. You enjoy the idea of drinking what is, at its core, a local product -- in fact, some of the best beer may practically be brewed in your backyard! Most importantly, however, you enjoy the camraderie and social atmosphere of drinking with groups of friends that beer is so apt on cultivating. So crack open a cold one and enjoy!"])
+        self.resultsPicsDirs.append(["img/WinePersonEDIT.jpg", "img/BeerPersonEDIT.jpg"])
+
+        """
+        # QUIZ 4: Placeholder quiz, to test functionality of dynamically-scaled questionnaire loading dialog
+        self.questions.append([["Test question 1", 0, -1, 0],
+                ["Test question 2", 1, -1, 1],
+                ["Test question 3", 0, -1, 2],
+                ["Test question 4", 1, -1, 3]])
+        self.titles.append("   Test Title 2?")
+        self.shortTitles.append("Test Title 2")
+        self.descriptions.append("This is also a test quiz. It's not very fun, but try it out if you'd like. Also, this is a test to see what happens when I type too far into the dialog box. Will it scroll? Will it overflow? Let's find out. Test test test test test test test test test that's ten tests. I think this should be enough text to sufficiently overfill the text edit. Cool. Done. Bye.")
+        self.resultsTitles.append(["Results: Answer 0!", "Results: Answer 1!"])
+        self.resultsText.append(["You took this meaningless quiz, and got an answer of 0. In a binary world, that means you are false. Neat!", "You took a pointless quiz and got an answer of 1. If this were binary, you'd be true, but that doesn't really mean all that much on its own, does it? Oh well."])
+        self.resultsPicsDirs.append(['0', '0'])
+        """
+
+    def getSize(self):
+        """Returns the number of questionnaires.
+           Input: none
+           Output: number of questionnaires <int>
+        """
+        return len(self.questions)
+
+    def getAllShortTitles(self):
+        """Returns complete list of short titles of questionnaires.
+           Input: none
+           Output: list of short titles [<str>]
+        """
+        return self.shortTitles
+
+    def getQuestions(self, index):
+        """Returns the complete list of question text/properties for the given questionnaire.
+           Input: questionnaire ID
+           Output: questions array [[question text <str>, which answer pertains to <bool/int>, which button is pressed <int>, absolute question number <int>]]
+        """
+        return self.questions[index]
+
+    def getQuizTitle(self, index):
+        """Get title of quiz for given index.
+           Input: questionnaire ID
+           Output: questionnaire title <str>
+        """
+        return self.titles[index]
+
+    def getAllDescriptions(self):
+        """Returns complete list of quiz descriptions, in the same order as getAllShortTitles().
+           Input: none
+           Output: list of descriptions [<str>]
+        """
+        return self.descriptions
+
+    def getQuizDescription(self, index):
+        """Get description of quiz for given index.
+           Input: questionnaire ID
+           Output: quiz description <str>
+        """
+        return self.descriptions[index]
+
+    def getResultsTitles(self, index):
+        """Get titles for results for quiz of given index.
+           Input: questionnaire ID
+           Output: results titles [results title 0 <str>, results title 1 <str>]
+        """
+        return self.resultsTitles[index]
+
+    def getResultsTexts(self, index):
+        """Get paragraph descriptions of results for quiz of given index.
+           Input: questionnaire ID
+           Output: results text [results text 0 <str>, results title 1 <str>]
+        """
+        return self.resultsText[index]
+
+    def getResultsPics(self, index):
+        """Get paths to pictures for quiz results for quiz of given index.
+           Input: questionnaire ID
+           Output: results picture paths [path 0 <str>, path 1 <str>]
+        """
+        return self.resultsPicsDirs[index]
+
+
+class CatalogueError(Exception):
+    """Raised when questionnaire definitions break the rules the rest of the app relies on (see checkQuestionnaires)."""
+    pass
+
+
+def checkQuestionnaires(questionnaires):
+    """Checks that every questionnaire's absIDs run from 0 without gaps, e.g. after the definitions were edited by hand.
+
+       Input: questionnaires <questionnairesArray>
+       Output: none; raises CatalogueError
+    """
+    for index in range(0, questionnaires.getSize()):
+        absIDs = sorted(question[3] for question in questionnaires.getQuestions(index))
+        if (absIDs != list(range(0, len(absIDs)))):
+            # n absIDs that are not exactly 0 to n - 1 always leave one of those out
+            missing = sorted(set(range(0, len(absIDs))) - set(absIDs))
+            raise CatalogueError("questionnaire %d: absIDs must run from 0 to %d, each used once; no question has absID %s"
+                                 % (index, len(absIDs) - 1, ", ".join(map(str, missing))))
+
+
+def diffQuestions(oldQuestions, newQuestions):
+    """Compares two versions of a questionnaire's questions by absID, e.g. after its definition has been edited.
+
+       Input: old questions, new questions [[question text <str>, pole <int>, response <int>, absID <int>]]
+       Output: ({absID: new question} for questions whose text or pole changed, absIDs only in the new version [<int>],
+                absIDs only in the old version [<int>])
+    """
+    old = {question[3]: question for question in oldQuestions}
+    new = {question[3]: question for question in newQuestions}
+    changed = {absID: question for absID, question in new.items()
+               if (absID in old) and (old[absID][0] != question[0] or old[absID][1] != question[1])}
+    added = sorted(absID for absID in new if absID not in old)
+    removed = sorted(absID for absID in old if absID not in new)
+    return changed, added, removed
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+# Memory diagnostics for the quiz GUI
+# Enabled with `EastWestQuiz.py --memory-report [PATH]`. After every loadInitialProgress and successful
+# loadProgress (once all question widgets have been built), records what the loaded questionnaire costs:
+# Python heap attributed to question widgets and results pages by tracemalloc, live QObjects counted with
+# findChildren, the bytes held by every distinct pixmap, and process RSS. Qt's own C++ allocations are not
+# visible to tracemalloc, which is why the QObject counts, pixmap sizes and RSS are reported next to it.
+
+from PyQt5.QtCore import QObject
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication, QLabel
+from collections import Counter
+import tracemalloc
+import inspect
+import json
+import sys
+import os
+
+# Frames kept per traced allocation; enough to see RadioButtons.__init__ beneath Qt/sip wrapper frames
+tracebackDepth = 16
+# Allocation sites listed per report, largest growth first
+topSites = 10
+# The profiler's own snapshots are not part of what a quiz costs
+ignoreSelf = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+
+def getRss():
+    """Returns the resident set size of this process in bytes, or None where it cannot be read.
+
+       Input: none
+       Output: RSS <int> or None
+    """
+    try:
+        with open("/proc/self/statm", 'r') as INFILE:
+            return int(INFILE.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current RSS, but the best available without /proc; macOS reports bytes, Linux kilobytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if (sys.platform == "darwin") else peak * 1024
+
+
+def countQObjects(root):
+    """Returns the number of live QObjects in a tree, root included."""
+    return 1 + len(root.findChildren(QObject))
+
+
+def getPixmapBytes(pixmap):
+    """Returns the bytes of pixel data a pixmap holds (width x height x depth)."""
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class MemoryProfiler(object):
+    """Collects one memory report per questionnaire load and writes them all as JSON.
+
+       Usage: beginLoad(label) before the old quiz is torn down, then endLoad() once construction has finished
+       (MainWidget.signalQuestionsBuilt). Reports accumulate in self.reports and the file is rewritten after each.
+    """
+    def __init__(self, reportPath="-"):
+        self.reportPath = reportPath            # "-" writes each report to stdout instead
+        self.reports = []
+        self.mainWidget = None
+        self.pending = None                     # [label, traced bytes, RSS, snapshot] while a load is in progress
+        self.codeRanges = {}                    # {category: [(filename, first line, last line)]}
+        if not (tracemalloc.is_tracing()):
+            tracemalloc.start(tracebackDepth)
+
+    def attach(self, mainWidget):
+        """Starts following a MainWidget; must happen before its first loadInitialProgress.
+
+           Input: mainWidget <MainWidget>
+           Output: none
+        """
+        self.mainWidget = mainWidget
+        mainWidget.signalQuestionsBuilt.connect(self.endLoad)
+
+        # Allocations are attributed by the source lines of the classes that make them
+        module = sys.modules[type(mainWidget).__module__]
+        self.codeRanges = {"questionWidgets": [self.getCodeRange(module.RadioButtons),
+                                               self.getCodeRange(type(mainWidget).createQuestionWidget)],
+                           "resultsPages": [self.getCodeRange(module.ResultsLayout),
+                                            self.getCodeRange(module.FullBottomLayoutStack)]}
+
+    def getCodeRange(self, code):
+        """Returns (filename, first line, last line) of a class or function's source."""
+        lines, first = inspect.getsourcelines(code)
+        return (os.path.abspath(inspect.getsourcefile(code)), first, first + len(lines) - 1)
+
+    def beginLoad(self, label):
+        """Marks the start of a load so its growth can be measured.
+
+           Input: label <str>, e.g. "loadInitialProgress"
+           Output: none
+        """
+        self.pending = [label, tracemalloc.get_traced_memory()[0], getRss(),
+                        tracemalloc.take_snapshot().filter_traces(ignoreSelf)]
+
+    def endLoad(self):
+        """Records a report for the load begun by beginLoad(); connected to MainWidget.signalQuestionsBuilt."""
+        if (self.pending is None) or (self.mainWidget is None):
+            return
+        label, tracedBefore, rssBefore, snapshotBefore = self.pending
+        self.pending = None
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(ignoreSelf)
+        tracedNow = tracemalloc.get_traced_memory()[0]
+        rssNow = getRss()
+        attributed = self.attributeTraces(snapshot)
+        widget = self.mainWidget
+        numQuestions = len(widget.radioButtonsArray)
+
+        # Every top-level widget, so dialogs that were never parented (and never freed) show up too
+        topLevels = QApplication.topLevelWidgets()
+        classCounts = Counter()
+        for topLevel in topLevels:
+            classCounts[topLevel.metaObject().className()] += 1
+            for child in topLevel.findChildren(QObject):
+                classCounts[child.metaObject().className()] += 1
+
+        questionObjects = sum(countQObjects(radioButtons) for radioButtons in widget.radioButtonsArray)
+        resultsPages = []
+        for page in (widget.stackedBottom.westWidget, widget.stackedBottom.eastWidget):
+            resultsPages.append({"pageID": page.pageID,
+                                 "qobjects": countQObjects(page),
+                                 "pixmapBytes": getPixmapBytes(page.picPixMap)})
+
+        report = {"label": label,
+                  "questionnaireIndex": widget.questionnaireIndex,
+                  "numQuestions": numQuestions,
+                  "rssBytes": rssNow,
+                  "rssDeltaBytes": None if (rssNow is None or rssBefore is None) else rssNow - rssBefore,
+                  "tracedBytes": tracedNow,
+                  "tracedDeltaBytes": tracedNow - tracedBefore,
+                  "qobjects": {"total": sum(classCounts.values()),
+                               "topLevelWidgets": len(topLevels),
+                               "byClass": dict(classCounts.most_common())},
+                  "questionWidgets": {"count": numQuestions,
+                                      "qobjects": questionObjects,
+                                      "qobjectsPerWidget": questionObjects / numQuestions if numQuestions else 0,
+                                      "pythonBytes": attributed["questionWidgets"],
+                                      "pythonBytesPerWidget": attributed["questionWidgets"] / numQuestions if numQuestions else 0},
+                  "resultsPages": {"pages": resultsPages,
+                                   "pythonBytes": attributed["resultsPages"]},
+                  "pixmaps": self.getPixmaps(topLevels),
+                  "topAllocationSites": ["%s: %+d bytes" % (stat.traceback[0], stat.size_diff)
+                                         for stat in snapshot.compare_to(snapshotBefore, "lineno")[:topSites]]}
+        self.reports.append(report)
+        self.writeReports(report)
+
+    def attributeTraces(self, snapshot):
+        """Sums the Python allocations still alive whose traceback passes through each category's code.
+
+           Input: snapshot <tracemalloc.Snapshot>
+           Output: {category: bytes <int>}
+        """
+        totals = dict.fromkeys(self.codeRanges, 0)
+        for trace in snapshot.traces:
+            for category, ranges in self.codeRanges.items():
+                if any(frame.filename == filename and first <= frame.lineno <= last
+                       for frame in trace.traceback for filename, first, last in ranges):
+                    totals[category] += trace.size
+                    break
+        return totals
+
+    def getPixmaps(self, topLevels):
+        """Lists every distinct pixmap shown by a label, plus the results pages' scaled pictures.
+           Copies of a QPixmap share their pixel data, so they are counted once by cacheKey.
+
+           Input: top-level widgets [<QWidget>]
+           Output: [{"owner", "width", "height", "depth", "bytes"}]
+        """
+        owners = []
+        for topLevel in topLevels:
+            for label in topLevel.findChildren(QLabel):
+                pixmap = label.pixmap()
+                if (pixmap is not None) and not (pixmap.isNull()):
+                    owners.append((label.objectName() or label.metaObject().className(), QPixmap(pixmap)))
+        for page in (self.mainWidget.stackedBottom.westWidget, self.mainWidget.stackedBottom.eastWidget):
+            owners.append(("ResultsLayout %d" % page.pageID, page.picPixMap))
+
+        pixmaps = []
+        seenKeys = set()
+        for owner, pixmap in owners:
+            if (pixmap.cacheKey() in seenKeys):
+                continue
+            seenKeys.add(pixmap.cacheKey())
+            pixmaps.append({"owner": owner, "width": pixmap.width(), "height": pixmap.height(),
+                            "depth": pixmap.depth(), "bytes": getPixmapBytes(pixmap)})
+        return pixmaps
+
+    def writeReports(self, report):
+        """Writes the newest report to stdout, or rewrites the report file with every report so far."""
+        if (self.reportPath == "-"):
+            print(json.dumps(report, indent=2))
+            sys.stdout.flush()
+        else:
+            with open(self.reportPath, 'w') as OUTFILE:
+                json.dump(self.reports, OUTFILE, indent=2)
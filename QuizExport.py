@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+
+# Columnar export of recorded sessions for offline analysis
+# Collects every valid save file under a directory into one uncompressed .npz archive with, per questionnaire:
+#   answers_<index>   int8 (sessions x questions), columns ordered by absID; -1 = unanswered, 0-5 = button pressed
+#   modified_<index>  int64, the save file's modification time (ns since the epoch)
+#   size_<index>      int64, the save file's size in bytes
+#   path_<index>      bytes, the save file's path relative to the exported directory
+# and, for the save files that could not be exported:
+#   invalid_path, invalid_size, invalid_modified   as path_, size_ and modified_ above
+#   catalogue         bytes, getCatalogueHash() of the questionnaires every file was checked against
+# Rows are spooled to disk in chunks while the saves are read and copied into the archive at the end, so memory
+# stays bounded however many sessions there are. With --append, files already in the archive (same path, size and
+# modification time) are not read again, and neither are files found invalid before; only new and changed ones are.
+# Once the questionnaires have changed the archive is written again from scratch instead, since an edit can make any
+# file valid or invalid. Rows of saves that are no longer in the directory are dropped, so the
+# archive always matches what a fresh export would write. Members are stored uncompressed so openExport() can
+# memory-map each one straight out of the archive: loading it is a single mapped read.
+
+import numpy as np
+import argparse
+import zipfile
+import shutil
+import struct
+import time
+import sys
+import os
+
+from QuizSessions import readSession, isSessionFile, getCatalogueHash
+
+# Bumped whenever the members or their meaning change
+exportVersion = 2
+# Sessions buffered in memory before being spooled to disk
+chunkRows = 65536
+# Bytes copied at a time from the spool into the archive
+copyBlock = 1 << 24
+fields = ["answers", "modified", "size", "path"]
+
+
+class ExportError(Exception):
+    """Raised when an archive is not one openExport() can read, or does not match the questionnaires."""
+    pass
+
+
+class SessionSpool(object):
+    """One questionnaire's rows, kept in flat files in a scratch directory until the archive is written."""
+    def __init__(self, directory, index, numQuestions):
+        self.index = index
+        self.numQuestions = numQuestions
+        self.numRows = 0
+        self.pathWidth = 1
+        self.pending = []                   # [[responses, modified, size, path <bytes>]] not yet on disk
+        self.files = {field: open(os.path.join(directory, "%s_%d" % (field, index)), 'w+b') for field in fields}
+
+    def add(self, responses, modified, size, path):
+        """Adds one session.
+
+           Input: responses ordered by absID [<int>], modification time <int ns>, size <int>, relative path <bytes>
+           Output: none
+        """
+        self.pending.append([responses, modified, size, path])
+        if (len(self.pending) >= chunkRows):
+            self.flush()
+
+    def addArrays(self, answers, modified, size, paths):
+        """Adds a block of sessions already in columnar form, e.g. copied from an earlier archive."""
+        self.flush()
+        self.writeColumns(np.asarray(answers, dtype=np.int8), np.asarray(modified, dtype=np.int64),
+                          np.asarray(size, dtype=np.int64), [bytes(path) for path in paths])
+
+    def flush(self):
+        if not (self.pending):
+            return
+        self.writeColumns(np.array([row[0] for row in self.pending], dtype=np.int8).reshape(len(self.pending), self.numQuestions),
+                          np.array([row[1] for row in self.pending], dtype=np.int64),
+                          np.array([row[2] for row in self.pending], dtype=np.int64),
+                          [row[3] for row in self.pending])
+        self.pending = []
+
+    def writeColumns(self, answers, modified, size, paths):
+        answers.tofile(self.files["answers"])
+        modified.tofile(self.files["modified"])
+        size.tofile(self.files["size"])
+        # Newline-separated; names containing a newline are never exported (see exportSessions)
+        self.files["path"].write(b"".join(path + b"\n" for path in paths))
+        self.pathWidth = max([self.pathWidth] + [len(path) for path in paths])
+        self.numRows += len(paths)
+
+    def writeMembers(self, archive):
+        """Copies the spooled columns into the archive as .npy members, without holding them in memory."""
+        self.flush()
+        for field, dtype, shape in [("answers", np.int8, (self.numRows, self.numQuestions)),
+                                    ("modified", np.int64, (self.numRows,)),
+                                    ("size", np.int64, (self.numRows,))]:
+            spool = self.files[field]
+            spool.seek(0)
+            with openMember(archive, "%s_%d" % (field, self.index), np.dtype(dtype), shape) as OUTFILE:
+                shutil.copyfileobj(spool, OUTFILE, copyBlock)
+
+        # Paths become fixed-width byte strings, padded with zeros as numpy does
+        spool = self.files["path"]
+        spool.seek(0)
+        with openMember(archive, "path_%d" % self.index, np.dtype("S%d" % self.pathWidth), (self.numRows,)) as OUTFILE:
+            lines = []
+            for line in spool:
+                lines.append(line[:-1].ljust(self.pathWidth, b"\0"))
+                if (len(lines) >= chunkRows):
+                    OUTFILE.write(b"".join(lines))
+                    lines = []
+            OUTFILE.write(b"".join(lines))
+
+    def close(self):
+        for spool in self.files.values():
+            spool.close()
+
+
+def openMember(archive, name, dtype, shape):
+    """Starts an uncompressed .npy member and writes its header; the caller writes the raw data.
+
+       Input: archive <zipfile.ZipFile>, member name without .npy <str>, dtype <np.dtype>, shape <tuple>
+       Output: writable member stream
+    """
+    member = archive.open(name + ".npy", 'w', force_zip64=True)
+    np.lib.format.write_array_header_2_0(member, {"descr": np.lib.format.dtype_to_descr(dtype),
+                                                  "fortran_order": False, "shape": shape})
+    return member
+
+
+def writeArray(archive, name, array):
+    """Writes a small in-memory array as an uncompressed .npy member."""
+    with openMember(archive, name, array.dtype, array.shape) as OUTFILE:
+        OUTFILE.write(array.tobytes())
+
+
+def openExport(path):
+    """Memory-maps an archive written by exportSessions() once and returns every member as a view into the mapping.
+       Nothing is read until it is used.
+
+       Input: path <str>
+       Output: {member name without .npy: read-only np.ndarray}; raises ExportError
+    """
+    members = {}
+    try:
+        with zipfile.ZipFile(path) as archive, open(path, 'rb') as INFILE:
+            for info in archive.infolist():
+                if (info.compress_type != zipfile.ZIP_STORED) or not (info.filename.endswith(".npy")):
+                    raise ExportError("%s: %s is compressed or not an array" % (path, info.filename))
+                # The member's data starts after its local header, whose name and extra field lengths may differ
+                # from those in the central directory
+                INFILE.seek(info.header_offset)
+                nameLength, extraLength = struct.unpack("<HH", INFILE.read(30)[26:30])
+                INFILE.seek(info.header_offset + 30 + nameLength + extraLength)
+                version = np.lib.format.read_magic(INFILE)
+                if (version == (1, 0)):
+                    shape, fortranOrder, dtype = np.lib.format.read_array_header_1_0(INFILE)
+                else:
+                    shape, fortranOrder, dtype = np.lib.format.read_array_header_2_0(INFILE)
+                members[info.filename[:-len(".npy")]] = (INFILE.tell(), shape, fortranOrder, dtype)
+        mapping = np.memmap(path, dtype=np.uint8, mode='r')
+    except (OSError, ValueError, zipfile.BadZipFile, struct.error) as error:
+        raise ExportError("%s: %s" % (path, error))
+
+    arrays = {}
+    for name, (offset, shape, fortranOrder, dtype) in members.items():
+        size = int(np.prod(shape)) * dtype.itemsize
+        arrays[name] = mapping[offset:offset + size].view(dtype).reshape(shape, order='F' if fortranOrder else 'C')
+    if ("version" not in arrays) or (int(arrays["version"][0]) != exportVersion):
+        raise ExportError("%s: not a version %d session export" % (path, exportVersion))
+    return arrays
+
+
+def findSaveFiles(directory):
+    """Lists every save file under a directory, subdirectories included, in a stable order.
+
+       Input: directory <str>
+       Output: [(relative path <bytes>, full path <str>, os.stat_result)]
+    """
+    found = []
+    for root, dirNames, fileNames in os.walk(directory):
+        dirNames.sort()
+        for name in sorted(fileNames):
+            if isSessionFile(name) and ("\n" not in name):
+                fullPath = os.path.join(root, name)
+                try:
+                    stat = os.stat(fullPath)
+                except OSError:
+                    continue
+                found.append((os.fsencode(os.path.relpath(fullPath, directory)), fullPath, stat))
+    return found
+
+
+def exportSessions(directory, outputPath, questionnaires, append=False):
+    """Writes (or, with append, brings up to date) a columnar archive of every valid save file under a directory.
+       The archive is built under a temporary name and renamed over outputPath once complete. With append, only
+       files that are new or changed since the archive was written are read: unchanged sessions are copied over,
+       unchanged files found invalid before are skipped, and the rows of saves that have been deleted are dropped.
+       An archive written against other questionnaires is not appended to but replaced, as by a fresh export.
+
+       Input: directory <str>, output path <str>, questionnaires <questionnairesArray>, append <bool>
+       Output: {"added", "updated", "kept", "removed"} session counts and the number of "invalid" files <int>;
+               raises ExportError
+    """
+    numQuestions = [len(questionnaires.getQuestions(index)) for index in range(0, questionnaires.getSize())]
+    catalogueHash = getCatalogueHash(questionnaires).encode("ascii")
+    old = {}
+    if (append) and (os.path.exists(outputPath)):
+        old = openExport(outputPath)
+        # Whether a file is valid, and its columns, depend on the questionnaires: after an edit every file is read again
+        if ("catalogue" not in old) or (bytes(old["catalogue"][0]) != catalogueHash):
+            old = {}
+
+    # Files already exported unchanged are skipped; a changed file's old row is dropped and the file read again,
+    # and so is the row of a file that is gone
+    exported = {}
+    for index in range(0, len(numQuestions)):
+        if ("path_%d" % index in old):
+            for row, (path, size, modified) in enumerate(zip(old["path_%d" % index], old["size_%d" % index], old["modified_%d" % index])):
+                exported[bytes(path)] = (int(size), int(modified), index, row)
+    knownInvalid = {}
+    if ("invalid_path" in old):
+        for path, size, modified in zip(old["invalid_path"], old["invalid_size"], old["invalid_modified"]):
+            knownInvalid[bytes(path)] = (int(size), int(modified))
+    newFiles = []
+    invalidFiles = []                       # [(relative path <bytes>, size <int>, modification time <int ns>)]
+    for relativePath, fullPath, stat in findSaveFiles(directory):
+        previous = exported.pop(relativePath, None)
+        if (previous is not None) and (previous[:2] == (stat.st_size, stat.st_mtime_ns)):
+            continue
+        if (knownInvalid.get(relativePath) == (stat.st_size, stat.st_mtime_ns)):
+            invalidFiles.append((relativePath, stat.st_size, stat.st_mtime_ns))
+            continue
+        newFiles.append((relativePath, fullPath, stat, previous))
+    counts = {"added": 0, "updated": 0, "kept": 0, "removed": len(exported), "invalid": 0}
+    dropRows = {}
+    for size, modified, index, row in exported.values():
+        dropRows.setdefault(index, []).append(row)
+    for relativePath, fullPath, stat, previous in newFiles:
+        if (previous is not None):
+            dropRows.setdefault(previous[2], []).append(previous[3])
+
+    scratch = outputPath + ".%d.spool" % os.getpid()
+    temporaryPath = outputPath + ".%d.tmp" % os.getpid()
+    os.makedirs(scratch)
+    spools = [SessionSpool(scratch, index, count) for index, count in enumerate(numQuestions)]
+    try:
+        # Earlier sessions first, in their original order, copied a chunk at a time
+        for spool in spools:
+            if ("answers_%d" % spool.index not in old):
+                continue
+            keep = np.ones(old["answers_%d" % spool.index].shape[0], dtype=bool)
+            keep[dropRows.get(spool.index, [])] = False
+            for start in range(0, len(keep), chunkRows):
+                rows = keep[start:start + chunkRows]
+                spool.addArrays(*[old["%s_%d" % (field, spool.index)][start:start + chunkRows][rows] for field in fields])
+            counts["kept"] += int(keep.sum())
+
+        for relativePath, fullPath, stat, previous in newFiles:
+            session = readSession(fullPath, questionnaires)
+            if (session is None):
+                invalidFiles.append((relativePath, stat.st_size, stat.st_mtime_ns))
+                continue
+            spools[session[0]].add(session[1], stat.st_mtime_ns, stat.st_size, relativePath)
+            counts["added" if (previous is None) else "updated"] += 1
+        counts["invalid"] = len(invalidFiles)
+
+        with zipfile.ZipFile(temporaryPath, 'w', zipfile.ZIP_STORED, allowZip64=True) as archive:
+            writeArray(archive, "version", np.array([exportVersion], dtype=np.int32))
+            for spool in spools:
+                spool.writeMembers(archive)
+            writeArray(archive, "catalogue", np.array([catalogueHash]))
+            pathWidth = max([1] + [len(path) for path, size, modified in invalidFiles])
+            writeArray(archive, "invalid_path", np.array([path for path, size, modified in invalidFiles], dtype="S%d" % pathWidth))
+            writeArray(archive, "invalid_size", np.array([size for path, size, modified in invalidFiles], dtype=np.int64))
+            writeArray(archive, "invalid_modified", np.array([modified for path, size, modified in invalidFiles], dtype=np.int64))
+        # The old archive's memory maps must go before it is replaced (Windows will not rename over a mapped file)
+        old = None
+        os.replace(temporaryPath, outputPath)
+    finally:
+        for spool in spools:
+            spool.close()
+        shutil.rmtree(scratch, ignore_errors=True)
+        if (os.path.exists(temporaryPath)):
+            os.remove(temporaryPath)
+    return counts
+
+
+def printSummary(arrays, questionnaires):
+    for index, shortTitle in enumerate(questionnaires.getAllShortTitles()):
+        answers = arrays.get("answers_%d" % index)
+        if (answers is None) or (answers.shape[0] == 0):
+            continue
+        modified = arrays["modified_%d" % index]
+        complete = int((answers >= 0).all(axis=1).sum())
+        print("[%d] %s: %d sessions (%d complete), saved %s to %s"
+              % (index, shortTitle, answers.shape[0], complete,
+                 time.strftime("%Y-%m-%d", time.localtime(modified.min() / 1e9)),
+                 time.strftime("%Y-%m-%d", time.localtime(modified.max() / 1e9))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export recorded sessions to a columnar .npz archive for analysis.")
+    commands = parser.add_subparsers(dest="command")
+    export = commands.add_parser("export", help="collect every valid save file under a directory into an archive")
+    export.add_argument("directory", help="directory of save files (.txt, .txt.gz, .txt.xz); subdirectories are included")
+    export.add_argument("archive", help=".npz archive to write")
+    export.add_argument("--append", action="store_true", help="keep the sessions already in the archive and read only new or changed "
+                        "files; files found invalid before are skipped while unchanged, and sessions whose save was deleted are dropped. "
+                        "After the questionnaires change the archive is written again in full")
+    info = commands.add_parser("info", help="summarize an archive")
+    info.add_argument("archive", help=".npz archive to read")
+    args = parser.parse_args(argv)
+
+    from QuizCatalogue import questionnairesArray
+    questionnaires = questionnairesArray()
+    try:
+        if (args.command == "export"):
+            counts = exportSessions(args.directory, args.archive, questionnaires, args.append)
+            print("%s: %d sessions added, %d updated, %d kept, %d removed, %d invalid files skipped"
+                  % (args.archive, counts["added"], counts["updated"], counts["kept"], counts["removed"], counts["invalid"]))
+        elif (args.command == "info"):
+            printSummary(openExport(args.archive), questionnaires)
+        else:
+            parser.print_help()
+            return 1
+    except (OSError, ExportError) as error:
+        print("Error: %s" % error)
+        return 1
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,2445 @@
+#!/usr/bin/env python3
+
+# East Coast vs West Coast Quiz Using PyQt
+# Max Messenger Bouricius
+# June 2017
+# Quiz that determines whether a user would would be more suited to live on the East Coast or the West Coast based 
+# on their responses to a number of personality questions.
+# Tools: Python 3 and PyQt5 for GUI creation and interaction.
+#
+# The GUI; started by EastWestQuiz.py, which hands --headless off to QuizHeadless.py before any of this is loaded.
+
+from PyQt5.QtGui import *
+from PyQt5.QtWidgets import *
+from PyQt5.QtCore import *
+from random import shuffle
+from types import ModuleType
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from QuizCatalogue import questionnairesArray, diffQuestions, checkQuestionnaires, CatalogueError
+from QuizScoring import tallyResponses, getVerdict, getDecidedVerdict
+from QuizSessions import loadSession, writeSession, isSessionFile, getCompression, getQuestionnaireHash, getCatalogueHash, forgetQuestionnaireHashes, SessionError
+from QuizSessionIndex import SessionIndex, summarizeSession, getLeaning, recordSession
+from QuizSearch import openSearchIndex
+from QuizPack import QuizPack, PackedQuestionnaires, PackError
+from QuizImageCache import ImageCache
+import QuizCatalogue
+import argparse
+import time
+import sys
+import os
+
+# Application-wide theme, parsed once and applied at the App level. Widgets opt in to a variant by object name:
+#   framedDialog:   frameless dialogs (about box, confirmations, questionnaire picker, popups)
+#   questionGroup:  frame painted around each question
+#   framedPicture:  bordered pictures (results pages, about box headshot)
+appStyleSheet = """
+    QDialog#framedDialog{
+        border: 1px solid gray;
+        border-radius: 5px;
+        }
+    QWidget#questionGroup{
+        border: 1px solid gray;
+        border-radius: 4px;
+        background-color: rgb(70, 70, 70);
+        }
+    QLabel#framedPicture{
+        border: 2px solid gray;
+        border-radius: 5px;
+        }
+    """
+
+# Images and icons are named relative to this directory, wherever the app was started from
+appDirectory = os.path.dirname(os.path.abspath(__file__))
+# Pack the questionnaires and images are read from (see QuizPack and --pack), or None for the built-in catalogue and loose files
+assetPack = None
+# Pre-scaled pictures (see QuizImageCache); created on first use
+imageCacheDirectory = os.path.join(appDirectory, "imageCache")
+imageCache = None
+
+def useAssetPack(pack):
+    """Makes every later loadQuestionnaires()/loadPixmap()/loadIcon() read from the given QuizPack (None for loose files)."""
+    global assetPack, imageCache
+    assetPack = pack
+    imageCache = None
+
+def loadQuestionnaires():
+    """Returns the questionnaire catalogue: the open pack's, or the built-in one.
+
+       Input: none
+       Output: questionnairesArray or QuizPack.PackedQuestionnaires
+    """
+    if (assetPack is not None):
+        return PackedQuestionnaires(assetPack)
+    return questionnairesArray()
+
+def getQuestionnaireSources():
+    """Returns the files the questionnaires are defined in: the open pack, or QuizCatalogue.py.
+
+       Input: none
+       Output: paths [<str>]
+    """
+    if (assetPack is not None):
+        return [assetPack.path]
+    return [os.path.abspath(QuizCatalogue.__file__)]
+
+def reloadQuestionnaires():
+    """Reads the questionnaire definitions again from their source files, after they have been edited. Nothing
+       module-wide changes: the caller decides whether to switch to the result (see MainWidget.applyQuestionnaires).
+       QuizCatalogue.py is compiled straight from its source rather than re-imported, since its cached bytecode
+       goes by modification time in whole seconds and file size, which a quick edit such as flipping a pole keeps.
+
+       Input: none
+       Output: (questionnairesArray or QuizPack.PackedQuestionnaires, the newly opened QuizPack it reads from or None);
+               raises whatever reading the definitions raises
+    """
+    if (assetPack is not None):
+        pack = QuizPack(assetPack.path)
+        return PackedQuestionnaires(pack), pack
+    path = getQuestionnaireSources()[0]
+    with open(path, 'r', encoding="utf-8") as INFILE:
+        source = INFILE.read()
+    module = ModuleType("QuizCatalogue")
+    module.__file__ = path
+    exec(compile(source, path, "exec"), module.__dict__)
+    return module.questionnairesArray(), None
+
+def loadPixmap(name):
+    """Loads an image by name (e.g. "img/WestCoastEDIT.jpg"), from the open pack if it has it, else from appDirectory.
+       Unknown names give a null pixmap, as QPixmap(path) does.
+
+       Input: image name <str>
+       Output: QPixmap
+    """
+    pixmap = QPixmap()
+    if (assetPack is not None) and (assetPack.hasAsset(name)):
+        pixmap.loadFromData(assetPack.getAsset(name))
+    else:
+        pixmap.load(os.path.join(appDirectory, name))
+    return pixmap
+
+def loadScaledPixmap(name, scale):
+    """Loads an image at a fraction of its original size from the image cache, in the variant for this display's
+       device pixel ratio; the variant is made (and cached) on first use.
+
+       Input: image name <str>, scale <float>
+       Output: QPixmap
+    """
+    global imageCache
+    if (imageCache is None):
+        imageCache = ImageCache(imageCacheDirectory, appDirectory, assetPack)
+    return imageCache.getPixmap(name, scale, qApp.devicePixelRatio())
+
+def loadIcon(name):
+    """Loads an icon by name; see loadPixmap."""
+    return QIcon(loadPixmap(name))
+
+def execTransient(dialog):
+    """Runs a modal dialog, then schedules it (and every widget it owns) for deletion once control returns to the event loop.
+
+       Input: dialog <QDialog>
+       Output: result of dialog.exec_() <int>
+    """
+    result = dialog.exec_()
+    dialog.deleteLater()
+    return result
+
+class App(QApplication):
+    """Main application.
+
+       Input: command line arguments left over for Qt <list>, memory profiler <QuizDiagnostics.MemoryProfiler> or None,
+              questionnaire to start on <int> or None to ask with the questionnaire box
+       Output: none
+    """
+    def __init__(self, argv, memoryProfiler=None, startQuestionnaire=None):
+        # Initialize parent widget, set app name, create main window, show main window
+        QApplication.__init__(self, argv)
+        self.setApplicationName("East Coast vs. West Coast Quiz")
+        # Apply theme before any widget exists, so each is polished once
+        self.setStyleSheet(appStyleSheet)
+        self.mainWindow = MainWindow(memoryProfiler, startQuestionnaire)
+        self.setWindowIcon(loadIcon("mainIcon.jpeg"))
+        self.mainWindow.show()
+
+class MainWindow(QMainWindow):
+    """Main window for application; contains main widget."""
+    # Size of the author's headshot in the about box; 1 = no scaling
+    authorPicScale = 0.5
+
+    def __init__(self, memoryProfiler=None, startQuestionnaire=None):
+        # Initialize parent widget, initialize window title, create main widget object, set main widget as central widget of main window
+        QMainWindow.__init__(self)
+        self.setWindowTitle("Quiz App")
+        self.mainWidget = MainWidget(memoryProfiler, startQuestionnaire)
+        self.setCentralWidget(self.mainWidget)
+
+        # Author text label to be shown in status bar
+        self.testWidget2 = QLabel(" Max Messenger Bouricius 2017 ", alignment = Qt.AlignRight)
+
+        # Initialize progress bar, also in status bar
+        self.progressBar = QProgressBar()
+        self.progressBar.setMinimum(0)
+        self.progressString = '%v/%m questions answered (%p%)'
+        self.progressBar.setFormat(self.progressString)
+        self.progressBar.setTextVisible(True)
+        self.progressBar.setFixedHeight(15)
+
+        # Progress bar value/maximum follow the answer model's counts, at most one update per event-loop turn
+        self.progressAggregator = ProgressAggregator(self.progressBar, self.mainWidget.answerModel, self)
+
+        # Initialize menu bar and associated menus
+        self.menuBar = QMenuBar(self)
+        self.toolBar = QToolBar(self)
+
+        self.fileMenu = QMenu("&File")
+        self.optionsMenu = QMenu("&Options")
+        self.helpMenu = QMenu("&Help")
+
+        # Initialize actions for menus: exit, save progress, load progress, open questionnaire, about page, reset quiz
+        self.exitAction = QAction(self)
+        self.exitAction.setIcon(loadIcon("application-exit.png"))
+        self.exitAction.setText("&Exit")
+        self.exitAction.setShortcut('Ctrl+Q')
+
+        self.saveAction = QAction(self)
+        self.saveAction.setIcon(loadIcon("document-save.png"))
+        self.saveAction.setText("&Save Progress...")
+        self.saveAction.setShortcut('Ctrl+S')
+
+        self.loadAction = QAction(self)
+        self.loadAction.setIcon(loadIcon("document-open.png"))
+        self.loadAction.setText("&Open Session...")
+        self.loadAction.setShortcut('Ctrl+O')
+
+        self.openQuizAction = QAction(self)
+        self.openQuizAction.setIcon(loadIcon("document-import.png"))
+        self.openQuizAction.setText("&Load Questionnaire...")
+        self.openQuizAction.setShortcut('Ctrl+L')
+
+        self.aboutAction = QAction(self)
+        self.aboutAction.setIcon(loadIcon("help-about.png"))
+        self.aboutAction.setText("&About")
+        self.aboutAction.setShortcut('F1')
+
+        self.resetAction = QAction(self)
+        self.resetAction.setIcon(loadIcon("view-refresh.png"))
+        self.resetAction.setText("&Restart")
+        self.resetAction.setShortcut('Ctrl+R')
+
+        self.earlyDecisionAction = QAction(self)
+        self.earlyDecisionAction.setText("&Early Decision")
+        self.earlyDecisionAction.setCheckable(True)
+        self.earlyDecisionAction.setStatusTip("Offer to submit as soon as the remaining questions can no longer change the result")
+
+        # Populate menubar with menus + actions
+        self.fileMenu.addAction(self.loadAction)
+        self.fileMenu.addAction(self.saveAction)
+        self.fileMenu.addSeparator()
+        self.fileMenu.addAction(self.openQuizAction)
+        self.fileMenu.addSeparator()
+        self.fileMenu.addAction(self.resetAction)
+        self.fileMenu.addSeparator()
+        self.fileMenu.addAction(self.exitAction)
+
+        self.optionsMenu.addAction(self.earlyDecisionAction)
+
+        self.helpMenu.addAction(self.aboutAction)
+
+        self.menuBar.addMenu(self.fileMenu)
+        self.menuBar.addMenu(self.optionsMenu)
+        self.menuBar.addMenu(self.helpMenu)
+
+        # Populate toolbar with actions
+        self.toolBar.addAction(self.loadAction)
+        self.toolBar.addAction(self.saveAction)
+        self.toolBar.addSeparator()
+        self.toolBar.addAction(self.openQuizAction)
+        self.toolBar.addSeparator()
+        self.toolBar.addAction(self.resetAction)
+
+        # Add menu bar and toolbar to main window
+        self.setMenuBar(self.menuBar)
+        self.addToolBar(self.toolBar)
+
+        # Connect mainWidget slots to various signals
+        self.mainWidget.stackedBottom.widget(0).submitButton.clicked.connect(self.mainWidget.tallyResults)
+        self.mainWidget.stackedBottom.widget(1).buttonExit.clicked.connect(self.close)
+        self.mainWidget.stackedBottom.widget(2).buttonExit.clicked.connect(self.close)
+        self.exitAction.triggered.connect(self.close)
+        self.aboutAction.triggered.connect(self.openAboutBox)
+        self.saveAction.triggered.connect(self.mainWidget.saveProgress)
+        self.loadAction.triggered.connect(self.mainWidget.loadProgress)
+        self.resetAction.triggered.connect(self.askReset)
+        self.earlyDecisionAction.toggled.connect(self.mainWidget.setEarlyDecision)
+        self.openQuizAction.triggered.connect(self.mainWidget.loadQuestionnaireBox)
+
+        # Add progress bar and name to status bar
+        self.statusBar().insertPermanentWidget(0, self.progressBar, stretch = 10)
+        self.statusBar().insertPermanentWidget(1, self.testWidget2, stretch = 0)
+
+    def askExit(self):
+        """Prompts the user with a confirmation dialog when they take action to exit the application.
+
+            Input: none
+            Output: whether or not to exit <int bool>
+        """
+        # Open dialog box
+        response = execTransient(ExitDialog(self))
+        if (response == QDialog.Accepted):
+            return 1
+        else:
+            return 0
+
+    def askReset(self):
+        """Prompts the user with a confirmation dialog when they take action to restart their quiz.
+
+            Input: none
+            Output: none
+        """
+        # If the user has answered at least one question, ask them to confirm their choice
+        if (self.mainWidget.answerModel.answeredCount() != 0):
+            response = execTransient(ResetDialog(self))
+            # If they confirm, reset
+            if (response == QDialog.Accepted):
+                self.mainWidget.resetQuestionButtons()
+            # Else, do nothing and resume quiz
+            else:
+                return 0
+        # If no questions have been answered, create popup box telling user there is nothing to reset
+        else:
+            self.mainWidget.popupBox("Nothing to reset; no questions have been answered yet.")
+
+    def closeEvent(self, event):
+        """Override the default close event actions. In this
+           case, open a quit dialog instead of directly closing.
+
+           Input:  event <QCloseEvent>
+           Output: None
+        """
+        response = self.askExit()
+        if (response == 0):
+            event.ignore()
+        else:
+            # Let any save still being written finish before the application goes away
+            self.mainWidget.waitForSaves()
+            QMainWindow.closeEvent(self, event)
+
+    def openAboutBox(self):
+        """Creates and displays an 'About' box with program and author information."""
+        # Main initializations
+        self.aboutBox = QDialog(self, Qt.SplashScreen)
+        self.aboutBox.setWindowTitle("About")
+        self.mainLayout = QVBoxLayout()
+        self.marginLayout = QHBoxLayout()
+        self.fullWidget = QWidget()
+
+        # Initialize widgets/layouts for mainLayout
+        self.titleLayout1 = QHBoxLayout()
+        self.titleLayout2 = QVBoxLayout()
+        self.titleLabel = QLabel("Quiz App")
+        self.subtitleLabel = QLabel("Max Messenger Bouricius 2017")
+
+        # Initialize help icon picture + size
+        self.helpIconPic = loadPixmap("help-about.png")
+        self.helpIconPicLabel = QLabel()
+        self.iconScale = 1
+        self.iconSize = QSize()
+        self.iconSize.setWidth(int(self.helpIconPic.width() * self.iconScale))
+        self.iconSize.setHeight(int(self.helpIconPic.height() * self.iconScale))
+        self.helpIconPic = self.helpIconPic.scaled(self.iconSize)
+        self.helpIconPicLabel.setPixmap(self.helpIconPic)
+        self.hFrame1 = QFrame()
+
+        # Initialize "About the App" section
+        self.aboutAppTitle = QLabel("        About the App")
+        self.aboutAppLabel = QLabel("       Simple program that loads various questionnaires, asking users some questions about themselves to determine their personal results (e.g. whether they are an East Coast person or a West Coast person, a dog person or a cat person, etc). Some basic research on these topics has allowed these quizzes to be at least somewhat accurate, especially given that my only resources were my (very limited) personal anecdotes and the opinions of strangers on the internet. Tools used were Python 3 and PyQt 5.")
+        self.aboutAppLabel.setWordWrap(True)
+        self.hFrame2 = QFrame()
+
+        # Initialize "About the Author" section
+        self.aboutAuthorTitle = QLabel("        About the Author")
+        self.authorLayout = QHBoxLayout()
+
+        # Initialize headshot picture + size
+        self.aboutAuthorPic = loadScaledPixmap("img/authorPhoto.jpg", self.authorPicScale)
+        self.aboutAuthorPicLabel = QLabel()
+        self.aboutAuthorPicLabel.setPixmap(self.aboutAuthorPic)
+        self.aboutAuthorPicLabel.setObjectName("framedPicture")
+
+        self.aboutAuthorLabel = QLabel("    My last name is pronounced 'Messenger Bur-REE-shis', for all those who were wondering. I am a student, computer geek, and musician at heart; when I am not sitting behind a computer or drowning in schoolwork, I am composing music for a local video game company or arranging songs for my a cappella group and for a cappella groups across the front range. Find me on Github (github.com/gerlacus) and Soundcloud (soundcloud.com/gerlacus).")
+        self.aboutAuthorLabel.setWordWrap(True)
+
+        self.okButton = QPushButton("OK")
+
+        self.authorLayout.addSpacing(8)
+        self.authorLayout.addWidget(self.aboutAuthorPicLabel)
+        self.authorLayout.addSpacing(12)
+        self.authorLayout.addWidget(self.aboutAuthorLabel)
+
+        # Initialize fonts
+        self.mainTitleFont = QFont()
+        self.mainTitleFont.setPixelSize(36)
+        self.mainTitleFont.setBold(True)
+
+        self.subtitleFont = QFont()
+        self.subtitleFont.setPixelSize(24)
+        self.subtitleFont.setItalic(True)
+
+        self.secondaryTitleFont = QFont()
+        self.secondaryTitleFont.setPixelSize(12)
+        self.secondaryTitleFont.setBold(True)
+
+        # Set fonts accordingly
+        self.titleLabel.setFont(self.mainTitleFont)
+        self.subtitleLabel.setFont(self.subtitleFont)
+        self.aboutAppTitle.setFont(self.secondaryTitleFont)
+        self.aboutAuthorTitle.setFont(self.secondaryTitleFont)
+
+        # Set frame styles
+        self.hFrame1.setFrameStyle(QFrame.HLine)
+        self.hFrame2.setFrameStyle(QFrame.HLine)
+
+        self.hFrame1.setFrameShadow(QFrame.Sunken)
+        self.hFrame2.setFrameShadow(QFrame.Sunken)
+
+        # Populate layouts
+        self.titleLayout2.addWidget(self.titleLabel, alignment = Qt.AlignLeft)
+        self.titleLayout2.addWidget(self.subtitleLabel, alignment = Qt.AlignLeft)
+        self.titleLayout1.addStretch(20)
+        self.titleLayout1.addWidget(self.helpIconPicLabel)
+        self.titleLayout1.addSpacing(20)
+        self.titleLayout1.addLayout(self.titleLayout2)
+        self.titleLayout1.addSpacing(40)
+
+        self.mainLayout.addSpacing(4)
+        self.mainLayout.addLayout(self.titleLayout1)
+        self.mainLayout.addSpacing(8)
+        self.mainLayout.addWidget(self.hFrame1)
+        self.mainLayout.addSpacing(4)
+        self.mainLayout.addWidget(self.aboutAppTitle)
+        self.mainLayout.addWidget(self.aboutAppLabel)
+        self.mainLayout.addSpacing(6)
+        self.mainLayout.addWidget(self.hFrame2)
+        self.mainLayout.addWidget(self.aboutAuthorTitle)
+        self.mainLayout.addSpacing(4)
+        self.mainLayout.addLayout(self.authorLayout)
+        self.mainLayout.addSpacing(0)
+        self.mainLayout.addWidget(self.okButton, alignment = Qt.AlignRight)
+
+        self.marginLayout.addSpacing(20)
+        self.marginLayout.addLayout(self.mainLayout)
+        self.marginLayout.addSpacing(20)
+
+        # Set fixed size for whole dialog box
+        self.sizeFixed = QSize()
+        self.sizeFixed.setWidth(590)
+        self.sizeFixed.setHeight(470)
+        self.aboutBox.setFixedSize(self.sizeFixed)
+        self.aboutBox.setLayout(self.marginLayout)
+
+        # Apply themed frame to entire dialog
+        self.aboutBox.setObjectName("framedDialog")
+
+        # Connect "OK" button to "accept"
+        self.okButton.clicked.connect(self.aboutBox.accept)
+
+        # Display about box; it is rebuilt on every open, so free this one afterwards
+        execTransient(self.aboutBox)
+        self.aboutBox = None
+
+class ResetDialog(QDialog):
+    """Creates and displays a 'Reset?' dialog prompting user to confirm that they want to reset the quiz."""
+    def __init__(self, parent=None):
+        # Parent initialization
+        QDialog.__init__(self, parent, Qt.SplashScreen)
+
+        # Initialize layouts + widgets
+        self.mainLayout = QVBoxLayout(self)
+        self.secondaryLayout = QHBoxLayout()
+
+        self.titleText = QLabel("Are you sure you want to restart?")
+        self.dialogText = QLabel("Any unsaved progress will be lost.")
+
+        self.cancelButton = QPushButton("Cancel")
+        self.quitButton = QPushButton("Restart")
+
+        # Connect buttons
+        self.cancelButton.clicked.connect(self.reject)
+        self.quitButton.clicked.connect(self.accept)
+
+        # Initialize hLine frame
+        self.hLine = QFrame()
+        self.hLine.setFrameShape(QFrame.HLine)
+        self.hLine.setFrameShadow(QFrame.Sunken)
+        
+        # Add title font, apply font to title label
+        self.titleFont = QFont()
+        self.titleFont.setBold(True)
+        self.titleText.setFont(self.titleFont)
+
+        # Populate layouts
+        self.secondaryLayout.addWidget(self.cancelButton)
+        self.secondaryLayout.addWidget(self.quitButton)
+        
+        self.mainLayout.addWidget(self.titleText, alignment = Qt.AlignCenter)
+        self.mainLayout.addWidget(self.hLine)
+        self.mainLayout.addWidget(self.dialogText, alignment = Qt.AlignCenter)
+        self.mainLayout.addSpacing(4)
+        self.mainLayout.addLayout(self.secondaryLayout)
+
+        # Customize appearance
+        self.setFixedSize(self.sizeHint())
+        self.setFixedWidth(275)
+        self.setObjectName("framedDialog")
+
+class ExitDialog(QDialog):
+    """Creates and displays an 'Exit?' dialog prompting user to confirm that they want to exit the quiz."""
+    def __init__(self, parent=None):
+        # Parent initialization
+        QDialog.__init__(self, parent, Qt.SplashScreen)
+
+        # Initialize layouts + widgets
+        self.mainLayout = QVBoxLayout(self)
+        self.secondaryLayout = QHBoxLayout()
+
+        self.titleText = QLabel("Are you sure you want to quit?")
+        self.dialogText = QLabel("Any unsaved progress will be lost.")
+
+        self.cancelButton = QPushButton("Cancel")
+        self.quitButton = QPushButton("Quit")
+
+        # Connect buttons
+        self.cancelButton.clicked.connect(self.reject)
+        self.quitButton.clicked.connect(self.accept)
+
+        # Initialize hLine frame
+        self.hLine = QFrame()
+        self.hLine.setFrameShape(QFrame.HLine)
+        self.hLine.setFrameShadow(QFrame.Sunken)
+        
+        # Add title font, apply font to title label
+        self.titleFont = QFont()
+        self.titleFont.setBold(True)
+        self.titleText.setFont(self.titleFont)
+
+        # Populate layouts
+        self.secondaryLayout.addWidget(self.cancelButton)
+        self.secondaryLayout.addWidget(self.quitButton)
+        
+        self.mainLayout.addWidget(self.titleText, alignment = Qt.AlignCenter)
+        self.mainLayout.addWidget(self.hLine)
+        self.mainLayout.addWidget(self.dialogText, alignment = Qt.AlignCenter)
+        self.mainLayout.addSpacing(4)
+        self.mainLayout.addLayout(self.secondaryLayout)
+
+        # Customize appearance
+        self.setFixedSize(self.sizeHint())
+        self.setFixedWidth(275)
+        self.setObjectName("framedDialog")
+
+class EarlyDecisionDialog(QDialog):
+    """Creates and displays a dialog offering to submit early once the remaining questions can no longer change the result."""
+    def __init__(self, numRemaining, parent=None):
+        # Parent initialization
+        QDialog.__init__(self, parent, Qt.SplashScreen)
+
+        # Initialize layouts + widgets
+        self.mainLayout = QVBoxLayout(self)
+        self.secondaryLayout = QHBoxLayout()
+
+        self.titleText = QLabel("Your result has been decided!")
+        self.dialogText = QLabel("The remaining " + str(numRemaining) + " question(s) can no longer change it.")
+
+        self.cancelButton = QPushButton("Keep Going")
+        self.submitButton = QPushButton("Submit Now")
+
+        # Connect buttons
+        self.cancelButton.clicked.connect(self.reject)
+        self.submitButton.clicked.connect(self.accept)
+
+        # Initialize hLine frame
+        self.hLine = QFrame()
+        self.hLine.setFrameShape(QFrame.HLine)
+        self.hLine.setFrameShadow(QFrame.Sunken)
+
+        # Add title font, apply font to title label
+        self.titleFont = QFont()
+        self.titleFont.setBold(True)
+        self.titleText.setFont(self.titleFont)
+
+        # Populate layouts
+        self.secondaryLayout.addWidget(self.cancelButton)
+        self.secondaryLayout.addWidget(self.submitButton)
+
+        self.mainLayout.addWidget(self.titleText, alignment = Qt.AlignCenter)
+        self.mainLayout.addWidget(self.hLine)
+        self.mainLayout.addWidget(self.dialogText, alignment = Qt.AlignCenter)
+        self.mainLayout.addSpacing(4)
+        self.mainLayout.addLayout(self.secondaryLayout)
+
+        # Customize appearance
+        self.setFixedSize(self.sizeHint())
+        self.setObjectName("framedDialog")
+
+class PopupDialog(QDialog):
+    """Popup box with a message and an "OK" button; built once by MainWidget and reused for every message."""
+    def __init__(self, parent=None):
+        # Parent initialization
+        QDialog.__init__(self, parent, Qt.SplashScreen)
+
+        # Initialize widgets + layouts
+        self.mainLayout = QVBoxLayout(self)
+        self.mainText = QLabel()
+        self.OKButton = QPushButton("OK")
+        self.OKButton.clicked.connect(self.accept)
+
+        # Populate layouts
+        self.mainLayout.addWidget(self.mainText, alignment = Qt.AlignCenter)
+        self.mainLayout.addWidget(self.OKButton, alignment = Qt.AlignCenter)
+
+        # Customize dialog box appearance (themed frame)
+        self.setObjectName("framedDialog")
+
+    def showMessage(self, text):
+        """Shows the dialog with the given message and waits for "OK".
+
+           Input: text to be displayed <str>
+           Output: none
+        """
+        self.mainText.setText(text)
+        self.adjustSize()
+        self.exec_()
+
+class AnswerModel(QObject):
+    """Single owner of the answers to the loaded questionnaire, one entry per question in display order (-1 = unanswered, 0-5 = choice).
+       RadioButtons read their selection from here when painting; bulk operations emit one coarse notification instead of one per question.
+    """
+    # Signal: one answer changed; carries row, new answer, previous answer
+    signalAnswerChanged = pyqtSignal(int, int, int)
+    # Signal: every answer may have changed (reset or load)
+    signalModelReset = pyqtSignal()
+
+    def __init__(self, parent=None):
+        # Initialize parent object
+        QObject.__init__(self, parent)
+        self.answers = []
+        # Number of answers != -1, kept current so progress never needs a full count
+        self.numAnswered = 0
+
+    def rowCount(self):
+        """Returns the number of questions."""
+        return len(self.answers)
+
+    def answeredCount(self):
+        """Returns the number of questions that have been answered."""
+        return self.numAnswered
+
+    def getAnswer(self, row):
+        """Returns the answer for a question.
+
+           Input: row <int>
+           Output: answer <int> in range 0-5 (or -1, if unanswered)
+        """
+        return self.answers[row]
+
+    def getAnswers(self):
+        """Returns a copy of all answers in display order."""
+        return list(self.answers)
+
+    def setAnswer(self, row, answer):
+        """Sets a single answer and notifies listeners if it changed.
+
+           Input: row <int>, answer <int> in range -1 to 5
+           Output: none
+        """
+        previous = self.answers[row]
+        if (answer == previous):
+            return
+        self.answers[row] = answer
+        self.numAnswered += (answer != -1) - (previous != -1)
+        self.signalAnswerChanged.emit(row, answer, previous)
+
+    def reset(self):
+        """Marks every question as unanswered with a single notification."""
+        self.answers = [-1] * len(self.answers)
+        self.numAnswered = 0
+        self.signalModelReset.emit()
+
+    def load(self, vector):
+        """Replaces all answers (and possibly the number of questions) with a single notification.
+
+           Input: answers in display order [<int>]
+           Output: none
+        """
+        self.answers = [int(answer) for answer in vector]
+        self.numAnswered = sum(1 for answer in self.answers if answer != -1)
+        self.signalModelReset.emit()
+
+class ProgressAggregator(QObject):
+    """Keeps a progress bar in step with an answer model. Any number of answer changes, resets and loads within one
+       event-loop turn are coalesced into a single update, which reads answered/total straight from the model.
+    """
+    def __init__(self, progressBar, answerModel, parent=None):
+        # Initialize parent object
+        QObject.__init__(self, parent)
+        self.progressBar = progressBar
+        self.answerModel = answerModel
+        # True while an update is scheduled but has not run yet
+        self.isPending = False
+
+        self.answerModel.signalAnswerChanged.connect(self.scheduleUpdate)
+        self.answerModel.signalModelReset.connect(self.scheduleUpdate)
+
+        # Initial sync, so the bar is right before the first event-loop turn
+        self.flush()
+
+    def scheduleUpdate(self, *args):
+        """Marks the progress bar stale and schedules one update for the next event-loop turn, if not already scheduled."""
+        if not (self.isPending):
+            self.isPending = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """Sets the progress bar from the model's authoritative counts."""
+        self.isPending = False
+        self.progressBar.setMaximum(self.answerModel.rowCount())
+        self.progressBar.setValue(self.answerModel.answeredCount())
+
+class RadioButtons(QWidget):
+    """Container class for each question. Includes question number, question name, 6 radio buttons, and 'Agree ... Disagree' text.
+       Everything is painted by the widget itself (one QObject per question) rather than built from child widgets and layouts;
+       clicks are hit-tested against the six choice circles, and the keyboard can move between/select choices.
+    """
+    # Signal: when question has been answered for the first time, and thus should trigger increment in progress
+    signalIncrementButton = pyqtSignal(object)
+    # Signal: whenever the selected answer changes, carrying the new button index (0-5)
+    signalAnswerButton = pyqtSignal(object)
+
+    # Geometry, in pixels: outer margin around the frame, padding inside it, gap between the three rows
+    outerMargin = 9
+    innerPadding = 10
+    rowSpacing = 8
+    # Extra pixels around each choice circle that still count as a hit
+    hitSlop = 6
+    # Choice circle centers as a fraction of the inner width (stretches 5, 10, 10, 10, 10, 10, 5 in the old layout)
+    choicePositions = (5 / 60, 15 / 60, 25 / 60, 35 / 60, 45 / 60, 55 / 60)
+
+    def __init__(self, eastWest, questionNum, questionText, answerModel):
+        # Initialize parent widget
+        QWidget.__init__(self)
+
+        # Whether an answer will count towards the West tally (0) or East tally (1)
+        self.isEast = eastWest
+        # Selection lives in the shared answer model, at this question's row
+        self.answerModel = answerModel
+        self.row = questionNum - 1
+        # Absolute ID of the question
+        self.absID = 0
+        # Which choice the keyboard is on (drawn with a focus rectangle while the widget has focus)
+        self.focusChoice = 0
+
+        # Question text and separate question number on side
+        self.questionText = questionText
+        self.questNum = questionNum
+        self.questNumFormat = str(questionNum) + "."
+
+        # Initialize bold font for questionNum
+        self.boldFont1 = QFont()
+        self.boldFont1.setBold(True)
+
+        # Preferred size, measured on first request
+        self.cachedSizeHint = None
+
+        # Customize appearance: frame style comes from the application theme
+        self.setObjectName("questionGroup")
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+
+    def getIndicatorSize(self):
+        """Returns the width/height of a choice circle as drawn by the current style."""
+        return self.style().pixelMetric(QStyle.PM_ExclusiveIndicatorWidth, None, self)
+
+    def getRowHeights(self):
+        """Returns heights of the three rows (question, choices, Disagree/Agree captions)."""
+        textHeight = self.fontMetrics().height()
+        return QFontMetrics(self.boldFont1).height(), max(self.getIndicatorSize(), textHeight), textHeight
+
+    def getInnerRect(self):
+        """Returns the rectangle inside the frame that holds the rows."""
+        inset = self.outerMargin + self.innerPadding
+        return self.rect().adjusted(inset, inset, -inset, -inset)
+
+    def getChoiceRects(self):
+        """Returns the six choice circles' rectangles, left (Disagree, 0) to right (Agree, 5)."""
+        inner = self.getInnerRect()
+        questionHeight, choicesHeight = self.getRowHeights()[:2]
+        size = self.getIndicatorSize()
+        top = inner.top() + questionHeight + self.rowSpacing + (choicesHeight - size) // 2
+        return [QRect(inner.left() + int(inner.width() * position) - size // 2, top, size, size) for position in self.choicePositions]
+
+    def sizeHint(self):
+        """Width fits the question number and unwrapped question text; height fits the three rows.
+           Layouts ask for this on every pass, so it is measured once and cached.
+        """
+        if (self.cachedSizeHint is None):
+            self.cachedSizeHint = self.measureSizeHint()
+        return self.cachedSizeHint
+
+    def measureSizeHint(self):
+        """Measures the preferred size from the current fonts and style (see sizeHint)."""
+        inset = 2 * (self.outerMargin + self.innerPadding)
+        numWidth = QFontMetrics(self.boldFont1).horizontalAdvance(self.questNumFormat)
+        textWidth = self.fontMetrics().horizontalAdvance(self.questionText)
+        captionsWidth = self.fontMetrics().horizontalAdvance("Disagree") + self.fontMetrics().horizontalAdvance("Agree") + 12 * self.getIndicatorSize()
+        return QSize(inset + max(numWidth + self.innerPadding + textWidth, captionsWidth), inset + sum(self.getRowHeights()) + 2 * self.rowSpacing)
+
+    def minimumSizeHint(self):
+        """Question text is never wrapped, so the preferred size is also the minimum."""
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        """Paints the themed frame, question number and text, six choice circles and Disagree/Agree captions."""
+        painter = QPainter(self)
+
+        # Frame: draw the widget primitive so the theme's #questionGroup rule applies, inset by the outer margin
+        frameOption = QStyleOption()
+        frameOption.initFrom(self)
+        frameOption.rect = self.rect().adjusted(self.outerMargin, self.outerMargin, -self.outerMargin, -self.outerMargin)
+        self.style().drawPrimitive(QStyle.PE_Widget, frameOption, painter, self)
+
+        inner = self.getInnerRect()
+        questionHeight, choicesHeight, captionHeight = self.getRowHeights()
+
+        # Question row: bold number on the left, text centered in the remaining space
+        numberRect = QRect(inner.left(), inner.top(), inner.width(), questionHeight)
+        numWidth = QFontMetrics(self.boldFont1).horizontalAdvance(self.questNumFormat)
+        painter.setFont(self.boldFont1)
+        painter.drawText(numberRect, Qt.AlignLeft | Qt.AlignVCenter, self.questNumFormat)
+        painter.setFont(self.font())
+        painter.drawText(numberRect.adjusted(numWidth + self.innerPadding, 0, 0, 0), Qt.AlignHCenter | Qt.AlignVCenter, self.questionText)
+
+        # Choice circles, drawn by the style so they look like native radio buttons
+        which = self.getWhichButtonPressed()
+        for i, choiceRect in enumerate(self.getChoiceRects()):
+            choiceOption = QStyleOptionButton()
+            choiceOption.initFrom(self)
+            choiceOption.rect = choiceRect
+            choiceOption.state &= ~QStyle.State_HasFocus
+            choiceOption.state |= QStyle.State_On if (i == which) else QStyle.State_Off
+            self.style().drawPrimitive(QStyle.PE_IndicatorRadioButton, choiceOption, painter, self)
+            if (self.hasFocus()) and (i == self.focusChoice):
+                focusOption = QStyleOptionFocusRect()
+                focusOption.initFrom(self)
+                focusOption.rect = choiceRect.adjusted(-3, -3, 3, 3)
+                self.style().drawPrimitive(QStyle.PE_FrameFocusRect, focusOption, painter, self)
+
+        # Captions row, under the outermost circles
+        captionsRect = QRect(inner.left(), inner.top() + questionHeight + choicesHeight + 2 * self.rowSpacing, inner.width(), captionHeight)
+        captionsRect = captionsRect.adjusted(int(inner.width() * 2 / 28), 0, -int(inner.width() * 2 / 28), 0)
+        painter.drawText(captionsRect, Qt.AlignLeft | Qt.AlignVCenter, "Disagree")
+        painter.drawText(captionsRect, Qt.AlignRight | Qt.AlignVCenter, "Agree")
+
+    def mousePressEvent(self, event):
+        """Hit-tests a click against the six choice circles and selects the one under the cursor, if any."""
+        if (event.button() != Qt.LeftButton):
+            QWidget.mousePressEvent(self, event)
+            return
+        for i, choiceRect in enumerate(self.getChoiceRects()):
+            if choiceRect.adjusted(-self.hitSlop, -self.hitSlop, self.hitSlop, self.hitSlop).contains(event.pos()):
+                self.focusChoice = i
+                self.selectAnswer(i)
+                return
+        QWidget.mousePressEvent(self, event)
+
+    def keyPressEvent(self, event):
+        """Keyboard support: Left/Right move between choices, Space/Enter selects, 1-6 select a choice directly."""
+        key = event.key()
+        if (key == Qt.Key_Left) and (self.focusChoice > 0):
+            self.focusChoice -= 1
+            self.update()
+        elif (key == Qt.Key_Right) and (self.focusChoice < 5):
+            self.focusChoice += 1
+            self.update()
+        elif (key in (Qt.Key_Space, Qt.Key_Return, Qt.Key_Enter)):
+            self.selectAnswer(self.focusChoice)
+        elif (Qt.Key_1 <= key <= Qt.Key_6):
+            self.focusChoice = key - Qt.Key_1
+            self.selectAnswer(self.focusChoice)
+        else:
+            QWidget.keyPressEvent(self, event)
+
+    def focusInEvent(self, event):
+        """Start keyboard navigation on the selected answer, if any, and show the focus rectangle."""
+        if (self.getWhichButtonPressed() != -1):
+            self.focusChoice = self.getWhichButtonPressed()
+        self.update()
+        QWidget.focusInEvent(self, event)
+
+    def focusOutEvent(self, event):
+        """Hide the focus rectangle."""
+        self.update()
+        QWidget.focusOutEvent(self, event)
+
+    def selectAnswer(self, which):
+        """User picked a choice (mouse or keyboard): store it in the model, then notify as the radio buttons' clicked signal used to.
+           The model's change notification is what schedules the repaint.
+
+           Input: which button <int> in range 0-5
+           Output: none
+        """
+        wasAnswered = self.getWhichButtonPressed() != -1
+        self.answerModel.setAnswer(self.row, which)
+        self.shouldProgressIncrement(wasAnswered)
+        self.emitAnswer()
+
+    def signalIncrementFromRadioButtons(self):
+        """Emits signal for mainWidget to relay required info to mainWindow to increment progress bar."""
+        self.signalIncrementButton.emit()
+
+    def getCoast(self):
+        """Returns which coast the question refers to (e.g. which final result 'agreeing' to this question will promote).
+           0 = West coast, 1 = East coast.
+        """
+        return self.isEast
+
+    def setQuestion(self, eastWest, questionText):
+        """Changes the question in place, e.g. after its definition has been edited; the answer is kept.
+
+           Input: eastWest <int>, questionText <str>
+           Output: none
+        """
+        self.isEast = eastWest
+        if (questionText != self.questionText):
+            self.questionText = questionText
+            self.cachedSizeHint = None
+            self.updateGeometry()
+        self.update()
+
+    def getWhichButtonPressed(self):
+        """Returns which button, if any, is currently selected.
+
+           Input: none
+           Output: which button is pressed <int> in range 0-5 (or -1, if no button is pressed)
+        """
+        return self.answerModel.getAnswer(self.row)
+
+    def getQuestNum(self):
+        """Returns, out of all questions, which question this one is.
+        
+           Input: none
+           Output: question number <int>
+        """
+        return self.questNum
+
+    def shouldProgressIncrement(self, wasAnswered):
+        """If question had not been answered before this selection, send the signal to increment progress.
+           Otherwise, do nothing; question has already been answered and the user is merely changing their response.
+           Triggered whenever a choice is selected.
+
+           Input: whether the question was answered before the selection <bool>
+           Output: none
+        """
+        if not (wasAnswered):
+            # Increment detected; send signal to increment window
+            self.signalIncrementButton.emit(1)
+
+    def emitAnswer(self):
+        """Tells mainWidget that the selected answer changed; triggered whenever a choice is selected."""
+        self.signalAnswerButton.emit(self.getWhichButtonPressed())
+
+    def resetButtons(self):
+        """Resets all 6 buttons in the question to unchecked state by marking it 'unanswered' in the model.
+           Resetting every question at once should use AnswerModel.reset() instead.
+        """
+        self.answerModel.setAnswer(self.row, -1)
+        self.focusChoice = 0
+
+class FullBottomLayoutStack(QStackedLayout):
+    """Stacked layout at bottom of quiz. Layout indeces are as follows:
+        0: initial "submit my answers" button.
+        1: "west coast" results page, if the user's answers resulted in a "west coast" conclusion.
+        2: "east coast" results page, if the user's answers resulted in an "east coast" conclusion.
+    """
+    def __init__(self, resultsTitles, resultsTexts, resultsPics):
+        # Initialize parent widget
+        QStackedLayout.__init__(self)
+
+        # Initialize pre-results layouts
+        self.submitLayout = PreResultsLayout()
+
+        # Initialize widgets, associate each with layout
+        self.submitWidget = PreResultsLayout()
+        self.westWidget = ResultsLayout(0, resultsTitles, resultsTexts, resultsPics)
+        self.eastWidget = ResultsLayout(1, resultsTitles, resultsTexts, resultsPics)
+
+        # Add layouts to self
+        self.addWidget(self.submitWidget)
+        self.addWidget(self.westWidget)
+        self.addWidget(self.eastWidget)
+       
+        # Initialize index to "submit"
+        self.setCurrentIndex(0)
+
+    def updateInfo(self, resultsTitles, resultsTexts, resultsPics):
+        """Updates results title and description text of each results when user loads in new file.
+
+           Input: questionnaire ID <int>
+           Output: None
+        """
+        self.westWidget.updateResultsInfo(resultsTitles, resultsTexts, resultsPics)
+        self.eastWidget.updateResultsInfo(resultsTitles, resultsTexts, resultsPics)
+
+
+class TitleLayout(QWidget):
+    """Title info at top of window (quiz title and header text)."""
+    def __init__(self, title, questionnaireID):
+        # Initialize parent widget
+        QWidget.__init__(self)
+
+        # Change title text depending on which questionnaire has been loaded
+        self.questionnaireIndex = questionnaireID
+
+        # Widgets contained in QVBoxLayout
+        self.mainLayout = QVBoxLayout(self)
+
+        # Initialize titleText based on argument "title"
+        self.titleText = QLabel(title)
+        self.descriptText = QLabel("Take this quiz to find out!")
+
+        # Initialize title font, assign said font to titleText label
+        self.titleFont = QFont()
+        self.titleFont.setBold(True)
+        self.titleFont.setPixelSize(24)
+        self.titleText.setFont(self.titleFont)
+        self.titleText.setWordWrap(False)
+
+        # Initialize description font, assign said font to descriptText
+        self.descriptFont = QFont()
+        self.descriptFont.setBold(False)
+        self.descriptFont.setPixelSize(16)
+        self.descriptText.setFont(self.descriptFont)
+
+        # Add widgets to full layout
+        self.mainLayout.addWidget(self.titleText, alignment=Qt.AlignCenter)
+        self.mainLayout.addSpacing(0)
+        self.mainLayout.addWidget(self.descriptText, alignment=Qt.AlignCenter)
+
+    def updateTitle(self, quizTitle):
+        """Updates the quiz title in the event of loading a new questionnaire
+
+           Input: quizTitle []
+           Output: none
+        """
+        self.titleText.setText(quizTitle)
+
+
+class PreResultsLayout(QWidget):
+    """Layout with 'Submit' button, shown before user has completed quiz. First of three layouts in stacked bottom layout."""
+    def __init__(self):
+        # Initialize parent widget
+        QWidget.__init__(self)
+        # Based on QHBoxLayout, though could feasibly be a QVBoxLayout too
+        self.layout = QHBoxLayout()
+
+        # Initialize submit button
+        self.submitButton = QPushButton("Submit My Answers!")
+        self.submitButton.setMinimumWidth(350)
+        self.submitButton.setMinimumHeight(100)
+
+        # Initialize font for button, assign said font to button
+        self.buttonFont = QFont()
+        self.buttonFont.setPixelSize(36)
+        self.submitButton.setFont(self.buttonFont)
+
+        # Add button to layout, set primary widget's layout
+        self.layout.addStretch(10)
+        self.layout.addWidget(self.submitButton)
+        self.layout.addStretch(10)
+        self.setLayout(self.layout)
+
+class ResultsLayout(QWidget):
+    """'Results' layout, shown after user has completed quiz and obtained a result.
+        Initialized with bool pertaining to whether results are for option 0 (originally 'West coast') or option 1 (originally 'East coast').
+        Both are initialized and created upon startup, but only the relevant layout is made visible in the end.
+    """
+    # Size of scaled image; 1 = no scaling
+    picScale = 0.4
+
+    def __init__(self, pageID, resultsTitles, resultsTexts, resultsPics):
+        # Initialize parent widget
+        QWidget.__init__(self)
+        
+        # Initialize layouts + widgets
+        self.pageID = pageID
+        self.layout = QVBoxLayout()                     # Overarching layout
+        self.title = QLabel()                           # Title
+        self.primaryLayout = QHBoxLayout()              # Primary layout
+        self.descriptionText = QLabel()                 # Description label
+        self.descriptionText.setWordWrap(True)
+        self.buttonsLayout = QHBoxLayout()              # Layout for "retake" + "exit" buttons
+        self.buttonRetake = QPushButton("Retake Quiz")  # "Retake" button
+        self.buttonExit = QPushButton("Exit")           # "Exit" button
+        self.picture = QLabel()                         # Picture to accompany description
+        self.hLine1 = QFrame()
+
+        # Customize horizontal frame
+        self.hLine1.setFrameStyle(QFrame.HLine)
+        self.hLine1.setFrameShadow(QFrame.Sunken)
+
+        # Font for title (bold, 24px)
+        self.titleFont = QFont()                        
+        self.titleFont.setBold(True)
+        self.titleFont.setPixelSize(24)
+        self.title.setFont(self.titleFont)              # Assign said font to title
+
+        # Font for button labels
+        self.buttonFont = QFont()
+        self.buttonFont.setPixelSize(16)
+
+        # Set title/text to whichever questionnaire has been chosen
+        self.title.setText(resultsTitles[pageID])
+        self.descriptionText.setText(resultsTexts[pageID])
+
+        # If pageID = 0, initialize as "West coast"; else pageID = 1, so initialize as "East coast"
+        # Pictures come pre-scaled from the image cache
+        self.picPixMap = loadScaledPixmap(resultsPics[pageID], self.picScale)
+
+        # Themed picture border to match main theme of question boxes
+        self.picture.setPixmap(self.picPixMap)
+        self.picture.setScaledContents(False)
+        self.picture.setObjectName("framedPicture")
+
+        # Populate title layout
+        self.layout.addWidget(self.title, alignment=Qt.AlignCenter)     # Title label
+        self.layout.addSpacing(10)
+
+        # Populate primary layout
+        self.primaryLayout.addStretch(20)
+        self.primaryLayout.addSpacing(20)
+        self.primaryLayout.addWidget(self.picture)                      # Picture
+        self.primaryLayout.addSpacing(20)
+        self.primaryLayout.addWidget(self.descriptionText)              # Description label
+        self.primaryLayout.addSpacing(20)
+        self.primaryLayout.addStretch(20)
+
+        # Customize buttons -- min width and font
+        self.buttonRetake.setMinimumWidth(200)                          # "Retake" button
+        self.buttonRetake.setFont(self.buttonFont)
+        self.buttonExit.setMinimumWidth(200)                            # "Exit" button
+        self.buttonExit.setFont(self.buttonFont)
+
+        # Buttons layout -- "retake" + "exit"
+        self.buttonsLayout.addStretch(8)
+        self.buttonsLayout.addWidget(self.buttonRetake)
+        self.buttonsLayout.addStretch(2)
+        self.buttonsLayout.addSpacing(16)
+        self.buttonsLayout.addWidget(self.buttonExit)
+        self.buttonsLayout.addStretch(8)
+
+        # Full layout included in widget
+        self.layout.addLayout(self.primaryLayout)
+        self.layout.addSpacing(16)
+        self.layout.addWidget(self.hLine1)
+        self.layout.addSpacing(16)
+        self.layout.addLayout(self.buttonsLayout)
+        self.setLayout(self.layout)
+
+
+    def updateResultsInfo(self, resultsTitles, resultsTexts, resultsPics):
+        """Updates results title and description text when user loads in new file.
+
+           Input: questionnaire ID <int>
+           Output: None
+        """
+        # Set title + description texts to relevant questionnaire
+        self.title.setText(resultsTitles[self.pageID])
+        self.descriptionText.setText(resultsTexts[self.pageID])
+
+        # Re-initialize picture
+        self.picPixMap = loadScaledPixmap(resultsPics[self.pageID], self.picScale)
+
+        # Border already comes from the theme; only the pixmap changes
+        self.picture.setPixmap(self.picPixMap)
+
+
+class QuestionnairesModel(QAbstractListModel):
+    """Read-only list model of questionnaire short titles; row = questionnaire index."""
+    def __init__(self, parent=None):
+        QAbstractListModel.__init__(self, parent)
+        self.shortTitles = []
+
+    def setTitles(self, shortTitlesArray):
+        """Replaces the listed questionnaires.
+
+           Input: short titles [<str>]
+           Output: none
+        """
+        self.beginResetModel()
+        self.shortTitles = list(shortTitlesArray)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        # Flat list: only the invisible root has rows
+        return 0 if parent.isValid() else len(self.shortTitles)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not (index.isValid()):
+            return None
+        if (role == Qt.DisplayRole):
+            return self.shortTitles[index.row()]
+        if (role == Qt.TextAlignmentRole):
+            return Qt.AlignCenter
+        return None
+
+class QuestionnairesFilter(QSortFilterProxyModel):
+    """Filter proxy for QuestionnairesModel. Matches titles by substring, unless given the set of questionnaire
+       indexes a full-text search returned, in which case exactly those are shown.
+    """
+    def __init__(self, parent=None):
+        QSortFilterProxyModel.__init__(self, parent)
+        self.allowedRows = None
+
+    def setAllowedRows(self, allowedRows):
+        """Shows only the given questionnaire indexes, or goes back to title filtering if None."""
+        self.allowedRows = None if (allowedRows is None) else set(allowedRows)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, sourceRow, sourceParent):
+        if (self.allowedRows is not None):
+            return sourceRow in self.allowedRows
+        return QSortFilterProxyModel.filterAcceptsRow(self, sourceRow, sourceParent)
+
+class QuestionnairesTable(QTableView):
+    """Table to hold questionnaire titles; used in questionnaire loading dialog.
+       Views a QuestionnairesModel through a case-insensitive filter proxy. Rows share one fixed height, and the
+       table is at most maxVisibleRows tall and scrolls beyond that, so its cost does not grow with the catalogue.
+    """
+    # Tallest the table gets before it scrolls
+    maxVisibleRows = 8
+
+    def __init__(self, parent=None):
+        QTableView.__init__(self, parent)
+
+        self.catalogue = QuestionnairesModel(self)
+        self.proxy = QuestionnairesFilter(self)
+        self.proxy.setSourceModel(self.catalogue)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setModel(self.proxy)
+
+        # Customize appearance
+        self.horizontalHeader().setVisible(False)
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().setVisible(False)
+        # Uniform row heights, so the view never measures rows one by one
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setShowGrid(False)
+        self.setFrameStyle(QFrame.StyledPanel)
+        self.setLineWidth(1)
+        self.setFrameShadow(QFrame.Plain)
+
+    def setFont(self, font):
+        """Applies the font and makes every row exactly one line of it tall."""
+        QTableView.setFont(self, font)
+        self.verticalHeader().setDefaultSectionSize(QFontMetrics(font).height() + 8)
+        self.updateHeight()
+
+    def setTitles(self, shortTitlesArray):
+        """Replaces the listed questionnaires and highlights the first.
+
+           Input: short titles [<str>]
+           Output: none
+        """
+        self.catalogue.setTitles(shortTitlesArray)
+        self.updateHeight()
+        self.setCurrentRow(0)
+
+    def setFilterText(self, text):
+        """Shows only questionnaires whose title contains the text; keeps a row highlighted if any are left."""
+        self.proxy.setFilterFixedString(text)
+        self.keepCurrentRow()
+
+    def setAllowedRows(self, allowedRows):
+        """Shows only the given questionnaire indexes (None for all); keeps a row highlighted if any are left."""
+        self.proxy.setAllowedRows(allowedRows)
+        self.keepCurrentRow()
+
+    def keepCurrentRow(self):
+        """Highlights the first visible row if filtering has removed the highlighted one."""
+        if not (self.currentIndex().isValid()) and (self.proxy.rowCount() > 0):
+            self.setCurrentIndex(self.proxy.index(0, 0))
+
+    def updateHeight(self):
+        """Fits the table to its rows, up to maxVisibleRows."""
+        numRows = max(1, min(self.catalogue.rowCount(), self.maxVisibleRows))
+        self.setFixedHeight(self.verticalHeader().defaultSectionSize() * numRows + 2 * self.frameWidth())
+
+    def currentRow(self):
+        """Returns the questionnaire index of the highlighted row, or -1 if none is highlighted."""
+        index = self.proxy.mapToSource(self.currentIndex())
+        return index.row() if index.isValid() else -1
+
+    def setCurrentRow(self, row):
+        """Highlights the given questionnaire, if it is not filtered out."""
+        index = self.proxy.mapFromSource(self.catalogue.index(row, 0))
+        if (index.isValid()):
+            self.setCurrentIndex(index)
+            self.scrollTo(index)
+
+class QuestionnaireDialog(QDialog):
+    """Dialog prompting the user to choose a questionnaire: a table of short titles above the selected quiz's description.
+       Built once by MainWidget and reused; setCatalogue() only rebuilds the table when the catalogue has changed.
+    """
+    def __init__(self, parent=None):
+        # Parent initialization
+        QDialog.__init__(self, parent, Qt.SplashScreen)
+        self.shortTitles = None
+        self.descriptions = []
+        self.searchIndex = None                 # QuizSearch.SearchIndex; titles are filtered by substring without one
+
+        # Initialize widgets/layouts
+        self.mainLayout = QVBoxLayout(self)
+        self.buttonsLayout = QHBoxLayout()
+        self.titleText = QLabel("Please Select a Questionnaire")
+        self.filterEdit = QLineEdit()
+        self.filterEdit.setPlaceholderText("Type to search...")
+        self.filterEdit.setClearButtonEnabled(True)
+        self.table = QuestionnairesTable()
+        self.hFrame1 = QFrame()
+        self.OKButton = QPushButton("Take Quiz!")
+        self.cancelButton = QPushButton("Cancel")
+
+        # One description view, refilled whenever the selection changes
+        self.description = QTextEdit()
+        self.description.setReadOnly(True)
+        self.description.setFixedHeight(75)
+
+        # Initialize fonts, apply to labels
+        self.titleFont = QFont()
+        self.titleFont.setBold(True)
+        self.titleFont.setPixelSize(20)
+        self.titleText.setFont(self.titleFont)
+
+        self.tableFont = QFont()
+        self.tableFont.setPixelSize(16)
+        self.table.setFont(self.tableFont)
+
+        # Customize frame
+        self.hFrame1.setFrameShape(QFrame.HLine)
+        self.hFrame1.setFrameShadow(QFrame.Sunken)
+
+        # Populate layout(s)
+        self.buttonsLayout.addWidget(self.cancelButton, alignment = Qt.AlignLeft)
+        self.buttonsLayout.addWidget(self.OKButton, alignment = Qt.AlignRight)
+        self.mainLayout.addWidget(self.titleText, alignment = Qt.AlignCenter)
+        self.mainLayout.addWidget(self.hFrame1)
+        self.mainLayout.addWidget(self.filterEdit)
+        self.mainLayout.addWidget(self.table)
+        self.mainLayout.addWidget(self.description)
+        self.mainLayout.addLayout(self.buttonsLayout)
+
+        # Shortcut for enter = accept
+        self.shortcutClose = QShortcut(self)
+        self.shortcutClose.setKey(Qt.Key_Return)
+
+        # Connect signals to slots
+        self.cancelButton.clicked.connect(self.reject)
+        self.OKButton.clicked.connect(self.accept)
+        self.table.doubleClicked.connect(self.accept)
+        self.table.selectionModel().currentRowChanged.connect(self.selectionChanged)
+        self.filterEdit.textChanged.connect(self.filterChanged)
+        self.shortcutClose.activated.connect(self.accept)
+
+        # Set QDialog width to accomodate table; height follows the (capped) table; themed dialog frame
+        self.setFixedWidth(325)
+        self.setObjectName("framedDialog")
+
+    def setCatalogue(self, shortTitles, descriptions):
+        """Shows the given questionnaires; the table is only rebuilt if the titles differ from those already shown.
+
+           Input: short titles [<str>], descriptions [<str>]
+           Output: none
+        """
+        self.descriptions = descriptions
+        if (shortTitles != self.shortTitles):
+            self.shortTitles = list(shortTitles)
+            self.table.setTitles(self.shortTitles)
+            self.adjustSize()
+        self.updateDescription(self.table.currentRow())
+
+    def setSearchIndex(self, searchIndex):
+        """Searches titles, descriptions, questions and results with the given index instead of filtering titles."""
+        self.searchIndex = searchIndex
+        self.filterChanged(self.filterEdit.text())
+
+    def filterChanged(self, text):
+        """Narrows the table to the questionnaires matching what has been typed so far (the last word as a prefix)."""
+        if (self.searchIndex is None):
+            self.table.setFilterText(text)
+        elif (text.strip() == ""):
+            self.table.setAllowedRows(None)
+        else:
+            self.table.setAllowedRows(self.searchIndex.searchQuestionnaires(text, prefixLast=True))
+
+    def accept(self):
+        """Closes the dialog with the highlighted questionnaire, unless the filter has left nothing to choose."""
+        if (self.table.currentRow() >= 0):
+            QDialog.accept(self)
+
+    def setCancelable(self, cancelable):
+        """Shows or hides the "Cancel" button; the first questionnaire has to be chosen."""
+        self.cancelButton.setVisible(cancelable)
+
+    def setCurrentIndex(self, index):
+        """Clears any filter left from last time and highlights the given questionnaire."""
+        self.filterEdit.clear()
+        self.table.setCurrentRow(index)
+        self.filterEdit.setFocus()
+
+    def getCurrentIndex(self):
+        """Returns the index of the highlighted questionnaire."""
+        return self.table.currentRow()
+
+    def selectionChanged(self, current, previous):
+        """Follows the table's highlighted row; connected to its selection model."""
+        self.updateDescription(self.table.currentRow())
+        self.OKButton.setEnabled(current.isValid())
+
+    def updateDescription(self, currentRow):
+        """Shows the description of whichever quiz is selected, as per signal by user interaction."""
+        if (0 <= currentRow < len(self.descriptions)):
+            self.description.setPlaceholderText(self.descriptions[currentRow])
+        else:
+            self.description.setPlaceholderText("")
+
+class SessionsModel(QAbstractTableModel):
+    """Table model of the save files in a SessionIndex, one row per file; sorting and filtering are done here on
+       plain lists of file names, which stays fast with tens of thousands of rows.
+    """
+    headers = ["Session", "Questionnaire", "Complete", "Last Modified", "Leaning"]
+
+    def __init__(self, parent=None):
+        QAbstractTableModel.__init__(self, parent)
+        self.sessionIndex = None
+        self.shortTitles = []
+        self.names = []                     # Visible file names, in display order
+        self.filterText = ""
+        self.sortColumn = 3
+        self.sortOrder = Qt.DescendingOrder
+
+    def setSessionIndex(self, sessionIndex, shortTitles):
+        """Lists the files of the given index.
+
+           Input: SessionIndex, questionnaire short titles [<str>]
+           Output: none
+        """
+        self.beginResetModel()
+        self.sessionIndex = sessionIndex
+        self.shortTitles = shortTitles
+        self.names = self.getMatchingNames()
+        self.names.sort(key=self.getSortKey(self.sortColumn), reverse=(self.sortOrder == Qt.DescendingOrder))
+        self.endResetModel()
+
+    def setFilterText(self, text):
+        """Shows only sessions whose file name or questionnaire contains the text."""
+        self.filterText = text.strip().lower()
+        self.setSessionIndex(self.sessionIndex, self.shortTitles)
+
+    def getMatchingNames(self):
+        if (self.sessionIndex is None):
+            return []
+        if (self.filterText == ""):
+            return list(self.sessionIndex.entries)
+        return [name for name, entry in self.sessionIndex.entries.items()
+                if (self.filterText in name.lower()) or (self.filterText in self.getTitle(entry[2]).lower())]
+
+    def getTitle(self, summary):
+        if (summary is None) or (summary[0] == -1):
+            return ""
+        return self.shortTitles[summary[0]]
+
+    def getSortKey(self, column):
+        """Returns the key a column sorts by; files not read yet come first, then unreadable ones, then the rest."""
+        entries = self.sessionIndex.entries if (self.sessionIndex is not None) else {}
+        if (column == 0):
+            return lambda name: name.lower()
+        if (column == 3):
+            return lambda name: entries[name][1]
+        def summaryKey(name):
+            summary = entries[name][2]
+            if (summary is None):
+                return (0, 0, "")
+            elif (summary[0] == -1):
+                return (1, 0, "")
+            elif (column == 1):
+                return (2, 0, self.shortTitles[summary[0]])
+            elif (column == 2):
+                return (2, summary[1] / max(summary[2], 1), "")
+            return (2, summary[3] - summary[4], "")
+        return summaryKey
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Reorders the rows; the selection stays on the same files."""
+        self.sortColumn = column
+        self.sortOrder = order
+        self.layoutAboutToBeChanged.emit()
+        previousNames = list(self.names)
+        self.names.sort(key=self.getSortKey(column), reverse=(order == Qt.DescendingOrder))
+        rows = {name: row for row, name in enumerate(self.names)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(persistent, [self.index(rows[previousNames[index.row()]], index.column()) for index in persistent])
+        self.layoutChanged.emit()
+
+    def summariesChanged(self):
+        """Repaints after files have been read; only the visible rows are actually redrawn."""
+        if (self.names):
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.names) - 1, len(self.headers) - 1))
+
+    def getPath(self, row):
+        return os.path.join(self.sessionIndex.directory, self.names[row])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if (orientation == Qt.Horizontal) and (role == Qt.DisplayRole):
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not (index.isValid()):
+            return None
+        name = self.names[index.row()]
+        size, mtime, summary = self.sessionIndex.entries[name]
+        column = index.column()
+        if (role == Qt.DisplayRole):
+            if (column == 0):
+                return name
+            elif (column == 3):
+                return time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime / 1e9))
+            elif (summary is None):
+                return "..." if (column == 1) else ""
+            elif (summary[0] == -1):
+                return "Unreadable" if (column == 1) else ""
+            elif (column == 1):
+                return self.shortTitles[summary[0]]
+            elif (column == 2):
+                return "%d%%" % (100 * summary[1] // max(summary[2], 1))
+            return getLeaning(summary)
+        if (role == Qt.ToolTipRole) and (summary is not None) and (summary[0] == -1):
+            return summary[1]
+        if (role == Qt.ForegroundRole) and ((summary is None) or (summary[0] == -1)):
+            return QBrush(Qt.gray)
+        if (role == Qt.TextAlignmentRole) and (column in (2, 3)):
+            return Qt.AlignCenter
+        return None
+
+class SessionBrowser(QDialog):
+    """Dialog listing the saved sessions in a folder, with their questionnaire, progress, age and leaning so far.
+       Built once by MainWidget and reused. Everything shown comes from the folder's session index (see
+       QuizSessionIndex), so it opens at once; files that are new or have changed since they were indexed are read
+       in timer ticks afterwards, filling in their rows as they go.
+    """
+    # Seconds of file reading allowed per timer tick before yielding back to the event loop
+    refreshBudget = 0.012
+
+    def __init__(self, questionnaires, parent=None):
+        # Parent initialization
+        QDialog.__init__(self, parent)
+        self.setWindowTitle("Open Session")
+        self.questionnaires = questionnaires
+        self.sessionIndex = None
+        self.staleNames = deque()           # Files still to be read, as listed by SessionIndex.scan()
+        self.selectedPath = None
+
+        # Initialize widgets/layouts
+        self.mainLayout = QVBoxLayout(self)
+        self.directoryLayout = QHBoxLayout()
+        self.buttonsLayout = QHBoxLayout()
+        self.directoryLabel = QLabel()
+        self.changeDirectoryButton = QPushButton("Change Folder...")
+        self.filterEdit = QLineEdit()
+        self.filterEdit.setPlaceholderText("Type to filter by file name or questionnaire...")
+        self.filterEdit.setClearButtonEnabled(True)
+        self.statusLabel = QLabel()
+        self.otherFileButton = QPushButton("Other File...")
+        self.cancelButton = QPushButton("Cancel")
+        self.openButton = QPushButton("Open")
+        self.openButton.setDefault(True)
+
+        # Table of sessions; rows share one fixed height and columns are not measured, so its cost does not grow with the folder
+        self.model = SessionsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(QFontMetrics(self.table.font()).height() + 6)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column, width in [(1, 190), (2, 80), (3, 130), (4, 90)]:
+            self.table.setColumnWidth(column, width)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setShowGrid(False)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(self.model.sortColumn, self.model.sortOrder)
+
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setInterval(0)
+        self.refreshTimer.timeout.connect(self.refreshNextBatch)
+
+        # Populate layout(s)
+        self.directoryLayout.addWidget(self.directoryLabel, stretch = 10)
+        self.directoryLayout.addWidget(self.changeDirectoryButton)
+        self.buttonsLayout.addWidget(self.otherFileButton)
+        self.buttonsLayout.addStretch(10)
+        self.buttonsLayout.addWidget(self.cancelButton)
+        self.buttonsLayout.addWidget(self.openButton)
+        self.mainLayout.addLayout(self.directoryLayout)
+        self.mainLayout.addWidget(self.filterEdit)
+        self.mainLayout.addWidget(self.table)
+        self.mainLayout.addWidget(self.statusLabel)
+        self.mainLayout.addLayout(self.buttonsLayout)
+
+        # Connect signals to slots
+        self.changeDirectoryButton.clicked.connect(self.changeDirectory)
+        self.otherFileButton.clicked.connect(self.openOtherFile)
+        self.cancelButton.clicked.connect(self.reject)
+        self.openButton.clicked.connect(self.accept)
+        self.table.doubleClicked.connect(self.accept)
+        self.table.selectionModel().currentRowChanged.connect(self.selectionChanged)
+        self.filterEdit.textChanged.connect(self.model.setFilterText)
+        self.model.modelReset.connect(self.keepCurrentRow)
+
+        self.resize(760, 480)
+
+    def setDirectory(self, directory):
+        """Lists the sessions in a folder from its index, then reads whatever is new or changed in the background.
+           Calling it again for the same folder only looks for changes; the index is not loaded again.
+
+           Input: directory <str>
+           Output: none
+        """
+        catalogueHash = getCatalogueHash(self.questionnaires)
+        if (self.sessionIndex is None) or (self.sessionIndex.directory != directory) or (self.sessionIndex.catalogueHash != catalogueHash):
+            self.stopRefresh()
+            self.sessionIndex = SessionIndex(directory, catalogueHash)
+            self.sessionIndex.load()
+        self.staleNames = deque(self.sessionIndex.scan())
+        self.selectedPath = None
+        self.directoryLabel.setText(directory)
+        self.model.setSessionIndex(self.sessionIndex, self.questionnaires.getAllShortTitles())
+        self.updateStatus()
+        if (self.staleNames):
+            self.refreshTimer.start()
+
+    def getDirectory(self):
+        """Returns the folder being listed, or None before setDirectory()."""
+        return self.sessionIndex.directory if (self.sessionIndex is not None) else None
+
+    def refreshNextBatch(self):
+        """Timer tick: reads new or changed files until refreshBudget runs out (at least one per tick), then yields."""
+        deadline = time.perf_counter() + self.refreshBudget
+        while (self.staleNames):
+            self.sessionIndex.refresh(self.staleNames.popleft(), self.questionnaires)
+            if (time.perf_counter() >= deadline):
+                break
+        self.model.summariesChanged()
+        if not (self.staleNames):
+            self.stopRefresh()
+            # Rows read in this pass were sorted as unknown; put them in their place
+            self.model.sort(self.model.sortColumn, self.model.sortOrder)
+        self.updateStatus()
+
+    def stopRefresh(self):
+        """Stops reading files and saves what has been read so far; the rest is picked up the next time."""
+        self.refreshTimer.stop()
+        if (self.sessionIndex is not None):
+            self.sessionIndex.save()
+
+    def updateStatus(self):
+        numSessions = len(self.sessionIndex.entries)
+        status = "%d saved session%s" % (numSessions, "" if numSessions == 1 else "s")
+        if (self.staleNames):
+            status += "; reading %d new or changed..." % len(self.staleNames)
+        self.statusLabel.setText(status)
+
+    def keepCurrentRow(self):
+        """Highlights the first row after the list has been rebuilt, if there is one."""
+        if (self.model.rowCount() > 0):
+            self.table.setCurrentIndex(self.model.index(0, 0))
+        self.openButton.setEnabled(self.model.rowCount() > 0)
+
+    def selectionChanged(self, current, previous):
+        """Follows the table's highlighted row; connected to its selection model."""
+        self.openButton.setEnabled(current.isValid())
+
+    def changeDirectory(self):
+        """Lets the user pick another folder of saved sessions."""
+        directory = QFileDialog.getExistingDirectory(self, "Choose a Folder of Saved Sessions", self.getDirectory() or os.getcwd())
+        if (directory != ""):
+            self.setDirectory(directory)
+
+    def openOtherFile(self):
+        """Falls back to a file dialog, for a save kept anywhere else or named differently."""
+        path = QFileDialog.getOpenFileName(parent=self, filter="Save files (*.txt *.txt.gz *.txt.xz);;All files (*)", directory = self.getDirectory() or os.getcwd())[0]
+        if (path != ""):
+            self.selectedPath = path
+            QDialog.accept(self)
+
+    def accept(self):
+        """Closes the dialog with the highlighted session, if there is one."""
+        index = self.table.currentIndex()
+        if (index.isValid()):
+            self.selectedPath = self.model.getPath(index.row())
+            QDialog.accept(self)
+
+    def done(self, result):
+        self.stopRefresh()
+        QDialog.done(self, result)
+
+    def getSelectedPath(self):
+        """Returns the save file chosen, or None if the dialog was cancelled."""
+        return self.selectedPath
+
+class MainWidget(QWidget):
+    """Main widget; contains all visible content, including scrollable area/scrollbar."""
+    # Custom signals
+    signalChangeStack = pyqtSignal(object)          # Upon sumitting results, change bottom stack to according layout
+    signalQuestionsBuilt = pyqtSignal()             # Every queued question of the current load has its RadioButtons
+    signalSaveFinished = pyqtSignal(str, object, object, str)  # A background save is done: path, error message or None, summary, catalogue hash
+
+    # Question widgets built synchronously so the first screen appears immediately; the rest are built in timer ticks
+    firstScreenful = 8
+    # Seconds of widget construction allowed per timer tick before yielding back to the event loop
+    buildBudget = 0.012
+    # Milliseconds to wait after a questionnaire source file changes before reloading it; editors often write in several steps
+    reloadDelay = 300
+    # Flush each save to disk before it replaces the previous file
+    syncSaves = True
+    # Save dialog filters, and the file ending each one adds if the name has none (see QuizSessions.sessionExtensions)
+    saveFilters = [("Text files (*.txt)", ".txt"), ("Compressed text files, gzip (*.txt.gz)", ".txt.gz"),
+                   ("Compressed text files, xz (*.txt.xz)", ".txt.xz")]
+
+    def __init__(self, memoryProfiler=None, startQuestionnaire=None):
+        # Initialize parent widget
+        QWidget.__init__(self)
+        self.memoryProfiler = memoryProfiler        # Diagnostics mode only; measures each load once it has been built
+        self.loadedProgress = 0                     # 0 signifies initial load. 1 signifies subsequent loads
+        self.questionnaires = loadQuestionnaires()  # Load copy of questionnaires within self scope
+        self.questionnaireIndex = 0                 # Whichever questionnaire gets loaded in via dialog
+
+        self.isBorn = 0                             # If 0, questionnaireBox will have no cancel button
+        self.earlyDecision = False                  # If True, offer to submit once the verdict can no longer change
+        self.earlyDecisionOffered = 0               # 1 once the offer has been made for the current attempt
+        self.questionnaireDialog = None             # Built on first use, then reused (see loadQuestionnaireBox)
+        self.popupDialog = None                     # Likewise, see popupBox
+        self.sessionBrowser = None                  # Likewise, see loadProgress
+        self.saveExecutor = None                    # Worker thread that writes save files, started on first save
+        self.signalSaveFinished.connect(self.saveFinished)
+
+        # Ask which questionnaire to take, unless one was given on the command line
+        if (startQuestionnaire is None):
+            self.loadQuestionnaireBox()
+        else:
+            self.isBorn = 1
+            self.questionnaireIndex = startQuestionnaire
+            self.questionsArray = self.questionnaires.getQuestions(startQuestionnaire)
+
+        # Assign all questions to dictionary
+        # Format: {absID : corresponding array in self.questionsArray}
+        self.questionsDict = {}
+
+        # Add questions to dictionary in format described above
+        self.populateDictionary()
+
+        # Initialize layouts
+        self.mainLayout = QHBoxLayout(self)
+        self.scrollWidget = QWidget()
+        self.scrollLayout = QVBoxLayout(self.scrollWidget)                  # Contains all questions
+        self.stackedBottom = FullBottomLayoutStack(self.questionnaires.getResultsTitles(self.questionnaireIndex), self.questionnaires.getResultsTexts(self.questionnaireIndex), self.questionnaires.getResultsPics(self.questionnaireIndex))
+
+        # Connect signals to relevant slots
+        self.signalChangeStack.connect(self.stackedBottom.setCurrentIndex)                      # Change to results layout based on answers
+        self.stackedBottom.widget(1).buttonRetake.clicked.connect(self.resetQuestionButtons)    # Reset questions upon clicking "reset"
+        self.stackedBottom.widget(2).buttonRetake.clicked.connect(self.resetQuestionButtons)
+
+        # Initialize scroll area
+        self.scrollArea = QScrollArea()
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setWidget(self.scrollWidget)
+        self.scrollArea.setWidgetResizable(True)
+
+        self.radioButtonsArray = []
+
+        # Answers to the loaded questionnaire, in display order; the RadioButtons only paint what it holds
+        self.answerModel = AnswerModel(self)
+        self.answerModel.signalAnswerChanged.connect(self.updateQuestionWidget)
+        self.answerModel.signalModelReset.connect(self.scrollWidget.update)
+
+        # Questions still waiting for their RadioButtons, built a time slice at a time by zero-interval timer ticks
+        # Format: deque([[eastWest, questionNumber, questionText]])
+        self.pendingQuestions = deque()
+        # Each slice's RadioButtons go into one container widget, so the visible scroll layout grows by one item (and one show) per slice
+        self.questionChunks = []
+        self.buildTimer = QTimer(self)
+        self.buildTimer.setInterval(0)
+        self.buildTimer.timeout.connect(self.buildNextChunk)
+
+        # Reload the questionnaires whenever their definitions are edited (see reloadQuestionnaires)
+        self.sourceWatcher = QFileSystemWatcher(self)
+        self.sourceWatcher.fileChanged.connect(self.questionnaireSourceChanged)
+        self.reloadTimer = QTimer(self)
+        self.reloadTimer.setSingleShot(True)
+        self.reloadTimer.setInterval(self.reloadDelay)
+        self.reloadTimer.timeout.connect(self.reloadEditedQuestionnaires)
+        self.watchQuestionnaireSources()
+
+        # Initialize title widget
+        self.title = TitleLayout(self.questionnaires.getQuizTitle(self.questionnaireIndex), self.questionnaireIndex)
+
+        # Horizontal lines above and below the questions; like the title and stackedBottom, kept across loads
+        self.hFrame1 = QFrame()
+        self.hFrame2 = QFrame()
+        self.hFrame1.setFrameStyle(QFrame.HLine)
+        self.hFrame1.setFrameShadow(QFrame.Sunken)
+        self.hFrame2.setFrameStyle(QFrame.HLine)
+        self.hFrame2.setFrameShadow(QFrame.Sunken)
+
+        # Load the initial quiz based on the id + array + questions dictionary
+        if (self.memoryProfiler is not None):
+            self.memoryProfiler.attach(self)
+        self.loadInitialProgress()
+
+        # Add scrollArea to main layout, set min width/height
+        self.mainLayout.addWidget(self.scrollArea)
+        self.setMinimumWidth(self.scrollWidget.width() + 35)
+        self.setMinimumHeight(480)
+
+    def populateDictionary(self):
+        """Populates questions dictionary with current array's question contents, keyed by absID (0 to the number of
+           questions - 1; see QuizCatalogue.checkQuestionnaires).
+        """
+        self.sortedQuestionsArray = sorted(self.questionsArray, key=itemgetter(3))
+        self.questionsDict = {question[3]: question for question in self.sortedQuestionsArray}
+
+    def loadInitialProgress(self):
+        """The initial call to load questions from the pre-loaded array.
+
+           Input: none
+           Output: none
+        """
+        if (self.memoryProfiler is not None):
+            self.memoryProfiler.beginLoad("loadInitialProgress")
+
+        # If not first load, depopulate whatever's already there
+        if (self.loadedProgress == 1):
+            self.clearQuizLayout()
+            # Update title widget text + results pics/text
+            self.stackedBottom.updateInfo(self.questionnaires.getResultsTitles(self.questionnaireIndex), self.questionnaires.getResultsTexts(self.questionnaireIndex), self.questionnaires.getResultsPics(self.questionnaireIndex))
+            self.title.updateTitle(self.questionnaires.getQuizTitle(self.questionnaireIndex))
+
+        # Queue up questions; progress is counted from the data, so it is correct before all widgets exist
+        self.populateButtonsArray(self.questionsArray, self.loadedProgress)
+        self.layOutQuiz()
+
+    def clearQuizLayout(self):
+        """Empties the scroll layout before another quiz or session is laid out. The title, frames and stackedBottom
+           are kept for reuse; question widgets are deleted (see clearQuestionWidgets) and spacers are dropped.
+
+           Input: none
+           Output: none
+        """
+        self.clearQuestionWidgets()
+        while (self.scrollLayout.count() > 0):
+            self.scrollLayout.takeAt(0)
+
+    def layOutQuiz(self):
+        """Lays out the title, frames and stackedBottom around the queued questions and starts building them.
+
+           Input: none
+           Output: none
+        """
+        # Populate main (scroll) layout
+        self.scrollLayout.addWidget(self.title)
+        self.scrollLayout.addWidget(self.hFrame1)
+        self.scrollLayout.addStretch(10)
+        self.scrollLayout.addWidget(self.hFrame2)
+        self.scrollLayout.addLayout(self.stackedBottom)
+        self.scrollArea.setHorizontalScrollBarPolicy(1)     # 1: Never shown
+        self.scrollArea.setVerticalScrollBarPolicy(0)       # 0: Always shown
+
+        # Build the first screenful now, the rest in time slices (radioButtons are inserted above hFrame2)
+        self.startQuestionWidgets()
+
+        # Set scroll position back to top of window
+        self.scrollArea.verticalScrollBar().setValue(0)
+        self.stackedBottom.setCurrentIndex(0)
+        self.earlyDecisionOffered = 0
+
+    def loadProgress(self):
+        """Subsequent calls to load progress (from saved files).
+
+           Input: none
+           Output: none
+        """
+        # Open the session browser (on the folder browsed last time, the working directory at first), grab wanted path
+        if (self.sessionBrowser is None):
+            self.sessionBrowser = SessionBrowser(self.questionnaires, self)
+        self.sessionBrowser.setDirectory(self.sessionBrowser.getDirectory() or os.getcwd())
+        # If user cancels, and thus no path was obtained
+        if (self.sessionBrowser.exec_() != QDialog.Accepted):
+            return
+        self.path = self.sessionBrowser.getSelectedPath()
+
+        error = self.loadProgressFile(self.path)
+        if (error is None):
+            self.popupBox("Savefile successfully loaded.")
+        else:
+            self.popupBox(error)
+
+    def loadProgressFile(self, path):
+        """Validates a save file and, if it is valid, replaces the current quiz with the session it holds.
+
+           Input: path to save file <str>
+           Output: error message to show the user <str>, or None if the session was loaded
+        """
+        # Only switch questionnaires once the whole file has been found valid (see QuizSessions.parseSession)
+        try:
+            newIndex, self.shortQuestionsArray = loadSession(path, self.questionnaires)
+        except SessionError as error:
+            return str(error)
+
+        if (self.memoryProfiler is not None):
+            self.memoryProfiler.beginLoad("loadProgress")
+        self.layOutSession(newIndex, self.shortQuestionsArray)
+        return None
+
+    def layOutSession(self, index, inArray):
+        """Replaces the current quiz with the given questions and answers, in the given order.
+
+           Input: questionnaire index <int>, [[absID <int>, response <int>]] in display order
+           Output: none
+        """
+        self.questionnaireIndex = index
+        # Depopulate current layouts
+        self.clearQuizLayout()
+        # Repopulate with new input; questionsArray follows the given order so rows line up with the answer model
+        self.populateButtonsArrayShort(inArray, self.loadedProgress)
+
+        # Update title widget text + results pics/text
+        self.stackedBottom.updateInfo(self.questionnaires.getResultsTitles(self.questionnaireIndex), self.questionnaires.getResultsTexts(self.questionnaireIndex), self.questionnaires.getResultsPics(self.questionnaireIndex))
+        self.title.updateTitle(self.questionnaires.getQuizTitle(self.questionnaireIndex))
+        self.layOutQuiz()
+
+    def populateButtonsArrayShort(self, inArray, loaded):
+        """Queues up the questions given short array (absID, response); see startQuestionWidgets.
+
+           Input: inArray[[]], whether loading from file or not <bool/int>
+           Output: none
+        """
+        self.cancelQuestionWidgets()
+
+        # Update dictionary, in case of change in quiz (the save file may belong to a different questionnaire than the one loaded)
+        self.questionsArray = self.questionnaires.getQuestions(self.questionnaireIndex)
+        self.populateDictionary()
+
+        # Iterate through inArray, queueing questions and collecting their recorded responses
+        self.questionsArray = []
+        answers = []
+        for i in range(0, len(inArray)):
+            inArray[i][0] = int(inArray[i][0])
+            inArray[i][1] = int(inArray[i][1])
+            # Queue RadioButtons construction for each question based on information given in questionsArray
+            # Format: [eastWest, questionNumber, questionText]
+            self.currentQuestion = self.questionsDict[inArray[i][0]]
+            self.questionsArray.append(self.currentQuestion)
+            self.pendingQuestions.append([self.currentQuestion[1], i+1, self.currentQuestion[0]])
+            answers.append(inArray[i][1])
+
+        # Restore all answers at once; the progress bar follows the model
+        self.answerModel.load(answers)
+
+    def populateButtonsArray(self, inArray, loaded):
+        """Queues up the questions for construction; see startQuestionWidgets.
+
+            argument: inArray[[]], whether_loading_from_file_or_not <int>"""
+
+        # If not loading from file, then shuffle
+        if (loaded == 0):
+            self.loadedProgress = 1
+            shuffle(inArray)
+
+        self.cancelQuestionWidgets()
+
+        answers = []
+        for i in range(0, len(inArray)):
+            # Cast from string input to int (method only called after confirmation that input can be cast to int)
+            inArray[i][1] = int(inArray[i][1])
+            inArray[i][2] = int(inArray[i][2])
+
+            # Queue RadioButtons construction for each question based on information given in questionsArray
+            # Format: [eastWest, questionNumber, questionText]
+            self.pendingQuestions.append([inArray[i][1], i+1, inArray[i][0]])
+            answers.append(inArray[i][2])
+
+        # Load all answers at once; the progress bar follows the model
+        self.answerModel.load(answers)
+
+    def createQuestionWidget(self, question, chunkLayout):
+        """Builds one RadioButtons from a queued question and adds it to the current slice's container.
+
+           Input: question [eastWest <int>, questionNumber <int>, questionText <str>], chunkLayout <QVBoxLayout>
+           Output: none
+        """
+        # Format: RadioButtons(eastWest, questionNumber, questionText, answerModel); its answer is already in the model
+        radioButtons = RadioButtons(question[0], question[1], question[2], self.answerModel)
+        radioButtons.signalAnswerButton.connect(self.checkEarlyDecision)
+
+        self.radioButtonsArray.append(radioButtons)
+        chunkLayout.addWidget(radioButtons)
+        chunkLayout.addStretch(10)
+
+    def newQuestionChunk(self):
+        """Creates an empty, not yet visible container for one slice of RadioButtons.
+
+           Input: none
+           Output: (container <QWidget>, its layout <QVBoxLayout>)
+        """
+        chunk = QWidget()
+        chunkLayout = QVBoxLayout(chunk)
+        chunkLayout.setContentsMargins(0, 0, 0, 0)
+        chunkLayout.setSpacing(self.scrollLayout.spacing())
+        return chunk, chunkLayout
+
+    def addQuestionChunk(self, chunk):
+        """Inserts a filled container into the scroll layout above hFrame2, where it is shown in one pass."""
+        self.questionChunks.append(chunk)
+        # hFrame2 and stackedBottom are always the last two items in the scroll layout
+        self.scrollLayout.insertWidget(self.scrollLayout.count() - 2, chunk)
+
+    def startQuestionWidgets(self):
+        """Builds the first screenful of queued questions immediately and schedules the rest for timer ticks."""
+        chunk, chunkLayout = self.newQuestionChunk()
+        while (self.pendingQuestions) and (len(self.radioButtonsArray) < self.firstScreenful):
+            self.createQuestionWidget(self.pendingQuestions.popleft(), chunkLayout)
+        self.addQuestionChunk(chunk)
+        if (self.pendingQuestions):
+            self.buildTimer.start()
+        else:
+            self.signalQuestionsBuilt.emit()
+
+    def buildNextChunk(self):
+        """Timer tick: builds queued questions until buildBudget runs out (at least one per tick), then yields."""
+        deadline = time.perf_counter() + self.buildBudget
+        chunk, chunkLayout = self.newQuestionChunk()
+        while (self.pendingQuestions):
+            self.createQuestionWidget(self.pendingQuestions.popleft(), chunkLayout)
+            if (time.perf_counter() >= deadline):
+                break
+        self.addQuestionChunk(chunk)
+        if not (self.pendingQuestions):
+            self.buildTimer.stop()
+            self.signalQuestionsBuilt.emit()
+
+    def cancelQuestionWidgets(self):
+        """Drops questions still queued from a previous load, e.g. when switching quizzes mid-construction."""
+        self.pendingQuestions.clear()
+        self.buildTimer.stop()
+
+    def clearQuestionWidgets(self):
+        """Deletes every built question (along with the slice containers holding them) and drops any still queued.
+           Deletion is deferred to the event loop, since this can run from inside one of the questions' own signals.
+        """
+        self.cancelQuestionWidgets()
+        for chunk in self.questionChunks:
+            self.scrollLayout.removeWidget(chunk)
+            chunk.hide()
+            chunk.deleteLater()
+        self.questionChunks = []
+        self.radioButtonsArray = []
+
+    def updateQuestionWidget(self, row):
+        """Repaints the RadioButtons for a single changed answer, if it has been built yet; connected to AnswerModel.signalAnswerChanged."""
+        if (row < len(self.radioButtonsArray)):
+            self.radioButtonsArray[row].update()
+
+    def watchQuestionnaireSources(self):
+        """Watches the questionnaire source files. An editor that saves by replacing the file drops it from the
+           watcher, so this is called again after every reload.
+        """
+        paths = [path for path in getQuestionnaireSources() if os.path.exists(path)]
+        stale = [path for path in self.sourceWatcher.files() if path not in paths]
+        if (stale):
+            self.sourceWatcher.removePaths(stale)
+        missing = [path for path in paths if path not in self.sourceWatcher.files()]
+        if (missing):
+            self.sourceWatcher.addPaths(missing)
+
+    def questionnaireSourceChanged(self, path):
+        """A questionnaire source file changed; reload once it has been quiet for reloadDelay. Connected to sourceWatcher."""
+        self.reloadTimer.start()
+
+    def reloadEditedQuestionnaires(self):
+        """Reads the edited questionnaire definitions and applies them to the quiz on screen (see applyQuestionnaires).
+           A definition that cannot be read (e.g. saved half way through an edit) leaves everything as it was.
+
+           Input: none
+           Output: none
+        """
+        self.watchQuestionnaireSources()
+        try:
+            questionnaires, pack = reloadQuestionnaires()
+        except Exception as error:
+            self.popupBox("Could not reload the questionnaires (%s: %s);\nstill showing the previous version." % (type(error).__name__, error))
+            return
+        if not (self.applyQuestionnaires(questionnaires, pack)) and (pack is not None):
+            pack.close()
+
+    def applyQuestionnaires(self, questionnaires, pack=None):
+        """Switches to a new version of the questionnaires without rebuilding the quiz. The current questionnaire is
+           compared with its new definition by absID: only RadioButtons whose text or pole changed are patched, the
+           answers and question order stay as they are, and the title and results pages are refreshed. Questions
+           added or removed need new rows, so then the quiz is laid out again: answers follow their question's text,
+           as removing a question renumbers the absIDs after it. Definitions whose absIDs do not run from 0 without
+           gaps are refused, since save files and the analysis tools index questions by absID.
+
+           When they come from a reopened pack, it replaces the open one, which is closed once nothing reads from it.
+
+           Input: questionnairesArray or QuizPack.PackedQuestionnaires, the QuizPack they read from or None
+           Output: whether the new questionnaires are now in use <bool>
+        """
+        try:
+            checkQuestionnaires(questionnaires)
+        except CatalogueError as error:
+            self.popupBox("Could not reload the questionnaires (%s);\nstill showing the previous version." % error)
+            return False
+        if not (self.questionnaireIndex < questionnaires.getSize()):
+            self.popupBox("The questionnaire being taken no longer exists;\nstill showing the previous version.")
+            return False
+        previousPack = None
+        if (pack is not None):
+            previousPack = assetPack
+            useAssetPack(pack)
+        index = self.questionnaireIndex
+        newQuestions = questionnaires.getQuestions(index)
+        changed, added, removed = diffQuestions(self.questionsArray, newQuestions)
+        oldPoles = {question[3]: question[1] for question in self.questionsArray}
+        polesChanged = any(oldPoles[absID] != question[1] for absID, question in changed.items())
+
+        # Everything worked out from the old definitions (e.g. save headers) is out of date
+        wasCatalogueList = (self.questionsArray is self.questionnaires.getQuestions(index))
+        self.questionnaires = questionnaires
+        forgetQuestionnaireHashes()
+        if (self.sessionBrowser is not None):
+            self.sessionBrowser.questionnaires = questionnaires
+        if (self.questionnaireDialog is not None):
+            if (assetPack is not None):
+                self.questionnaireDialog.setSearchIndex(openSearchIndex(questionnaires, assetPack.path + ".search.json"))
+            else:
+                self.questionnaireDialog.setSearchIndex(openSearchIndex(questionnaires))
+
+        if (added) or (removed):
+            # An answer goes to the new question with the same text, else to the same absID if no other answer claims it
+            newByText = {question[0]: question[3] for question in newQuestions}
+            newAbsIDs = set(question[3] for question in newQuestions)
+            claimed = set(newByText[question[0]] for question in self.questionsArray if question[0] in newByText)
+            inArray = []
+            placed = set()
+            for question, answer in zip(self.questionsArray, self.answerModel.getAnswers()):
+                absID = newByText.get(question[0])
+                if (absID is None) and (question[3] in newAbsIDs) and (question[3] not in claimed):
+                    absID = question[3]
+                if (absID is not None) and (absID not in placed):
+                    inArray.append([absID, answer])
+                    placed.add(absID)
+            inArray += [[question[3], -1] for question in sorted(newQuestions, key=itemgetter(3)) if question[3] not in placed]
+            self.layOutSession(index, inArray)
+            if (previousPack is not None):
+                previousPack.close()
+            return True
+
+        # Same questions in the same order, now the new definitions' lists; a fresh attempt shuffles the catalogue's own list, so keep doing so
+        byAbsID = {question[3]: question for question in newQuestions}
+        questionsArray = [byAbsID[question[3]] for question in self.questionsArray]
+        for oldQuestion, newQuestion in zip(self.questionsArray, questionsArray):
+            newQuestion[2] = oldQuestion[2]
+        if (wasCatalogueList):
+            newQuestions[:] = questionsArray
+            questionsArray = newQuestions
+        self.questionsArray = questionsArray
+        self.populateDictionary()
+
+        # Patch the RadioButtons already built, and the ones still queued for construction
+        for row, question in enumerate(self.questionsArray):
+            if (question[3] in changed) and (row < len(self.radioButtonsArray)):
+                self.radioButtonsArray[row].setQuestion(question[1], question[0])
+        for pending in self.pendingQuestions:
+            question = self.questionsArray[pending[1] - 1]
+            pending[0] = question[1]
+            pending[2] = question[0]
+
+        self.title.updateTitle(questionnaires.getQuizTitle(index))
+        self.stackedBottom.updateInfo(questionnaires.getResultsTitles(index), questionnaires.getResultsTexts(index), questionnaires.getResultsPics(index))
+        # A result already shown may no longer follow from the answers once poles have changed
+        if (polesChanged) and (self.stackedBottom.currentIndex() != 0):
+            self.stackedBottom.setCurrentIndex(0)
+        if (previousPack is not None):
+            previousPack.close()
+        return True
+
+    def loadQuestionnaireBox(self):
+        """Prompts the user to choose a questionnaire. The dialog is built on first use and reused after that.
+
+           Input: none
+           Output: none
+        """
+        if (self.questionnaireDialog is None):
+            self.questionnaireDialog = QuestionnaireDialog(self)
+            self.questionnaireDialog.accepted.connect(self.closeQuestionnaireBox)
+            # The saved index lives next to whichever catalogue it covers
+            if (assetPack is not None):
+                self.questionnaireDialog.setSearchIndex(openSearchIndex(self.questionnaires, assetPack.path + ".search.json"))
+            else:
+                self.questionnaireDialog.setSearchIndex(openSearchIndex(self.questionnaires))
+        # Only rebuilds the table if the catalogue has changed since the last time
+        self.questionnaireDialog.setCatalogue(self.questionnaires.getAllShortTitles(), self.questionnaires.getAllDescriptions())
+
+        # If initial load, don't give option to cancel
+        if (self.isBorn == 1):
+            self.questionnaireDialog.setCancelable(True)
+            self.questionnaireDialog.setCurrentIndex(self.questionnaireIndex)
+        else:
+            self.isBorn = 1
+            self.questionnaireDialog.setCancelable(False)
+            self.questionnaireDialog.setCurrentIndex(0)
+
+            self.questionnaireIndex = 0
+
+            # Grab questions, shuffle order
+            self.questionsArray = self.questionnaires.getQuestions(0)
+            shuffle(self.questionsArray)
+
+        self.questionnaireDialog.exec_()
+
+    def closeQuestionnaireBox(self):
+        """Upon user pressing 'Load Quiz' button on questionnaire box, load whichever questionnaire was selected.
+           Also reinitializes title, progressBar, and results.
+
+           Input: none
+           Output: none
+        """
+        # Set questionnaireIndex to current selected row in questionnaire dialog
+        index = self.questionnaireDialog.getCurrentIndex()
+
+        # If first time loading, __init__ lays out the quiz once this dialog returns
+        if (self.loadedProgress == 1):
+            self.loadQuestionnaire(index)
+        else:
+            self.questionnaireIndex = index
+            self.questionsArray = self.questionnaires.getQuestions(index)
+            shuffle(self.questionsArray)
+
+    def loadQuestionnaire(self, index):
+        """Replaces the current quiz with a fresh, newly shuffled attempt at the given questionnaire.
+
+           Input: questionnaire index <int>
+           Output: none
+        """
+        self.questionnaireIndex = index
+        self.questionsArray = self.questionnaires.getQuestions(index)
+        shuffle(self.questionsArray)
+        self.loadInitialProgress()
+
+    def popupBox(self, text):
+        """Rudimentary popup box with "OK" button for various notifications/displays of information to user.
+           In this case, used primarily to notify users when an invalid file was chosen to be loaded, when a user has not submitted responses to every question before trying to display their results, and when the user attempts to reset the quiz when they have not answered any questions yet.
+           One PopupDialog is built on first use; later messages only change its text.
+
+           Input: text to be displayed in popup dialog <string>
+           Output: none
+        """
+        if (self.popupDialog is None):
+            self.popupDialog = PopupDialog(self)
+        self.popupDialog.showMessage(text)
+
+    def tallyResults(self):
+        """When the user has answered all questions and clicks the "Submit" button, their results will be tallied.
+           If any response has yet to be completed, abort and display a popup box telling the user to answer all questions.
+
+           Input: none
+           Output: none
+        """
+        # Algorithm: add each whichPressed() value to the tally of its question's pole ('west' or 'east'),
+        # then declare whichever is bigger the winner (if tie, random); see QuizScoring
+        tallies = tallyResponses([question[1] for question in self.questionsArray], self.answerModel.getAnswers())
+        if (tallies is None):
+            self.popupBox("Not all questions have been answered yet!")
+            return 0
+        self.westTally, self.eastTally = tallies
+        self.finalVerdict = getVerdict(self.westTally, self.eastTally)
+        self.showVerdict(self.finalVerdict)
+
+    def showVerdict(self, verdict):
+        """Switches the bottom stack to the results page for the given verdict and scrolls down to it.
+
+           Input: verdict <int> (1 = West, 2 = East)
+           Output: none
+        """
+        self.signalChangeStack.emit(verdict)        # Signal to mainWidget who the winner is
+        self.scrollArea.verticalScrollBar().setValue(self.scrollArea.verticalScrollBar().maximum())
+
+    def setEarlyDecision(self, enabled):
+        """Turns early-decision mode on or off; connected to MainWindow.earlyDecisionAction.
+
+           Input: enabled <bool>
+           Output: none
+        """
+        self.earlyDecision = enabled
+        if (enabled):
+            self.checkEarlyDecision()
+
+    def getDecidedVerdict(self):
+        """Compares the current West/East margin with the largest swing the unanswered questions could still cause.
+           Ties are settled randomly, so a lead only counts as decided if it is strictly larger than that swing.
+
+           Input: none
+           Output: verdict that can no longer change <int> (1 = West, 2 = East), or 0 if it is still open
+        """
+        return getDecidedVerdict([question[1] for question in self.questionsArray], self.answerModel.getAnswers())
+
+    def checkEarlyDecision(self):
+        """After each answer in early-decision mode, offer to submit immediately if the verdict can no longer change.
+           The offer is made once per attempt; it is made again after a restart or a new quiz/session is loaded.
+
+           Input: none
+           Output: none
+        """
+        if (not self.earlyDecision) or (self.earlyDecisionOffered == 1):
+            return
+        numRemaining = self.answerModel.rowCount() - self.answerModel.answeredCount()
+        # Nothing left to skip; the regular "Submit" button covers this case
+        if (numRemaining == 0):
+            return
+        verdict = self.getDecidedVerdict()
+        if (verdict != 0):
+            self.earlyDecisionOffered = 1
+            if (execTransient(EarlyDecisionDialog(numRemaining, self)) == QDialog.Accepted):
+                self.showVerdict(verdict)
+
+    def resetQuestionButtons(self):
+        """Reset questions in the event of the user clicking "retake quiz"."""
+        # One model reset, and so one progress update, however many questions there are
+        self.answerModel.reset()
+        self.earlyDecisionOffered = 0
+        # Reset scroll position to top of screen
+        self.scrollArea.verticalScrollBar().setValue(0)
+        # Change stacked layout to show pre-results "Submit" button
+        self.stackedBottom.setCurrentIndex(0)
+
+    def saveProgress(self):
+        """Save progress via writing a text file with relevant save information.
+
+           Input: None
+           Output: None
+        """
+        # First, update the array with which questions have already been answered
+        self.updateArrayWhichPressed()
+        # Use QFileDialog to grab path to write to
+        self.path, selectedFilter = QFileDialog.getSaveFileName(parent=self, filter=";;".join(name for name, extension in self.saveFilters), directory = os.getcwd())
+        if (self.path == ""):
+            return()
+        # Make sure extension is .txt (or .txt.gz/.txt.xz); if not, add the one of the chosen filter
+        if not (isSessionFile(self.path)):
+            self.path += dict(self.saveFilters).get(selectedFilter, ".txt")
+        # Questions are written in display order, so a loaded session looks the same as it did when saved.
+        # The answers are copied here; the file itself is written on the worker thread so the window never waits on the disk
+        answers = [[question[3], question[2]] for question in self.questionsArray]
+        if (self.saveExecutor is None):
+            self.saveExecutor = ThreadPoolExecutor(max_workers=1)
+        quizHash = getQuestionnaireHash(self.questionnaires, self.questionnaireIndex)
+        # What the session browser lists about this save, so it never has to read the file back (see QuizSessionIndex)
+        summary = summarizeSession(self.questionnaires, self.questionnaireIndex, answers)
+        self.saveExecutor.submit(self.writeSaveFile, self.path, self.questionnaireIndex, answers, quizHash, summary, getCatalogueHash(self.questionnaires))
+
+    def writeSaveFile(self, path, index, answers, quizHash, summary, catalogueHash):
+        """Writes a save file; runs on the worker thread and reports back through signalSaveFinished, passing on
+           what saveFinished needs to record the save in its folder's session index.
+
+           Input: path <str>, questionnaire index <int>, [[absID, response]] in display order, questionnaire hash <str>,
+                  summary from summarizeSession(), catalogue hash <str>
+           Output: none
+        """
+        try:
+            writeSession(path, index, answers, quizHash, getCompression(path), self.syncSaves)
+            self.signalSaveFinished.emit(path, None, summary, catalogueHash)
+        except OSError as error:
+            self.signalSaveFinished.emit(path, "Error: could not save to %s (%s)." % (path, error.strerror), summary, catalogueHash)
+
+    def saveFinished(self, path, error, summary, catalogueHash):
+        """Tells the user if a background save failed, or else records it in its folder's session index; connected
+           to signalSaveFinished. The index is only ever written from this (the GUI) thread: through the session
+           browser's copy when it covers that folder, so the browser never saves over the new entry.
+        """
+        if (error is not None):
+            self.popupBox(error)
+            return
+        directory = os.path.dirname(os.path.abspath(path))
+        sessionIndex = self.sessionBrowser.sessionIndex if (self.sessionBrowser is not None) else None
+        if (sessionIndex is not None) and (os.path.abspath(sessionIndex.directory) == directory) and (sessionIndex.catalogueHash == catalogueHash):
+            sessionIndex.record(os.path.basename(path), summary)
+            sessionIndex.save()
+        else:
+            recordSession(path, summary, catalogueHash)
+
+    def waitForSaves(self):
+        """Blocks until every save that has been started is on disk; called before the application exits."""
+        if (self.saveExecutor is not None):
+            self.saveExecutor.shutdown(wait=True)
+            self.saveExecutor = None
+
+    def updateArrayWhichPressed(self):
+        """Update which buttons have been pressed on which responses; used for save/load purposes.
+
+           Input: none
+           Output: none
+        """
+        for question, pressed in zip(self.questionsArray, self.answerModel.getAnswers()):
+            question[2] = pressed
+
+def main():
+    parser = argparse.ArgumentParser(description="East Coast vs. West Coast Quiz.")
+    parser.add_argument("--memory-report", nargs="?", const="-", metavar="PATH",
+                        help="write a JSON memory report after each questionnaire load (stdout if no PATH)")
+    parser.add_argument("--questionnaire", type=int, metavar="INDEX",
+                        help="start on this questionnaire instead of asking (e.g. for kiosks)")
+    parser.add_argument("--pack", metavar="PATH", help="read questionnaires and images from this pack file (see QuizPack.py)")
+    parser.add_argument("--headless", action="store_true",
+                        help="take a questionnaire in the terminal, without Qt (see --headless --help)")
+    # Anything unrecognized (e.g. -style, -platform) is left for Qt
+    args, qtArgs = parser.parse_known_args()
+    if (args.pack is not None):
+        try:
+            useAssetPack(QuizPack(args.pack))
+        except (OSError, PackError) as error:
+            parser.error(str(error))
+    if (args.questionnaire is not None) and not (0 <= args.questionnaire < loadQuestionnaires().getSize()):
+        parser.error("no questionnaire with index %d" % args.questionnaire)
+
+    memoryProfiler = None
+    if (args.memory_report is not None):
+        from QuizDiagnostics import MemoryProfiler
+        memoryProfiler = MemoryProfiler(args.memory_report)
+
+    app = App([sys.argv[0]] + qtArgs, memoryProfiler, args.questionnaire)
+    progressBarVal = 0
+    sys.exit(app.exec_())
+
+if (__name__ == "__main__"):
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+# Headless quiz runner
+# Takes a questionnaire from the command line instead of the GUI: answers come from a file, from stdin, or from
+# prompts when stdin is a terminal, and the verdict and results text are printed. Save files are the same ones
+# MainWidget.saveProgress writes and loadProgress reads, so a session can move between the two. Nothing here
+# imports PyQt5, which keeps start-up to a few tens of milliseconds for CI and batch jobs.
+#
+# Usage: EastWestQuiz.py --headless [options], or QuizHeadless.py [options] directly.
+
+from operator import itemgetter
+import argparse
+import re
+import random
+import sys
+
+from QuizScoring import tallyResponses, getVerdict
+from QuizSessions import loadSession, writeSession, isSessionFile, getCompression, getQuestionnaireHash, getCatalogueHash, SessionError
+from QuizSessionIndex import summarizeSession, recordSession
+from QuizPack import QuizPack, PackedQuestionnaires, PackError
+
+# Lowest and highest answer; 0 = Disagree, 5 = Agree, -1 = unanswered
+minAnswer = 0
+maxAnswer = 5
+# Exit status when the quiz was not answered completely (any save is still written)
+incompleteStatus = 2
+
+
+def loadQuestionnaires(packPath=None):
+    """Returns the built-in catalogue, or the one in a pack file.
+
+       Input: pack path <str> or None
+       Output: questionnairesArray or QuizPack.PackedQuestionnaires
+    """
+    if (packPath is None):
+        from QuizCatalogue import questionnairesArray
+        return questionnairesArray()
+    return PackedQuestionnaires(QuizPack(packPath))
+
+
+def getSortedQuestions(questionnaires, index):
+    """Returns a questionnaire's questions ordered by absID, the order answers are given and stored in."""
+    return sorted(questionnaires.getQuestions(index), key=itemgetter(3))
+
+
+def parseAnswers(text, numQuestions):
+    """Reads answers separated by whitespace or commas, one per question in absID order.
+       Missing trailing answers count as unanswered.
+
+       Input: text <str>, number of questions <int>
+       Output: responses [<int>], or an error message <str>
+    """
+    words = [word for word in re.split(r"[\s,]+", text) if word]
+    if (len(words) > numQuestions):
+        return "Error: %d answers given for %d questions." % (len(words), numQuestions)
+    responses = []
+    for position, word in enumerate(words):
+        try:
+            response = int(word)
+        except ValueError:
+            return "Error: answer %d (%r) is not a number." % (position + 1, word)
+        if not (response == -1 or minAnswer <= response <= maxAnswer):
+            return "Error: answer %d (%d) is not between %d and %d." % (position + 1, response, minAnswer, maxAnswer)
+        responses.append(response)
+    return responses + [-1] * (numQuestions - len(responses))
+
+
+def promptAnswers(questions, responses, infile=sys.stdin, outfile=sys.stdout):
+    """Asks each unanswered question in turn on a terminal. An empty line leaves it unanswered; end of input stops.
+
+       Input: questions ordered by absID, responses so far [<int>]
+       Output: responses [<int>]
+    """
+    responses = list(responses)
+    for absID, question in enumerate(questions):
+        if (responses[absID] != -1):
+            continue
+        while True:
+            outfile.write("%d. %s\n   Disagree %d-%d Agree: " % (absID + 1, question[0], minAnswer, maxAnswer))
+            outfile.flush()
+            line = infile.readline()
+            if (line == ""):
+                outfile.write("\n")
+                return responses
+            line = line.strip()
+            if (line == ""):
+                break
+            if (line.isdigit()) and (minAnswer <= int(line) <= maxAnswer):
+                responses[absID] = int(line)
+                break
+            outfile.write("   Please enter a number from %d to %d.\n" % (minAnswer, maxAnswer))
+    return responses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="EastWestQuiz.py --headless", description="Take a questionnaire without the GUI.")
+    parser.add_argument("--list", action="store_true", help="list the questionnaires and exit")
+    parser.add_argument("--questionnaire", type=int, metavar="INDEX", help="questionnaire to take (see --list)")
+    parser.add_argument("--answers", metavar="FILE", help="answers 0-5 (or -1 for none) in question order, separated by "
+                                                         "spaces, commas or newlines; - reads stdin (default: stdin, or "
+                                                         "prompts if stdin is a terminal)")
+    parser.add_argument("--load", metavar="SAVE", help="start from a save file; its questionnaire is used")
+    parser.add_argument("--save", metavar="PATH", help="write the session to a save file the GUI can load; "
+                                                       "end the name in .txt.gz or .txt.xz to compress it")
+    parser.add_argument("--sync", action="store_true", help="flush the save to disk before it replaces an existing file")
+    parser.add_argument("--seed", type=int, help="seed for settling ties, for repeatable runs")
+    parser.add_argument("--pack", metavar="PATH", help="read questionnaires from this pack file (see QuizPack.py)")
+    parser.add_argument("--quiet", action="store_true", help="print only the verdict")
+    args = parser.parse_args(argv)
+
+    try:
+        questionnaires = loadQuestionnaires(args.pack)
+    except (OSError, PackError) as error:
+        print("Error: %s" % error, file=sys.stderr)
+        return 1
+
+    if (args.list):
+        for index, shortTitle in enumerate(questionnaires.getAllShortTitles()):
+            print("[%d] %s (%d questions)" % (index, shortTitle, len(questionnaires.getQuestions(index))))
+        return 0
+
+    # Questionnaire and any answers so far
+    if (args.load is not None):
+        try:
+            index, answers = loadSession(args.load, questionnaires)
+        except SessionError as error:
+            print("%s (%s)" % (error, args.load), file=sys.stderr)
+            return 1
+        responses = [response for absID, response in sorted(answers)]
+        if (args.questionnaire is not None) and (args.questionnaire != index):
+            parser.error("%s holds questionnaire %d, not %d" % (args.load, index, args.questionnaire))
+    elif (args.questionnaire is not None):
+        index = args.questionnaire
+        if not (0 <= index < questionnaires.getSize()):
+            parser.error("no questionnaire with index %d" % index)
+        responses = [-1] * len(questionnaires.getQuestions(index))
+    else:
+        parser.error("one of --list, --questionnaire or --load is required")
+    questions = getSortedQuestions(questionnaires, index)
+
+    # Answers: a file, piped stdin, or prompts; a loaded save without --answers is scored as it is
+    if (args.answers is not None) or ((args.load is None) and not (sys.stdin.isatty())):
+        try:
+            if (args.answers is None) or (args.answers == "-"):
+                text = sys.stdin.read()
+            else:
+                with open(args.answers, 'r') as INFILE:
+                    text = INFILE.read()
+        except (OSError, UnicodeDecodeError) as error:
+            print("Error: %s" % error, file=sys.stderr)
+            return 1
+        given = parseAnswers(text, len(questions))
+        if (isinstance(given, str)):
+            print(given, file=sys.stderr)
+            return 1
+        # Answers given explicitly replace those of a loaded save; unanswered ones leave them alone
+        responses = [new if (new != -1) else old for new, old in zip(given, responses)]
+    elif (sys.stdin.isatty()):
+        if not (args.quiet):
+            print(questionnaires.getQuizTitle(index))
+        responses = promptAnswers(questions, responses)
+
+    if (args.save is not None):
+        path = args.save if isSessionFile(args.save) else args.save + ".txt"
+        try:
+            writeSession(path, index, list(enumerate(responses)), getQuestionnaireHash(questionnaires, index),
+                         getCompression(path), args.sync)
+            recordSession(path, summarizeSession(questionnaires, index, list(enumerate(responses))), getCatalogueHash(questionnaires))
+        except OSError as error:
+            print("Error: %s" % error, file=sys.stderr)
+            return 1
+
+    tallies = tallyResponses([question[1] for question in questions], responses)
+    if (tallies is None):
+        print("Not all questions have been answered yet! (%d of %d unanswered)" % (responses.count(-1), len(responses)),
+              file=sys.stderr)
+        return incompleteStatus
+    westTally, eastTally = tallies
+    verdict = getVerdict(westTally, eastTally, random.Random(args.seed))
+    pageID = verdict - 1
+    print(questionnaires.getResultsTitles(index)[pageID])
+    if not (args.quiet):
+        print("West %d, East %d" % (westTally, eastTally))
+        print(questionnaires.getResultsTexts(index)[pageID])
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+
+# Pre-scaled image cache
+# Results pictures are shown at a fraction of their original size (ResultsLayout.picScale). Rather than decode and
+# rescale the originals every time a quiz loads, each picture is scaled once, with smooth filtering, for each
+# device pixel ratio and saved as PNG under a name derived from a hash of the original's contents. The runtime
+# loads the variant for its scale and ratio directly. A changed original hashes to a new name, so its variants
+# are rebuilt on first use without any invalidation step; `--prune` clears out the stale ones.
+#
+# Run this script as part of deployment to fill the cache in advance; otherwise it fills itself as pictures are shown.
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPixmap
+import argparse
+import hashlib
+import json
+import sys
+import os
+
+# Device pixel ratios prepared by default: standard, 150% and 200% displays
+defaultRatios = [1.0, 1.5, 2.0]
+manifestName = "manifest.json"
+
+
+class ImageCache(object):
+    """Directory of pre-scaled images named "<source hash>-<scale>-<ratio>x.png".
+
+       Sources are named relative to assetDirectory, or looked up in a QuizPack first if one is given. The source hash
+       of a loose file is remembered in a manifest together with its size and modification time, so unchanged files
+       are not read again just to find their variants.
+    """
+    def __init__(self, cacheDirectory, assetDirectory, pack=None):
+        self.cacheDirectory = cacheDirectory
+        self.assetDirectory = assetDirectory
+        self.pack = pack
+        self.sourceHashes = {}          # {source name: hash}, for this process
+        self.manifest = {}              # {source path: [size, mtime_ns, hash]}, kept in the cache directory
+        self.isManifestModified = False
+        try:
+            with open(os.path.join(cacheDirectory, manifestName), 'r') as INFILE:
+                self.manifest = json.load(INFILE)
+        except (OSError, ValueError):
+            pass
+
+    def readSource(self, name):
+        """Returns the original image's bytes, or None if there is no such image."""
+        if (self.pack is not None) and (self.pack.hasAsset(name)):
+            return self.pack.getAsset(name)
+        try:
+            with open(os.path.join(self.assetDirectory, name), 'rb') as INFILE:
+                return INFILE.read()
+        except OSError:
+            return None
+
+    def getSourceHash(self, name):
+        """Returns the hex digest of the original image's contents, or None if there is no such image.
+
+           Input: source name <str>
+           Output: hash <str> or None
+        """
+        if (name in self.sourceHashes):
+            return self.sourceHashes[name]
+
+        sourceHash = None
+        if (self.pack is not None) and (self.pack.hasAsset(name)):
+            sourceHash = hashlib.sha256(self.pack.getAsset(name)).hexdigest()
+        else:
+            path = os.path.join(self.assetDirectory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            record = self.manifest.get(path)
+            if (record is not None) and (record[0] == stat.st_size) and (record[1] == stat.st_mtime_ns):
+                sourceHash = record[2]
+            else:
+                contents = self.readSource(name)
+                if (contents is None):
+                    return None
+                sourceHash = hashlib.sha256(contents).hexdigest()
+                self.manifest[path] = [stat.st_size, stat.st_mtime_ns, sourceHash]
+                self.isManifestModified = True
+        self.sourceHashes[name] = sourceHash
+        return sourceHash
+
+    def getVariantPath(self, sourceHash, scale, ratio):
+        """Returns where the variant of a source for the given scale and device pixel ratio is (or would be) cached."""
+        return os.path.join(self.cacheDirectory, "%s-%g-%gx.png" % (sourceHash[:24], scale, ratio))
+
+    def prepare(self, name, scale, ratio):
+        """Makes sure the variant of an image for a scale and device pixel ratio is in the cache.
+
+           Input: source name <str>, scale <float>, device pixel ratio <float>
+           Output: path of the cached variant <str>, or None if the source is missing or the cache is not writable
+        """
+        sourceHash = self.getSourceHash(name)
+        if (sourceHash is None):
+            return None
+        path = self.getVariantPath(sourceHash, scale, ratio)
+        if (os.path.exists(path)):
+            return path
+
+        image = QImage()
+        if not (image.loadFromData(self.readSource(name))):
+            return None
+        scaled = image.scaled(max(1, round(image.width() * scale * ratio)), max(1, round(image.height() * scale * ratio)),
+                              Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        # Written under a temporary name and renamed, so a concurrent reader never sees half a file
+        temporaryPath = path + ".%d.tmp" % os.getpid()
+        try:
+            os.makedirs(self.cacheDirectory, exist_ok=True)
+            if not (scaled.save(temporaryPath, "PNG")):
+                return None
+            os.replace(temporaryPath, path)
+        except OSError:
+            return None
+        return path
+
+    def getPixmap(self, name, scale, ratio=1.0):
+        """Returns an image at the given scale, drawn at the given device pixel ratio: the cached variant if there is
+           (or can be made) one, otherwise scaled in memory. Missing sources give a null pixmap.
+
+           Input: source name <str>, scale <float>, device pixel ratio <float>
+           Output: QPixmap whose logical size is the original's size times scale
+        """
+        path = self.prepare(name, scale, ratio)
+        if (path is not None):
+            pixmap = QPixmap(path)
+        else:
+            pixmap = QPixmap()
+            contents = self.readSource(name)
+            if (contents is not None) and (pixmap.loadFromData(contents)):
+                pixmap = pixmap.scaled(max(1, round(pixmap.width() * scale * ratio)), max(1, round(pixmap.height() * scale * ratio)),
+                                       Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        pixmap.setDevicePixelRatio(ratio)
+        self.saveManifest()
+        return pixmap
+
+    def saveManifest(self):
+        """Writes the manifest back if any hashes were added; a read-only cache just recomputes them next time."""
+        if not (self.isManifestModified):
+            return
+        try:
+            os.makedirs(self.cacheDirectory, exist_ok=True)
+            with open(os.path.join(self.cacheDirectory, manifestName), 'w') as OUTFILE:
+                json.dump(self.manifest, OUTFILE)
+            self.isManifestModified = False
+        except OSError:
+            pass
+
+    def prune(self, keepPaths):
+        """Deletes cached variants other than the given ones, e.g. those of originals that have since changed.
+
+           Input: paths to keep [<str>]
+           Output: number of files deleted <int>
+        """
+        keep = set(os.path.abspath(path) for path in keepPaths)
+        numDeleted = 0
+        for entry in os.scandir(self.cacheDirectory):
+            if entry.name.endswith(".png") and (os.path.abspath(entry.path) not in keep):
+                os.remove(entry.path)
+                numDeleted += 1
+        return numDeleted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-scale results pictures into the image cache.")
+    parser.add_argument("--cache", help="cache directory (default: imageCache next to EastWestQuiz.py)")
+    parser.add_argument("--pack", help="take questionnaires and pictures from this pack instead of the loose files")
+    parser.add_argument("--ratios", type=float, nargs="+", default=defaultRatios, help="device pixel ratios to prepare (default 1 1.5 2)")
+    parser.add_argument("--prune", action="store_true", help="delete cached pictures that are no longer needed")
+    args = parser.parse_args(argv)
+
+    # Deferred so --help does not pay for the GUI module
+    import QuizGui
+    if (args.pack is not None):
+        from QuizPack import QuizPack
+        QuizGui.useAssetPack(QuizPack(args.pack))
+    questionnaires = QuizGui.loadQuestionnaires()
+    cache = ImageCache(args.cache or QuizGui.imageCacheDirectory, QuizGui.appDirectory, QuizGui.assetPack)
+
+    # Every picture the app scales, at the scale it shows it
+    wanted = [(QuizGui.MainWindow.authorPicScale, "img/authorPhoto.jpg")]
+    for index in range(0, questionnaires.getSize()):
+        for name in questionnaires.getResultsPics(index):
+            if ((QuizGui.ResultsLayout.picScale, name) not in wanted):
+                wanted.append((QuizGui.ResultsLayout.picScale, name))
+
+    prepared = []
+    for scale, name in wanted:
+        for ratio in args.ratios:
+            path = cache.prepare(name, scale, ratio)
+            if (path is None):
+                print("Skipped %s (missing or unreadable)" % name)
+                break
+            prepared.append(path)
+    cache.saveManifest()
+    print("%d pictures ready in %s" % (len(set(prepared)), cache.cacheDirectory))
+    if (args.prune):
+        print("%d stale pictures deleted" % cache.prune(prepared))
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+# Bulk import and scoring of respondent spreadsheets
+# Reads a CSV with one respondent per row and one column per question, such as a survey tool or a paper form
+# transcription produces, and scores every respondent the way MainWidget.tallyResults does. Header cells are matched
+# to questions by absID ("7", "q7", "Q7") or by the question's text; other columns are ignored, apart from an
+# optional respondent ID column. Each response must be an integer from -1 to 5 (empty = unanswered, -1), the range
+# loadProgress accepts; rows that break that rule are reported and skipped. Rows are read and scored in batches,
+# so memory stays the same however long the file is.
+
+from operator import itemgetter
+import numpy as np
+import argparse
+import time
+import csv
+import sys
+import re
+
+from QuizScoring import minResponse, maxResponse, westVerdict, eastVerdict
+
+# Respondents scored together
+batchRows = 8192
+# Rows between progress reports
+progressRows = 100000
+
+verdictNames = {westVerdict: "West", eastVerdict: "East"}
+
+
+class RespondentFileError(Exception):
+    """Raised when a respondent CSV cannot be imported at all (as opposed to single bad rows, which are reported)."""
+    pass
+
+
+def normalizeHeader(text):
+    """Lowercases a header cell and collapses whitespace and typographic quotes, for matching against question text."""
+    return " ".join(text.replace("’", "'").lower().split())
+
+
+def mapColumns(header, questions, idColumn=None):
+    """Works out which column holds each question.
+
+       Input: header row [<str>], questions ordered by absID, name of the respondent ID column <str> or None
+       Output: (column of each absID [<int> or None], ID column <int> or None, ignored header cells [<str>])
+    """
+    byText = {normalizeHeader(question[0]): question[3] for question in questions}
+    columns = [None] * len(questions)
+    idPosition = None
+    ignored = []
+    for position, cell in enumerate(header):
+        cell = cell.strip()
+        match = re.fullmatch(r"[qQ]?(\d+)", cell)
+        if (idColumn is not None) and (cell == idColumn):
+            idPosition = position
+            continue
+        if (match is not None) and (int(match.group(1)) < len(questions)):
+            absID = int(match.group(1))
+        else:
+            absID = byText.get(normalizeHeader(cell))
+        if (absID is None) or (columns[absID] is not None):
+            ignored.append(cell)
+        else:
+            columns[absID] = position
+    return columns, idPosition, ignored
+
+
+def parseRow(row, columns):
+    """Reads one respondent's answers.
+
+       Input: CSV row [<str>], column of each absID [<int> or None] (None = always unanswered)
+       Output: responses ordered by absID [<int>], or an error message <str>
+    """
+    responses = []
+    for absID, position in enumerate(columns):
+        if (position is None):
+            responses.append(-1)
+            continue
+        if (position >= len(row)):
+            return "too few columns (%d)" % len(row)
+        cell = row[position].strip()
+        if (cell == ""):
+            responses.append(-1)
+            continue
+        try:
+            response = int(cell)
+        except ValueError:
+            return "question %d: %r is not a number" % (absID, cell)
+        if not (minResponse <= response <= maxResponse):
+            return "question %d: %d is not between %d and %d" % (absID, response, minResponse, maxResponse)
+        responses.append(response)
+    return responses
+
+
+class BatchScorer(object):
+    """Scores blocks of respondents at once: tallies, margin and verdict, with ties settled at random as in
+       QuizScoring.getVerdict. Totals over everything scored so far are kept for the summary.
+    """
+    def __init__(self, poles, seed=None):
+        self.isWest = (np.asarray(poles) == 0)
+        self.rng = np.random.default_rng(seed)
+        self.numScored = 0
+        self.numIncomplete = 0
+        self.verdictCounts = {westVerdict: 0, eastVerdict: 0}
+        self.numTies = 0
+
+    def score(self, responses):
+        """Input: responses <np.ndarray (respondents x questions) of int8>
+           Output: (west tallies, east tallies, verdicts; 0 = incomplete) <np.ndarray>
+        """
+        complete = (responses >= 0).all(axis=1)
+        answered = np.where(responses >= 0, responses, 0).astype(np.int32)
+        westTallies = answered[:, self.isWest].sum(axis=1)
+        eastTallies = answered[:, ~self.isWest].sum(axis=1)
+        verdicts = np.where(westTallies > eastTallies, westVerdict, eastVerdict)
+        ties = complete & (westTallies == eastTallies)
+        verdicts[ties] = self.rng.integers(westVerdict, eastVerdict + 1, size=int(ties.sum()))
+        verdicts[~complete] = 0
+
+        self.numScored += int(complete.sum())
+        self.numIncomplete += int((~complete).sum())
+        self.numTies += int(ties.sum())
+        for verdict in self.verdictCounts:
+            self.verdictCounts[verdict] += int((verdicts == verdict).sum())
+        return westTallies, eastTallies, verdicts
+
+
+def importResponses(infile, outfile, errfile, questions, idColumn=None, seed=None, progress=None):
+    """Streams respondents from a CSV, writes one score line per valid row and one error line per invalid row.
+
+       Input: CSV input, score output and error output (text files), questions ordered by absID,
+              respondent ID column name <str> or None, tie-break seed <int> or None,
+              progress callback (rows read <int>, errors <int>) or None
+       Output: {"rows", "errors", "scorer", "ignored", "missing"}; raises RespondentFileError if the header maps no questions
+    """
+    reader = csv.reader(infile)
+    try:
+        header = next(reader)
+    except StopIteration:
+        raise RespondentFileError("empty file")
+    columns, idPosition, ignored = mapColumns(header, questions, idColumn)
+    if (idColumn is not None) and (idPosition is None):
+        raise RespondentFileError("no column named %r" % idColumn)
+    if all(position is None for position in columns):
+        raise RespondentFileError("no column matches a question (use absIDs such as q0, q1, ... or the question text)")
+    missing = [absID for absID, position in enumerate(columns) if position is None]
+
+    scorer = BatchScorer([question[1] for question in questions], seed)
+    scores = csv.writer(outfile)
+    scores.writerow(["respondent", "west", "east", "margin", "verdict"])
+    errors = csv.writer(errfile)
+    errors.writerow(["line", "respondent", "error"])
+
+    numRows = 0
+    numErrors = 0
+    batch = []                  # [[respondent, responses]]
+
+    def flush():
+        responses = np.array([entry[1] for entry in batch], dtype=np.int8).reshape(len(batch), len(questions))
+        westTallies, eastTallies, verdicts = scorer.score(responses)
+        scores.writerows([entry[0], int(west), int(east), int(west - east), verdictNames.get(int(verdict), "incomplete")]
+                         for entry, west, east, verdict in zip(batch, westTallies, eastTallies, verdicts))
+        del batch[:]
+
+    for row in reader:
+        # Blank lines (often trailing ones) are not respondents
+        if not (any(cell.strip() for cell in row)):
+            continue
+        numRows += 1
+        # Line numbers count the header, as a spreadsheet would show them
+        line = reader.line_num
+        respondent = row[idPosition].strip() if (idPosition is not None) and (idPosition < len(row)) else str(line)
+        responses = parseRow(row, columns)
+        if (isinstance(responses, str)):
+            errors.writerow([line, respondent, responses])
+            numErrors += 1
+        else:
+            batch.append([respondent, responses])
+            if (len(batch) >= batchRows):
+                flush()
+        if (progress is not None) and (numRows % progressRows == 0):
+            progress(numRows, numErrors)
+    if (batch):
+        flush()
+    return {"rows": numRows, "errors": numErrors, "scorer": scorer, "ignored": ignored, "missing": missing}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV of respondents (one per row, one column per question).")
+    parser.add_argument("csv", help="respondent CSV; its header names each question by absID (q0, q1, ...) or by its text")
+    parser.add_argument("--questionnaire", type=int, default=0, help="questionnaire index (default 0)")
+    parser.add_argument("--id-column", help="column holding a respondent ID (default: the row's line number)")
+    parser.add_argument("--output", default="-", help="scores CSV to write (default stdout)")
+    parser.add_argument("--errors", default="-", help="CSV of rejected rows and why (default stderr)")
+    parser.add_argument("--seed", type=int, help="seed for settling ties, for repeatable runs")
+    args = parser.parse_args(argv)
+
+    from QuizCatalogue import questionnairesArray
+    questionnaires = questionnairesArray()
+    if not (0 <= args.questionnaire < questionnaires.getSize()):
+        parser.error("no questionnaire with index %d" % args.questionnaire)
+    questions = sorted(questionnaires.getQuestions(args.questionnaire), key=itemgetter(3))
+
+    start = time.time()
+    def progress(numRows, numErrors):
+        print("%d rows, %d rejected (%.0f rows/s)" % (numRows, numErrors, numRows / max(time.time() - start, 1e-9)), file=sys.stderr)
+
+    openFiles = []
+    try:
+        infile = open(args.csv, 'r', newline='', encoding="utf-8-sig")
+        openFiles.append(infile)
+        outfile = sys.stdout if (args.output == "-") else open(args.output, 'w', newline='')
+        errfile = sys.stderr if (args.errors == "-") else open(args.errors, 'w', newline='')
+        openFiles += [handle for handle in (outfile, errfile) if handle not in (sys.stdout, sys.stderr)]
+        result = importResponses(infile, outfile, errfile, questions, args.id_column, args.seed, progress)
+    except (OSError, UnicodeDecodeError, csv.Error, RespondentFileError) as error:
+        print("Error: %s" % error, file=sys.stderr)
+        return 1
+    finally:
+        for handle in openFiles:
+            handle.close()
+
+    scorer = result["scorer"]
+    if (result["ignored"]):
+        print("Ignored columns: %s" % ", ".join(result["ignored"]), file=sys.stderr)
+    if (result["missing"]):
+        print("No column for questions %s; they count as unanswered" % ", ".join(map(str, result["missing"])), file=sys.stderr)
+    print("%d rows: %d scored (West %d, East %d, %d ties settled at random), %d incomplete, %d rejected"
+          % (result["rows"], scorer.numScored, scorer.verdictCounts[westVerdict], scorer.verdictCounts[eastVerdict],
+             scorer.numTies, scorer.numIncomplete, result["errors"]), file=sys.stderr)
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+# Item analysis for questionnaire banks
+# Scores every question the way MainWidget.tallyResults does (0-5 points added to the question's pole) and
+# measures how well each one agrees with the rest of its questionnaire: corrected item-total correlation,
+# pole consistency and Cronbach's alpha (overall and with the item deleted). The response matrix is read
+# in row chunks and reduced to per-item integer sums, so a million sessions by thousands of items never has
+# to be in memory at once.
+
+from operator import itemgetter
+import numpy as np
+import argparse
+import sys
+import os
+
+# Rows per chunk are chosen so a chunk holds roughly this many answers
+chunkElements = 1 << 22
+# Items whose corrected item-total correlation falls below this are flagged for pruning
+pruneThreshold = 0.2
+
+
+class ItemStatistics(object):
+    """Chunked accumulator of per-item statistics over a (sessions x items) response matrix.
+       Columns are ordered by absID; responses are -1 (unanswered) or 0-5. Sessions with any unanswered
+       question are skipped, since tallyResults only scores completed quizzes.
+
+       Each question's signed score is +response for West questions and -response for East questions,
+       so a session's total is its west - east margin.
+    """
+    def __init__(self, poles):
+        # Pole flags ordered by absID; 0 = West, 1 = East
+        self.poles = np.asarray(poles, dtype=np.int8)
+        self.signs = np.where(self.poles == 0, 1, -1).astype(np.int32)
+        numItems = len(self.poles)
+
+        # Exact integer sums; everything else is derived from these in getReport()
+        self.numSessions = 0
+        self.numSkipped = 0
+        self.sumScores = np.zeros(numItems, dtype=np.int64)
+        self.sumSquares = np.zeros(numItems, dtype=np.int64)
+        self.sumCross = np.zeros(numItems, dtype=np.int64)       # sum of score * total
+        self.sumTotal = 0
+        self.sumTotalSquares = 0
+        self.numDecided = 0                                      # completed sessions that were not ties
+        self.numConsistent = np.zeros(numItems, dtype=np.int64)
+
+    def addChunk(self, responses):
+        """Folds a block of sessions into the sums.
+
+           Input: responses <array-like (sessions x items)>
+           Output: none
+        """
+        responses = np.asarray(responses)
+        complete = (responses >= 0).all(axis=1)
+        self.numSkipped += int(responses.shape[0] - complete.sum())
+        responses = responses[complete].astype(np.int32)
+        if (responses.shape[0] == 0):
+            return
+
+        scores = responses * self.signs
+        totals = scores.sum(axis=1, dtype=np.int64)
+
+        self.numSessions += responses.shape[0]
+        self.sumScores += scores.sum(axis=0, dtype=np.int64)
+        self.sumSquares += (scores * scores).sum(axis=0, dtype=np.int64)
+        self.sumCross += (scores * totals[:, None]).sum(axis=0, dtype=np.int64)
+        self.sumTotal += int(totals.sum())
+        self.sumTotalSquares += int((totals * totals).sum())
+
+        # Pole consistency: agreeing (3-5) with a question whose pole won, or disagreeing (0-2) with one whose pole lost
+        decided = totals != 0
+        verdictEast = (totals < 0)[decided]
+        agrees = responses[decided] >= 3
+        self.numDecided += int(decided.sum())
+        self.numConsistent += (agrees == (verdictEast[:, None] == (self.poles == 1))).sum(axis=0, dtype=np.int64)
+
+    def addMatrix(self, matrix):
+        """Folds a full (possibly memory-mapped) response matrix in, one chunk of rows at a time.
+
+           Input: matrix <array-like (sessions x items)>
+           Output: none
+        """
+        rowsPerChunk = max(1, chunkElements // max(1, matrix.shape[1]))
+        for start in range(0, matrix.shape[0], rowsPerChunk):
+            self.addChunk(matrix[start:start + rowsPerChunk])
+
+    def getAlpha(self):
+        """Returns Cronbach's alpha over all items, or nan if it is undefined."""
+        numItems = len(self.poles)
+        itemVars, totalVar = self.getVariances()[:2]
+        if (numItems < 2) or (totalVar == 0):
+            return float("nan")
+        return numItems / (numItems - 1) * (1 - itemVars.sum() / totalVar)
+
+    def getVariances(self):
+        """Returns (item variances, total variance, item-total covariances) from the accumulated sums."""
+        n = max(1, self.numSessions)
+        means = self.sumScores / n
+        itemVars = self.sumSquares / n - means * means
+        totalMean = self.sumTotal / n
+        totalVar = self.sumTotalSquares / n - totalMean * totalMean
+        covariances = self.sumCross / n - means * totalMean
+        return itemVars, totalVar, covariances
+
+    def getReport(self):
+        """Computes per-item statistics.
+
+           Input: none
+           Output: {"itemTotal": corrected item-total correlation per item,
+                    "consistency": share of decided sessions where the item leaned toward the verdict,
+                    "alphaIfDeleted": Cronbach's alpha with the item removed} <np.ndarray each>
+        """
+        numItems = len(self.poles)
+        itemVars, totalVar, covariances = self.getVariances()
+
+        # Item versus the rest of the questionnaire, so an item is not correlated with itself
+        restVars = totalVar - 2 * covariances + itemVars
+        restCovariances = covariances - itemVars
+        with np.errstate(divide="ignore", invalid="ignore"):
+            itemTotal = restCovariances / np.sqrt(itemVars * restVars)
+            consistency = self.numConsistent / self.numDecided if self.numDecided else np.full(numItems, np.nan)
+            if (numItems > 2):
+                alphaIfDeleted = (numItems - 1) / (numItems - 2) * (1 - (itemVars.sum() - itemVars) / restVars)
+            else:
+                alphaIfDeleted = np.full(numItems, np.nan)
+        return {"itemTotal": itemTotal, "consistency": consistency, "alphaIfDeleted": alphaIfDeleted}
+
+
+def loadSavesMatrix(directory, index, questionnaires):
+    """Builds a response matrix from every valid save file for one questionnaire in a directory.
+
+       Input: directory <str>, questionnaire index <int>, questionnaires <questionnairesArray>
+       Output: responses <np.ndarray (sessions x items) of int8>
+    """
+    from QuizSessions import readSession, isSessionFile
+    rows = []
+    for name in sorted(os.listdir(directory)):
+        if isSessionFile(name):
+            session = readSession(os.path.join(directory, name), questionnaires)
+            if (session is not None) and (session[0] == index):
+                rows.append(session[1])
+    return np.array(rows, dtype=np.int8).reshape(len(rows), len(questionnaires.getQuestions(index)))
+
+
+def formatReport(statistics, questions):
+    """Formats a report ranked from weakest to strongest item; weakest items are pruning candidates.
+
+       Input: statistics <ItemStatistics>, questions ordered by absID [[text, pole, response, absID]]
+       Output: report lines [<str>]
+    """
+    report = statistics.getReport()
+    alpha = statistics.getAlpha()
+    # nan sorts last with argsort, which is where undefined items belong
+    order = np.argsort(report["itemTotal"], kind="stable")
+
+    lines = ["%d complete sessions (%d incomplete skipped), %d items, alpha = %.3f"
+             % (statistics.numSessions, statistics.numSkipped, len(questions), alpha),
+             "rank  absID  pole  item-total  consistency  alpha-if-deleted  prune  question"]
+    for rank, absID in enumerate(order):
+        itemTotal = report["itemTotal"][absID]
+        alphaIfDeleted = report["alphaIfDeleted"][absID]
+        prune = (itemTotal < pruneThreshold) or (alphaIfDeleted > alpha)
+        lines.append("%4d  %5d  %-4s  %10.3f  %11.3f  %16.3f  %-5s  %s"
+                     % (rank + 1, absID, "East" if questions[absID][1] else "West", itemTotal,
+                        report["consistency"][absID], alphaIfDeleted, "yes" if prune else "", questions[absID][0]))
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank questions by how well they predict the quiz outcome.")
+    parser.add_argument("--questionnaire", type=int, default=0, help="questionnaire index (default 0)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--matrix", help=".npy response matrix, sessions x items in absID order (memory-mapped)")
+    source.add_argument("--saves", help="directory of save files (.txt, .txt.gz, .txt.xz)")
+    source.add_argument("--export", help=".npz session archive written by QuizExport.py (memory-mapped)")
+    args = parser.parse_args(argv)
+
+    from QuizCatalogue import questionnairesArray
+    questionnaires = questionnairesArray()
+    if not (0 <= args.questionnaire < questionnaires.getSize()):
+        parser.error("no questionnaire with index %d" % args.questionnaire)
+    questions = sorted(questionnaires.getQuestions(args.questionnaire), key=itemgetter(3))
+
+    if args.matrix:
+        matrix = np.load(args.matrix, mmap_mode="r")
+    elif args.export:
+        from QuizExport import openExport, ExportError
+        try:
+            matrix = openExport(args.export).get("answers_%d" % args.questionnaire, np.empty((0, len(questions)), dtype=np.int8))
+        except ExportError as error:
+            print("Error: %s" % error)
+            return 1
+    else:
+        matrix = loadSavesMatrix(args.saves, args.questionnaire, questionnaires)
+    if (matrix.ndim != 2) or (matrix.shape[1] != len(questions)):
+        print("Error: matrix must have one column per question (%d)." % len(questions))
+        return 1
+
+    statistics = ItemStatistics([question[1] for question in questions])
+    statistics.addMatrix(matrix)
+    print("\n".join(formatReport(statistics, questions)))
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
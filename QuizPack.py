@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+# Single-file questionnaire packs
+# A pack holds a whole deployment: every questionnaire definition plus the images and icons the app shows.
+# The file is opened once and memory-mapped. A small table of contents at the end gives the offset and length
+# of each quiz and each image, so a quiz is parsed only when it is first used and an image is read straight out
+# of the mapping; nothing is extracted to disk.
+#
+# Layout (all integers little-endian):
+#   header   magic "QZPK", version <uint32>, table of contents offset <uint64>, table of contents length <uint64>
+#   blobs    one UTF-8 JSON document per quiz, then the raw bytes of each asset, back to back
+#   toc      UTF-8 JSON: {"quizzes": [{"title", "shortTitle", "description", "offset", "length"}],
+#                         "assets": {name: [offset, length]}}
+
+import argparse
+import struct
+import json
+import mmap
+import sys
+import os
+
+packMagic = b"QZPK"
+packVersion = 1
+headerFormat = "<4sIQQ"
+headerSize = struct.calcsize(headerFormat)
+
+# Images every deployment needs besides the results pictures, relative to the application directory
+appAssets = ["mainIcon.jpeg", "application-exit.png", "document-save.png", "document-open.png", "document-import.png",
+             "help-about.png", "view-refresh.png", "img/authorPhoto.jpg"]
+
+
+class PackError(Exception):
+    """Raised when a file is not a readable questionnaire pack."""
+    pass
+
+
+class QuizPack(object):
+    """Read-only, memory-mapped view of a pack file.
+
+       Quiz metadata (titles, descriptions) comes from the table of contents; the rest of a quiz is parsed
+       from its own blob on first use. Assets are returned as bytes sliced from the mapping.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as INFILE:
+            try:
+                self.data = mmap.mmap(INFILE.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise PackError("%s: empty file" % path)
+        try:
+            magic, version, tocOffset, tocLength = struct.unpack_from(headerFormat, self.data, 0)
+            if (magic != packMagic):
+                raise PackError("%s: not a questionnaire pack" % path)
+            if (version != packVersion):
+                raise PackError("%s: unsupported pack version %d" % (path, version))
+            if (tocOffset + tocLength > len(self.data)):
+                raise PackError("%s: truncated" % path)
+            toc = json.loads(self.data[tocOffset:tocOffset + tocLength].decode("utf-8"))
+            self.quizzes = toc["quizzes"]
+            self.assets = toc["assets"]
+        except (struct.error, ValueError, KeyError) as error:
+            self.data.close()
+            raise PackError("%s: damaged table of contents (%s)" % (path, error))
+
+    def close(self):
+        self.data.close()
+
+    def getSize(self):
+        """Returns the number of questionnaires in the pack."""
+        return len(self.quizzes)
+
+    def getQuizInfo(self, index):
+        """Returns the table of contents entry of a questionnaire: {"title", "shortTitle", "description", ...}."""
+        return self.quizzes[index]
+
+    def readQuiz(self, index):
+        """Parses one questionnaire's definition from its blob.
+
+           Input: questionnaire index <int>
+           Output: {"questions", "resultsTitles", "resultsTexts", "resultsPics"}
+        """
+        entry = self.quizzes[index]
+        return json.loads(self.data[entry["offset"]:entry["offset"] + entry["length"]].decode("utf-8"))
+
+    def hasAsset(self, name):
+        return name in self.assets
+
+    def getAsset(self, name):
+        """Returns an asset's bytes, sliced straight from the mapping.
+
+           Input: asset name, e.g. "img/WestCoastEDIT.jpg" <str>
+           Output: contents <bytes>
+        """
+        offset, length = self.assets[name]
+        return self.data[offset:offset + length]
+
+
+class PackedQuestionnaires(object):
+    """Same interface as questionnairesArray, backed by a QuizPack. Each questionnaire's questions and results are
+       read from the pack the first time they are asked for and kept afterwards, so getQuestions() hands out the
+       same list each time, as questionnairesArray does.
+    """
+    def __init__(self, pack):
+        self.pack = pack
+        self.loaded = {}
+        self.shortTitles = [entry["shortTitle"] for entry in pack.quizzes]
+        self.descriptions = [entry["description"] for entry in pack.quizzes]
+
+    def getQuiz(self, index):
+        if (index not in self.loaded):
+            quiz = self.pack.readQuiz(index)
+            # Stored without the response column; add it back as "unanswered", as in questionnairesArray
+            quiz["questions"] = [[text, pole, -1, absID] for text, pole, absID in quiz["questions"]]
+            self.loaded[index] = quiz
+        return self.loaded[index]
+
+    def getSize(self):
+        return self.pack.getSize()
+
+    def getAllShortTitles(self):
+        return self.shortTitles
+
+    def getQuestions(self, index):
+        return self.getQuiz(index)["questions"]
+
+    def getQuizTitle(self, index):
+        return self.pack.getQuizInfo(index)["title"]
+
+    def getAllDescriptions(self):
+        return self.descriptions
+
+    def getQuizDescription(self, index):
+        return self.descriptions[index]
+
+    def getResultsTitles(self, index):
+        return self.getQuiz(index)["resultsTitles"]
+
+    def getResultsTexts(self, index):
+        return self.getQuiz(index)["resultsTexts"]
+
+    def getResultsPics(self, index):
+        return self.getQuiz(index)["resultsPics"]
+
+
+def writePack(path, questionnaires, assetDirectory, extraAssets=appAssets):
+    """Writes every questionnaire, its results pictures and the given app assets into one pack file.
+       The pack is written to a temporary file and renamed over the target, so a running kiosk never sees half of it.
+
+       Input: path <str>, questionnaires <questionnairesArray>, directory asset names are relative to <str>,
+              extra asset names [<str>]
+       Output: (number of quizzes, number of assets) <int>
+    """
+    blobs = []
+    quizzes = []
+    assetNames = []
+    for index in range(0, questionnaires.getSize()):
+        quiz = {"questions": [[question[0], question[1], question[3]] for question in sorted(questionnaires.getQuestions(index), key=lambda question: question[3])],
+                "resultsTitles": questionnaires.getResultsTitles(index),
+                "resultsTexts": questionnaires.getResultsTexts(index),
+                "resultsPics": questionnaires.getResultsPics(index)}
+        blobs.append(json.dumps(quiz).encode("utf-8"))
+        quizzes.append({"title": questionnaires.getQuizTitle(index),
+                        "shortTitle": questionnaires.getAllShortTitles()[index],
+                        "description": questionnaires.getQuizDescription(index)})
+        assetNames += [name for name in quiz["resultsPics"] if name not in assetNames]
+    assetNames += [name for name in extraAssets if name not in assetNames]
+
+    assets = {}
+    temporaryPath = path + ".tmp"
+    with open(temporaryPath, 'wb') as OUTFILE:
+        OUTFILE.write(b"\0" * headerSize)
+        for entry, blob in zip(quizzes, blobs):
+            entry["offset"] = OUTFILE.tell()
+            entry["length"] = len(blob)
+            OUTFILE.write(blob)
+        for name in assetNames:
+            # Placeholders such as the test quiz's '0' are simply left out; the app shows no picture for them
+            assetPath = os.path.join(assetDirectory, name)
+            if not (os.path.isfile(assetPath)):
+                continue
+            with open(assetPath, 'rb') as INFILE:
+                contents = INFILE.read()
+            assets[name] = [OUTFILE.tell(), len(contents)]
+            OUTFILE.write(contents)
+
+        toc = json.dumps({"quizzes": quizzes, "assets": assets}).encode("utf-8")
+        tocOffset = OUTFILE.tell()
+        OUTFILE.write(toc)
+        OUTFILE.seek(0)
+        OUTFILE.write(struct.pack(headerFormat, packMagic, packVersion, tocOffset, len(toc)))
+    os.replace(temporaryPath, path)
+    return len(quizzes), len(assets)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or inspect single-file questionnaire packs.")
+    commands = parser.add_subparsers(dest="command")
+    build = commands.add_parser("build", help="pack the built-in questionnaires and their images")
+    build.add_argument("pack", help="pack file to write")
+    build.add_argument("--assets", default=os.path.dirname(os.path.abspath(__file__)),
+                       help="directory image names are relative to (default: this script's directory)")
+    listing = commands.add_parser("list", help="list a pack's questionnaires and assets")
+    listing.add_argument("pack", help="pack file to read")
+    args = parser.parse_args(argv)
+
+    if (args.command == "build"):
+        # Deferred so --help does not pay for building the catalogue
+        from QuizCatalogue import questionnairesArray
+        numQuizzes, numAssets = writePack(args.pack, questionnairesArray(), args.assets)
+        print("%s: %d questionnaires, %d assets, %d bytes" % (args.pack, numQuizzes, numAssets, os.path.getsize(args.pack)))
+    elif (args.command == "list"):
+        try:
+            pack = QuizPack(args.pack)
+        except (OSError, PackError) as error:
+            print("Error: %s" % error)
+            return 1
+        for index in range(0, pack.getSize()):
+            entry = pack.getQuizInfo(index)
+            print("[%d] %s (%d bytes at %d)" % (index, entry["shortTitle"], entry["length"], entry["offset"]))
+        for name, (offset, length) in sorted(pack.assets.items()):
+            print("    %s (%d bytes at %d)" % (name, length, offset))
+        pack.close()
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Questionnaire scoring
+# Every answer adds its button value (0-5) to the tally of its question's pole, West (0) or East (1); the larger
+# tally wins and a tie is settled at random. Shared by the GUI (MainWidget.tallyResults and early decisions), the
+# headless runner and the analytics tools, and free of Qt so those can use it without loading the GUI.
+
+import random
+
+# Response values stored in save files; -1 = unanswered, 0-5 = which button was pressed
+minResponse = -1
+maxResponse = 5
+# Most points a single answer can add to its tally
+maxPoints = 5
+
+# Verdicts, as passed to MainWidget.showVerdict; the results page shown is verdict - 1
+westVerdict = 1
+eastVerdict = 2
+
+
+def tallyResponses(poles, responses):
+    """Adds up the West and East tallies of a completed questionnaire.
+
+       Input: pole of each question [<int>] (0 = West, 1 = East), responses in the same order [<int>]
+       Output: (west tally <int>, east tally <int>), or None if any question is unanswered
+    """
+    westTally = 0
+    eastTally = 0
+    for pole, pressed in zip(poles, responses):
+        if (pressed == -1):
+            return None
+        elif (pole == 0):
+            westTally += pressed
+        elif (pole == 1):
+            eastTally += pressed
+    return westTally, eastTally
+
+
+def getVerdict(westTally, eastTally, rng=random):
+    """Declares the winner of two tallies; a tie is settled at random.
+
+       Input: west tally <int>, east tally <int>, random number generator
+       Output: verdict <int> (1 = West, 2 = East)
+    """
+    if (eastTally == westTally):
+        return rng.randint(westVerdict, eastVerdict)
+    elif (eastTally > westTally):
+        return eastVerdict
+    else:
+        return westVerdict
+
+
+def getDecidedVerdict(poles, responses):
+    """Compares the current West/East margin with the largest swing the unanswered questions could still cause.
+       Ties are settled randomly, so a lead only counts as decided if it is strictly larger than that swing.
+
+       Input: pole of each question [<int>], responses in the same order [<int>]
+       Output: verdict that can no longer change <int> (1 = West, 2 = East), or 0 if it is still open
+    """
+    westTally = 0
+    eastTally = 0
+    westRemaining = 0       # Unanswered questions that could still add to the West tally
+    eastRemaining = 0       # ... and to the East tally
+    for pole, pressed in zip(poles, responses):
+        if (pressed == -1):
+            if (pole == 0):
+                westRemaining += 1
+            else:
+                eastRemaining += 1
+        elif (pole == 0):
+            westTally += pressed
+        else:
+            eastTally += pressed
+
+    if (westTally > eastTally + maxPoints * eastRemaining):
+        return westVerdict
+    elif (eastTally > westTally + maxPoints * westRemaining):
+        return eastVerdict
+    else:
+        return 0
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+# Full-text search across questionnaires
+# An inverted index from words to the places they appear: quiz titles, short titles, descriptions, question text
+# and results titles/text. Each questionnaire is indexed separately under a fingerprint of its text, so an update
+# only re-indexes questionnaires that were added or changed. The index is saved as JSON next to the catalogue and
+# answers keyword queries (every word must appear) and prefix queries ("boat sho*") with set intersections and a
+# bisect over the sorted vocabulary.
+
+from operator import itemgetter
+from bisect import bisect_left
+import argparse
+import tempfile
+import hashlib
+import json
+import sys
+import os
+import re
+
+# Saved next to the module that holds the catalogue
+defaultIndexPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "searchIndex.json")
+# Bumped whenever the saved layout or tokenizer changes; older files are rebuilt from scratch
+indexVersion = 1
+# Score of a match in each field; a hit in a title counts for more than one in a question
+fieldWeights = {"title": 4, "shortTitle": 4, "description": 2, "resultTitle": 2, "resultText": 1, "question": 1}
+
+wordPattern = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+
+def tokenize(text):
+    """Splits text into lowercase words; apostrophes inside a word are dropped ("you'd" -> "youd").
+
+       Input: text <str>
+       Output: words [<str>]
+    """
+    return [word.replace("'", "") for word in wordPattern.findall(text.lower().replace("’", "'"))]
+
+
+def getQuestionnaireFields(questionnaires, index):
+    """Lists every searchable piece of text in a questionnaire.
+
+       Input: questionnaires <questionnairesArray>, questionnaire index <int>
+       Output: [[field <str>, item <int>, text <str>]]; item is the absID for questions, the results page otherwise
+    """
+    fields = [["title", 0, questionnaires.getQuizTitle(index)],
+              ["shortTitle", 0, questionnaires.getAllShortTitles()[index]],
+              ["description", 0, questionnaires.getQuizDescription(index)]]
+    for pageID, (title, text) in enumerate(zip(questionnaires.getResultsTitles(index), questionnaires.getResultsTexts(index))):
+        fields.append(["resultTitle", pageID, title])
+        fields.append(["resultText", pageID, text])
+    # By absID, since the questions themselves are shuffled in place and carry the current answers
+    for question in sorted(questionnaires.getQuestions(index), key=itemgetter(3)):
+        fields.append(["question", question[3], question[0]])
+    return fields
+
+
+class SearchIndex(object):
+    """Inverted index over one or more questionnaires.
+
+       docs:         {document ID: [questionnaire index, field, item, text]}
+       postings:     {word: set of document IDs containing it}
+       fingerprints: {questionnaire index: hash of its indexed text}
+    """
+    def __init__(self):
+        self.docs = {}
+        self.postings = {}
+        self.fingerprints = {}
+        self.questionnaireDocs = {}         # {questionnaire index: [document IDs]}
+        self.nextDocID = 0
+        self.sortedTerms = None             # Vocabulary in sorted order for prefix lookups; rebuilt after changes
+        self.isModified = False
+
+    def addQuestionnaire(self, index, fields, fingerprint):
+        """Indexes one questionnaire's text.
+
+           Input: questionnaire index <int>, fields as from getQuestionnaireFields(), fingerprint <str>
+           Output: none
+        """
+        docIDs = []
+        for field, item, text in fields:
+            docID = self.nextDocID
+            self.nextDocID += 1
+            self.docs[docID] = [index, field, item, text]
+            for word in set(tokenize(text)):
+                self.postings.setdefault(word, set()).add(docID)
+            docIDs.append(docID)
+        self.questionnaireDocs[index] = docIDs
+        self.fingerprints[index] = fingerprint
+        self.sortedTerms = None
+        self.isModified = True
+
+    def removeQuestionnaire(self, index):
+        """Drops everything indexed for a questionnaire, e.g. before re-indexing its changed text."""
+        for docID in self.questionnaireDocs.pop(index, []):
+            for word in set(tokenize(self.docs.pop(docID)[3])):
+                postings = self.postings.get(word)
+                if (postings is not None):
+                    postings.discard(docID)
+                    if not (postings):
+                        del self.postings[word]
+        self.fingerprints.pop(index, None)
+        self.sortedTerms = None
+        self.isModified = True
+
+    def update(self, questionnaires):
+        """Brings the index up to date with the catalogue, re-indexing only questionnaires whose text has changed.
+
+           Input: questionnaires <questionnairesArray>
+           Output: number of questionnaires (re)indexed <int>
+        """
+        numIndexed = 0
+        for index in range(0, questionnaires.getSize()):
+            fields = getQuestionnaireFields(questionnaires, index)
+            fingerprint = hashlib.sha1(json.dumps(fields).encode("utf-8")).hexdigest()
+            if (self.fingerprints.get(index) != fingerprint):
+                self.removeQuestionnaire(index)
+                self.addQuestionnaire(index, fields, fingerprint)
+                numIndexed += 1
+        # Questionnaires that no longer exist
+        for index in [index for index in self.fingerprints if index >= questionnaires.getSize()]:
+            self.removeQuestionnaire(index)
+        return numIndexed
+
+    def getMatchingDocs(self, word, isPrefix):
+        """Returns the IDs of documents containing the word, or any word starting with it if isPrefix."""
+        if not (isPrefix):
+            return self.postings.get(word, set())
+        if (self.sortedTerms is None):
+            self.sortedTerms = sorted(self.postings)
+        matches = set()
+        position = bisect_left(self.sortedTerms, word)
+        while (position < len(self.sortedTerms)) and self.sortedTerms[position].startswith(word):
+            matches |= self.postings[self.sortedTerms[position]]
+            position += 1
+        return matches
+
+    def search(self, query, prefixLast=False):
+        """Finds the documents containing every word of the query. A word ending in "*" matches as a prefix,
+           as does the last word when prefixLast is set (for searching as the user types).
+
+           Input: query <str>, prefixLast <bool>
+           Output: [[questionnaire index, field, item, text]] ordered by field weight, then questionnaire and item
+        """
+        rawWords = query.split()
+        matches = None
+        for position, rawWord in enumerate(rawWords):
+            isPrefix = rawWord.endswith("*") or (prefixLast and position == len(rawWords) - 1)
+            for word in tokenize(rawWord):
+                docIDs = self.getMatchingDocs(word, isPrefix)
+                matches = set(docIDs) if (matches is None) else (matches & docIDs)
+                if not (matches):
+                    return []
+        if (matches is None):
+            return []
+        results = [self.docs[docID] for docID in matches]
+        results.sort(key=lambda doc: (-fieldWeights[doc[1]], doc[0], doc[2]))
+        return results
+
+    def searchQuestionnaires(self, query, prefixLast=False):
+        """Ranks questionnaires by how well they match: the summed field weights of their matching documents.
+
+           Input: query <str>, prefixLast <bool>
+           Output: questionnaire indexes, best match first [<int>]
+        """
+        scores = {}
+        for index, field, item, text in self.search(query, prefixLast):
+            scores[index] = scores.get(index, 0) + fieldWeights[field]
+        return sorted(scores, key=lambda index: (-scores[index], index))
+
+    def save(self, path):
+        """Writes the index to a JSON file, through a temporary file renamed over it, so a reader never sees half an index.
+
+           Input: path <str>
+           Output: none; raises OSError
+        """
+        state = {"version": indexVersion,
+                 "nextDocID": self.nextDocID,
+                 "fingerprints": self.fingerprints,
+                 "questionnaireDocs": self.questionnaireDocs,
+                 "docs": self.docs,
+                 "postings": {word: sorted(docIDs) for word, docIDs in self.postings.items()}}
+        descriptor, temporaryPath = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                                     dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(descriptor, 'w') as OUTFILE:
+                json.dump(state, OUTFILE)
+            os.replace(temporaryPath, path)
+        except OSError:
+            try:
+                os.remove(temporaryPath)
+            except OSError:
+                pass
+            raise
+        self.isModified = False
+
+    def load(self, path):
+        """Restores an index written by save(). JSON turns integer keys into strings, so convert back.
+
+           Input: path <str>
+           Output: whether a usable index was read <bool>
+        """
+        try:
+            with open(path, 'r') as INFILE:
+                state = json.load(INFILE)
+            if (state.get("version") != indexVersion):
+                return False
+            self.nextDocID = state["nextDocID"]
+            self.fingerprints = {int(index): fingerprint for index, fingerprint in state["fingerprints"].items()}
+            self.questionnaireDocs = {int(index): docIDs for index, docIDs in state["questionnaireDocs"].items()}
+            self.docs = {int(docID): doc for docID, doc in state["docs"].items()}
+            self.postings = {word: set(docIDs) for word, docIDs in state["postings"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.__init__()
+            return False
+        self.sortedTerms = None
+        self.isModified = False
+        return True
+
+
+def openSearchIndex(questionnaires, path=defaultIndexPath):
+    """Loads the saved index, re-indexes whatever has changed in the catalogue and saves it back if anything did.
+       A catalogue on read-only storage still gets a working (in-memory) index.
+
+       Input: questionnaires <questionnairesArray>, path <str>
+       Output: SearchIndex
+    """
+    searchIndex = SearchIndex()
+    searchIndex.load(path)
+    searchIndex.update(questionnaires)
+    if (searchIndex.isModified):
+        try:
+            searchIndex.save(path)
+        except OSError:
+            pass
+    return searchIndex
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search questionnaire titles, descriptions, questions and results.")
+    parser.add_argument("query", help='words that must all appear; end a word with * to match it as a prefix, e.g. "boat sho*"')
+    parser.add_argument("--index", default=defaultIndexPath, help="saved index file (default: searchIndex.json next to this script)")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the saved index and build it again")
+    parser.add_argument("--limit", type=int, default=20, help="most matches to print (default 20)")
+    args = parser.parse_args(argv)
+
+    # Deferred so --help does not pay for building the catalogue
+    from QuizCatalogue import questionnairesArray
+    questionnaires = questionnairesArray()
+    if (args.rebuild) and os.path.exists(args.index):
+        os.remove(args.index)
+    searchIndex = openSearchIndex(questionnaires, args.index)
+
+    results = searchIndex.search(args.query)
+    titles = questionnaires.getAllShortTitles()
+    for index, field, item, text in results[:args.limit]:
+        where = "%s %d" % (field, item) if field in ("question", "resultTitle", "resultText") else field
+        print("[%d] %s - %s: %s" % (index, titles[index], where, text.replace("\n", " ")))
+    if (len(results) > args.limit):
+        print("... %d more" % (len(results) - args.limit))
+    return 0 if results else 1
+
+if (__name__ == "__main__"):
+    sys.exit(main())
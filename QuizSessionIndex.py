@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+# Session index
+# Summaries of the save files in a directory, so the session browser can list tens of thousands of them without
+# reading each one: questionnaire, how many questions are answered, the West/East tallies so far, and the size and
+# modification time the summary was made from. Kept as JSON in that directory (.quizSessions.json). The GUI and the
+# headless runner record every save they write; a file that is new or has changed since it was summarized (copied
+# in, edited by hand) is read again the next time the directory is listed. Summaries are dropped when the
+# questionnaires change, since they depend on the questions' poles.
+
+import argparse
+import tempfile
+import json
+import time
+import sys
+import os
+
+from QuizSessions import loadSession, isSessionFile, getCatalogueHash, SessionError
+
+indexName = ".quizSessions.json"
+# Bumped whenever the saved layout changes; older files are rebuilt from scratch
+indexVersion = 1
+
+
+def summarizeSession(questionnaires, index, answers):
+    """Works out what the session browser shows about a session.
+
+       Input: questionnaires <questionnairesArray>, questionnaire index <int>, [[absID <int>, response <int>]]
+       Output: [questionnaire index <int>, questions answered <int>, number of questions <int>,
+                west tally so far <int>, east tally so far <int>]
+    """
+    poles = {question[3]: question[1] for question in questionnaires.getQuestions(index)}
+    answered = 0
+    tallies = [0, 0]
+    for absID, response in answers:
+        if (response != -1):
+            answered += 1
+            tallies[poles[absID]] += response
+    return [index, answered, len(answers), tallies[0], tallies[1]]
+
+
+def getLeaning(summary):
+    """Describes which way a session leans so far, e.g. "West by 7" or "Even".
+
+       Input: summary from summarizeSession()
+       Output: <str>
+    """
+    margin = summary[3] - summary[4]
+    if (margin > 0):
+        return "West by %d" % margin
+    elif (margin < 0):
+        return "East by %d" % -margin
+    return "Even"
+
+
+class SessionIndex(object):
+    """Summaries of the save files in one directory.
+
+       entries: {file name: [size, mtime_ns, summary from summarizeSession()]}; summary is None for a file that is
+                listed but not read yet, and [-1, reason <str>] for one that cannot be loaded
+    """
+    def __init__(self, directory, catalogueHash):
+        self.directory = directory
+        self.catalogueHash = catalogueHash
+        self.entries = {}
+        self.isModified = False
+
+    def getPath(self):
+        return os.path.join(self.directory, indexName)
+
+    def load(self):
+        """Restores the saved summaries; those made against other questionnaires are dropped.
+
+           Input: none
+           Output: whether a usable index was read <bool>
+        """
+        try:
+            with open(self.getPath(), 'r') as INFILE:
+                state = json.load(INFILE)
+            if (state.get("version") != indexVersion) or (state.get("catalogueHash") != self.catalogueHash):
+                return False
+            self.entries = state["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            self.entries = {}
+            return False
+        self.isModified = False
+        return True
+
+    def save(self):
+        """Writes the summaries back if anything changed. Written to a temporary file of its own and renamed, so a
+           reader never sees half an index and two writers never share a temporary file; a directory that cannot be
+           written to simply gets re-read next time.
+        """
+        if not (self.isModified):
+            return
+        try:
+            descriptor, temporaryPath = tempfile.mkstemp(prefix=indexName + ".", suffix=".tmp", dir=self.directory)
+        except OSError:
+            return
+        try:
+            with os.fdopen(descriptor, 'w') as OUTFILE:
+                json.dump({"version": indexVersion, "catalogueHash": self.catalogueHash, "entries": self.entries}, OUTFILE)
+            os.replace(temporaryPath, self.getPath())
+            self.isModified = False
+        except OSError:
+            try:
+                os.remove(temporaryPath)
+            except OSError:
+                pass
+
+    def scan(self):
+        """Lists the directory's save files, keeping the summaries of files that have not changed since and
+           forgetting files that are gone. Only the directory is read, not the files.
+
+           Input: none
+           Output: names of files that are new or have changed, and need refresh() [<str>]
+        """
+        stale = []
+        names = set()
+        try:
+            dirEntries = list(os.scandir(self.directory))
+        except OSError:
+            dirEntries = []
+        for dirEntry in dirEntries:
+            if not (isSessionFile(dirEntry.name)):
+                continue
+            try:
+                if not (dirEntry.is_file()):
+                    continue
+                stat = dirEntry.stat()
+            except OSError:
+                continue
+            names.add(dirEntry.name)
+            entry = self.entries.get(dirEntry.name)
+            if (entry is None) or (entry[0] != stat.st_size) or (entry[1] != stat.st_mtime_ns) or (entry[2] is None):
+                self.entries[dirEntry.name] = [stat.st_size, stat.st_mtime_ns, None]
+                stale.append(dirEntry.name)
+        for name in [name for name in self.entries if name not in names]:
+            del self.entries[name]
+            self.isModified = True
+        return stale
+
+    def refresh(self, name, questionnaires):
+        """Reads one file listed by scan() and records its summary.
+
+           Input: file name <str>, questionnaires <questionnairesArray>
+           Output: none
+        """
+        entry = self.entries.setdefault(name, [0, 0, None])
+        path = os.path.join(self.directory, name)
+        try:
+            stat = os.stat(path)
+            entry[0], entry[1] = stat.st_size, stat.st_mtime_ns
+            index, answers = loadSession(path, questionnaires)
+            entry[2] = summarizeSession(questionnaires, index, answers)
+        except SessionError as error:
+            entry[2] = [-1, error.detail]
+        except OSError as error:
+            # Gone since it was listed; the next scan() drops it
+            entry[2] = [-1, error.strerror]
+        self.isModified = True
+
+    def record(self, name, summary):
+        """Records the summary of a file that has just been written, without reading it back."""
+        try:
+            stat = os.stat(os.path.join(self.directory, name))
+        except OSError:
+            return
+        self.entries[name] = [stat.st_size, stat.st_mtime_ns, summary]
+        self.isModified = True
+
+
+def recordSession(path, summary, catalogueHash):
+    """Adds a save that has just been written to its directory's index. Failing to update the index is not an
+       error; the file is simply read the next time the directory is listed.
+
+       Input: path of the save file <str>, summary from summarizeSession(), catalogue hash from getCatalogueHash() <str>
+       Output: none
+    """
+    sessionIndex = SessionIndex(os.path.dirname(os.path.abspath(path)), catalogueHash)
+    sessionIndex.load()
+    sessionIndex.record(os.path.basename(path), summary)
+    sessionIndex.save()
+
+
+def openSessionIndex(directory, questionnaires):
+    """Loads a directory's index and brings it fully up to date, reading every new or changed file.
+
+       Input: directory <str>, questionnaires <questionnairesArray>
+       Output: (SessionIndex, number of files read <int>)
+    """
+    sessionIndex = SessionIndex(directory, getCatalogueHash(questionnaires))
+    sessionIndex.load()
+    stale = sessionIndex.scan()
+    for name in stale:
+        sessionIndex.refresh(name, questionnaires)
+    sessionIndex.save()
+    return sessionIndex, len(stale)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or update a directory's session index and list its sessions.")
+    parser.add_argument("directory", nargs="?", default=".", help="directory of save files (default: current)")
+    parser.add_argument("--quiet", action="store_true", help="only update the index, do not list the sessions")
+    args = parser.parse_args(argv)
+
+    if not (os.path.isdir(args.directory)):
+        parser.error("%s is not a directory" % args.directory)
+    # Deferred so --help does not pay for building the catalogue
+    from QuizCatalogue import questionnairesArray
+    questionnaires = questionnairesArray()
+    start = time.time()
+    sessionIndex, numRead = openSessionIndex(args.directory, questionnaires)
+    titles = questionnaires.getAllShortTitles()
+
+    if not (args.quiet):
+        for name, (size, mtime, summary) in sorted(sessionIndex.entries.items()):
+            modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime / 1e9))
+            if (summary[0] == -1):
+                print("%s  %s  unreadable: %s" % (name, modified, summary[1]))
+            else:
+                print("%s  %s  %s, %d/%d answered, %s" % (name, modified, titles[summary[0]], summary[1], summary[2], getLeaning(summary)))
+    print("%d sessions, %d read (%.2f s)" % (len(sessionIndex.entries), numRead, time.time() - start), file=sys.stderr)
+    return 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+# Session persistence
+# Reads and writes the save files of MainWidget.saveProgress/loadProgress. A save is a header line followed by one
+# "absID,response" line per question, in the order the questions were shown. A file is only accepted if every
+# question of the questionnaire appears exactly once with a response from -1 to 5. Free of Qt so the headless
+# runner and the analysis tools share the GUI's rules without loading it.
+#
+# Header (version 2): "index,v2,number of questions,questionnaire hash,body checksum", e.g. "0,v2,18,3f0c...,9a1b2c3d".
+# The questionnaire hash covers the text and pole of every question, so a save made before the questionnaire was
+# edited is recognized from the header alone. The checksum is the CRC-32 of everything after the header line; when
+# it matches, the body is exactly what the app wrote and is read without checking each line again. Otherwise (a
+# hand-edited file, or an old save whose header is just the questionnaire index) every line is validated.
+#
+# Saves are built in memory and written to a temporary file that is renamed over the target, so a crash part way
+# through leaves the previous save intact. They may be gzip or xz compressed (by file name: .txt.gz, .txt.xz);
+# loading recognizes either from the file's first bytes, whatever it is called.
+
+from operator import itemgetter
+import tempfile
+import hashlib
+import json
+import zlib
+import gzip
+import lzma
+import csv
+import io
+import os
+
+from QuizScoring import minResponse, maxResponse
+
+# Save file name endings and the compression each is written with
+sessionExtensions = [(".txt", None), (".txt.gz", "gzip"), (".txt.xz", "xz")]
+# Second header field of the current format; a header of the questionnaire index alone is the original format
+sessionVersion = "v2"
+# {id of a questions list: (that list, its hash)}; holding the list keeps its id from being reused
+questionnaireHashes = {}
+gzipMagic = b"\x1f\x8b"
+xzMagic = b"\xfd7zXZ\x00"
+
+
+class SessionError(Exception):
+    """Raised when a save file cannot be loaded. The message is the one shown to the user; detail says exactly
+       which rule the file broke (for QuizAudit and logs).
+    """
+    def __init__(self, message, detail=None):
+        Exception.__init__(self, message)
+        self.detail = detail if (detail is not None) else message
+
+
+def getQuestionnaireHash(questionnaires, index):
+    """Returns a short hash of a questionnaire's questions (text and pole, by absID), written into save headers.
+       Remembered per questions list; call forgetQuestionnaireHashes() after changing question text or poles in place.
+
+       Input: questionnaires <questionnairesArray>, questionnaire index <int>
+       Output: hash <str> (16 hex digits)
+    """
+    questions = questionnaires.getQuestions(index)
+    cached = questionnaireHashes.get(id(questions))
+    if (cached is not None) and (cached[0] is questions):
+        return cached[1]
+    text = json.dumps([[question[3], question[0], question[1]] for question in sorted(questions, key=itemgetter(3))])
+    quizHash = hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+    questionnaireHashes[id(questions)] = (questions, quizHash)
+    return quizHash
+
+
+def getCatalogueHash(questionnaires):
+    """Returns a hash of every questionnaire's questions; whatever was worked out from save files (audit results,
+       session summaries) is only reused while it is unchanged.
+
+       Input: questionnaires <questionnairesArray>
+       Output: hash <str> (40 hex digits)
+    """
+    hashes = [getQuestionnaireHash(questionnaires, index) for index in range(0, questionnaires.getSize())]
+    return hashlib.sha1(",".join(hashes).encode("utf-8")).hexdigest()
+
+
+def forgetQuestionnaireHashes():
+    """Drops every remembered questionnaire hash, e.g. after questionnaires have been edited in place."""
+    questionnaireHashes.clear()
+
+
+def getChecksum(body):
+    """Returns the checksum written into save headers: CRC-32 of the text after the header line, as 8 hex digits."""
+    return "%08x" % (zlib.crc32(body.encode("utf-8")) & 0xffffffff)
+
+
+def parseHeader(header, questionnaires):
+    """Validates a save file's header line.
+
+       Input: header fields [<str>], questionnaires <questionnairesArray>
+       Output: (questionnaire index <int>, body checksum <str> or None for the original format); raises SessionError
+    """
+    try:
+        index = int(header[0])
+    except (IndexError, ValueError):
+        raise SessionError("Error: savefile header invalid.", "header: %r is not a questionnaire index" % ",".join(header))
+    if not (len(header) == 1 or (len(header) == 5 and header[1] == sessionVersion)):
+        raise SessionError("Error: savefile header invalid or refers to nonexistent questionnaire.",
+                           "header: expected the questionnaire index alone or a %s header, found %r" % (sessionVersion, ",".join(header)))
+    if not (0 <= index < questionnaires.getSize()):
+        raise SessionError("Error: savefile header invalid or refers to nonexistent questionnaire.",
+                           "header: no questionnaire %d" % index)
+    if (len(header) == 1):
+        return index, None
+    numQuestions = len(questionnaires.getQuestions(index))
+    if (header[2] != str(numQuestions)) or (header[3] != getQuestionnaireHash(questionnaires, index)):
+        raise SessionError("Error: savefile was made for a different version of this questionnaire.",
+                           "header: questionnaire %d has changed since the save (%s questions then, %d now)" % (index, header[2], numQuestions))
+    return index, header[4]
+
+
+def parseBody(rows, numQuestions):
+    """Validates every line of a save file's body.
+
+       Input: rows as read by csv.reader [[<str>]], number of questions <int>
+       Output: [[absID <int>, response <int>]] in file order; raises SessionError
+    """
+    # Exactly one "absID,response" line per question
+    if (len(rows) != numQuestions):
+        raise SessionError("Error: savefile invalid.", "%d answer lines for %d questions" % (len(rows), numQuestions))
+    seen = [False] * numQuestions
+    answers = []
+    # Line numbers as an editor shows them, counting the header
+    for line, row in enumerate(rows, 2):
+        if (len(row) != 2):
+            raise SessionError("Error: savefile invalid.", "line %d: expected absID,response" % line)
+        try:
+            absID = int(row[0])
+            response = int(row[1])
+        except ValueError:
+            raise SessionError("Error: savefile invalid.", "line %d: %r is not two integers" % (line, ",".join(row)))
+        if not (0 <= absID < numQuestions):
+            raise SessionError("Error: savefile invalid.", "line %d: no question with absID %d" % (line, absID))
+        if not (minResponse <= response <= maxResponse):
+            raise SessionError("Error: savefile invalid.", "line %d: response %d is not between %d and %d" % (line, response, minResponse, maxResponse))
+        if (seen[absID]):
+            raise SessionError("Error: savefile invalid.", "line %d: absID %d appears twice" % (line, absID))
+        seen[absID] = True
+        answers.append([absID, response])
+    return answers
+
+
+def parseSession(text, questionnaires, trustChecksum=True):
+    """Reads a save file's text. Bodies whose checksum matches the header only get cheap checks (absIDs each once,
+       responses in range), since the checksum proves the body is what was written, not that it was valid; any other
+       body is fully validated, as is one that fails those checks, so its error says what is wrong.
+
+       Input: text <str>, questionnaires <questionnairesArray>, whether a matching checksum may skip full validation <bool>
+       Output: (questionnaire index <int>, [[absID <int>, response <int>]] in file order); raises SessionError
+    """
+    headerLine, newline, body = text.partition("\n")
+    index, checksum = parseHeader(next(csv.reader([headerLine]), []), questionnaires)
+    numQuestions = len(questionnaires.getQuestions(index))
+
+    if (trustChecksum) and (checksum is not None) and (checksum == getChecksum(body)):
+        try:
+            values = list(map(int, body.replace("\n", ",").split(",")[:-1]))
+        except ValueError:
+            values = []
+        absIDs, responses = values[0::2], values[1::2]
+        if (len(values) == 2 * numQuestions) and (sorted(absIDs) == list(range(0, numQuestions))) \
+                and all(minResponse <= response <= maxResponse for response in responses):
+            return index, list(map(list, zip(absIDs, responses)))
+
+    return index, parseBody(list(csv.reader(io.StringIO(body, newline=''), delimiter=',')), numQuestions)
+
+
+def isSessionFile(name):
+    """Returns whether a file name has one of the save file endings (.txt, .txt.gz, .txt.xz)."""
+    return any(name.endswith(extension) for extension, compression in sessionExtensions)
+
+
+def getCompression(path):
+    """Returns the compression a save file name asks for: None, "gzip" or "xz"."""
+    for extension, compression in reversed(sessionExtensions):
+        if (path.endswith(extension)):
+            return compression
+    return None
+
+
+def decodeSession(data):
+    """Turns a save file's bytes into text, decompressing them first if they start with a gzip or xz header.
+
+       Input: file contents <bytes>
+       Output: text <str>; raises SessionError
+    """
+    try:
+        if (data.startswith(gzipMagic)):
+            data = gzip.decompress(data)
+        elif (data.startswith(xzMagic)):
+            data = lzma.decompress(data, format=lzma.FORMAT_XZ)
+        return data.decode("utf-8")
+    except (OSError, EOFError, lzma.LZMAError, UnicodeDecodeError) as error:
+        raise SessionError("Error: savefile invalid.", "unreadable contents (%s)" % error)
+
+
+def encodeSession(index, answers, quizHash, compression=None):
+    """Serializes a session into the bytes of a save file.
+
+       Input: questionnaire index <int>, [[absID <int>, response <int>]] in display order,
+              questionnaire hash from getQuestionnaireHash() <str>, None/"gzip"/"xz"
+       Output: file contents <bytes>
+    """
+    body = "".join(str(absID) + "," + str(response) + "\n" for absID, response in answers)
+    # First line of file = questionnaire index, then what lets a load trust the body (see parseSession)
+    header = ",".join([str(index), sessionVersion, str(len(answers)), quizHash, getChecksum(body)])
+    data = (header + "\n" + body).encode("utf-8")
+    if (compression == "gzip"):
+        return gzip.compress(data)
+    elif (compression == "xz"):
+        return lzma.compress(data, format=lzma.FORMAT_XZ)
+    return data
+
+
+def loadSession(path, questionnaires, trustChecksum=True):
+    """Reads and validates a save file, compressed or not (see parseSession).
+
+       Input: path to save file <str>, questionnaires <questionnairesArray>, whether a matching checksum may skip full validation <bool>
+       Output: (questionnaire index <int>, [[absID <int>, response <int>]] in file order); raises SessionError
+    """
+    try:
+        with open(path, 'rb') as INFILE:
+            data = INFILE.read()
+    except OSError as error:
+        raise SessionError("Error: savefile invalid.", error.strerror)
+    return parseSession(decodeSession(data), questionnaires, trustChecksum)
+
+
+def readSession(path, questionnaires):
+    """Reads and validates a save file using the same rules as MainWidget.loadProgress.
+
+       Input: path to save file <str>, questionnaires <questionnairesArray>
+       Output: (questionnaire index <int>, responses ordered by absID [<int>]), or None if the file is invalid
+    """
+    try:
+        index, answers = loadSession(path, questionnaires)
+    except SessionError:
+        return None
+    return index, [response for absID, response in sorted(answers, key=itemgetter(0))]
+
+
+def writeSession(path, index, answers, quizHash, compression=None, sync=False):
+    """Writes a save file atomically: the whole file is built in memory, written to a temporary file next to the
+       target and renamed over it. With sync, the data is flushed to disk before the rename, so even a power cut
+       leaves either the old save or the new one.
+
+       Input: path <str>, questionnaire index <int>, [[absID <int>, response <int>]] in display order,
+              questionnaire hash from getQuestionnaireHash() <str>, None/"gzip"/"xz", sync <bool>
+       Output: none; raises OSError
+    """
+    data = encodeSession(index, answers, quizHash, compression)
+    descriptor, temporaryPath = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                                 dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(descriptor, 'wb') as OUTFILE:
+            OUTFILE.write(data)
+            if (sync):
+                OUTFILE.flush()
+                os.fsync(OUTFILE.fileno())
+        os.replace(temporaryPath, path)
+    except OSError:
+        try:
+            os.remove(temporaryPath)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# Soak test for widget lifecycle
+# Runs the quiz headlessly (offscreen Qt platform) and cycles through every questionnaire and every valid save
+# file, answering and submitting each one, for thousands of loads. Process RSS and the number of live QObjects
+# are sampled at cycle boundaries, where the window is always in the same state; the QObject count must come
+# back to exactly its baseline and RSS may not grow by more than a small tolerance. Exits 1 if either grows.
+
+import argparse
+import gc
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWidgets import QApplication
+from QuizSessions import readSession, isSessionFile
+from QuizDiagnostics import getRss, countQObjects
+import QuizGui
+
+
+class SoakRunner(QObject):
+    """Drives one load per event-loop turn: switch questionnaire or load a session, answer everything, submit.
+       The next load is only started once the previous one has finished building its question widgets.
+    """
+    def __init__(self, app, savePaths, iterations, sampleCycles):
+        QObject.__init__(self)
+        self.app = app
+        self.mainWidget = app.mainWindow.mainWidget
+        self.iterations = iterations
+        self.sampleCycles = sampleCycles                 # Cycles between samples
+        self.iteration = 0
+        self.samples = []                                # [(iteration, RSS bytes, live QObjects)]
+
+        # One cycle: every questionnaire in turn, then every save file
+        self.operations = [(self.mainWidget.loadQuestionnaire, index) for index in range(0, self.mainWidget.questionnaires.getSize())]
+        self.operations += [(self.mainWidget.loadProgressFile, path) for path in savePaths]
+
+        # Whole cycles only, so the last sample is taken in the same state as the others
+        numCycles = -(-iterations // len(self.operations))
+        self.iterations = numCycles * len(self.operations)
+
+        self.mainWidget.signalQuestionsBuilt.connect(self.loadFinished)
+
+    def start(self):
+        QTimer.singleShot(0, self.step)
+
+    def step(self):
+        """Samples at cycle boundaries, then starts the next load (or stops once all iterations are done)."""
+        cycle, position = divmod(self.iteration, len(self.operations))
+        if (self.iteration >= self.iterations):
+            self.sample()
+            self.app.exit(0)
+            return
+        if (position == 0) and (cycle % self.sampleCycles == 0):
+            self.sample()
+
+        operation, argument = self.operations[position]
+        self.iteration += 1
+        error = operation(argument)
+        if (error is not None):
+            print("Iteration %d: %s (%s)" % (self.iteration, error, argument))
+            QTimer.singleShot(0, self.step)
+
+    def loadFinished(self):
+        """Answers and submits the quiz once all of its questions are built; connected to MainWidget.signalQuestionsBuilt."""
+        model = self.mainWidget.answerModel
+        for row in range(0, model.rowCount()):
+            model.setAnswer(row, (row + self.iteration) % 6)
+        self.mainWidget.tallyResults()
+        # Let deferred deletes and repaints run before the next load
+        QTimer.singleShot(0, self.step)
+
+    def sample(self):
+        gc.collect()
+        numObjects = sum(countQObjects(widget) for widget in QApplication.topLevelWidgets())
+        self.samples.append((self.iteration, getRss(), numObjects))
+        print("iteration %6d: RSS %8.1f MiB, %d QObjects" % (self.iteration, (self.samples[-1][1] or 0) / 1048576, numObjects))
+        sys.stdout.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Switch questionnaires and load sessions repeatedly, checking that memory stays flat.")
+    parser.add_argument("--iterations", type=int, default=10000, help="number of loads (default 10000)")
+    parser.add_argument("--saves", default="saves", help="directory of save files (.txt, .txt.gz, .txt.xz) to load (default saves)")
+    parser.add_argument("--sample-cycles", type=int, default=25, help="cycles between samples (default 25)")
+    parser.add_argument("--rss-tolerance", type=float, default=16.0, help="allowed RSS growth after warm-up, in MiB (default 16)")
+    args = parser.parse_args(argv)
+
+    # Only saves loadProgress would accept, so every iteration really replaces the quiz
+    questionnaires = QuizGui.questionnairesArray()
+    savePaths = []
+    if os.path.isdir(args.saves):
+        for name in sorted(os.listdir(args.saves)):
+            path = os.path.join(args.saves, name)
+            if isSessionFile(name) and (readSession(path, questionnaires) is not None):
+                savePaths.append(path)
+
+    app = QuizGui.App([sys.argv[0]], startQuestionnaire=0)
+    runner = SoakRunner(app, savePaths, args.iterations, max(1, args.sample_cycles))
+    runner.start()
+    app.exec_()
+
+    # The first sample is taken before anything has been switched; the second, after one full warm-up period
+    if (len(runner.samples) < 3):
+        print("Too few samples; raise --iterations or lower --sample-cycles.")
+        return 1
+    baseline = runner.samples[1]
+    final = runner.samples[-1]
+    failed = False
+    if (final[2] != baseline[2]):
+        print("FAIL: live QObjects went from %d to %d" % (baseline[2], final[2]))
+        failed = True
+    if (baseline[1] is not None) and (final[1] - baseline[1] > args.rss_tolerance * 1048576):
+        print("FAIL: RSS grew by %.1f MiB (tolerance %.1f MiB)" % ((final[1] - baseline[1]) / 1048576, args.rss_tolerance))
+        failed = True
+    if not (failed):
+        print("OK: %d loads, RSS %+.1f MiB, QObjects %d -> %d" % (runner.iteration, ((final[1] or 0) - (baseline[1] or 0)) / 1048576, baseline[2], final[2]))
+    return 1 if failed else 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
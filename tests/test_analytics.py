@@ -0,0 +1,101 @@
+# Streaming analytics: SessionAggregates counts each save once, retracts changed and deleted ones, and carries its
+# counts between runs only while the questionnaires they were counted against are unchanged.
+
+from unittest import mock
+import tempfile
+import unittest
+import shutil
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizCatalogue import questionnairesArray
+from QuizSessions import writeSession, getQuestionnaireHash, forgetQuestionnaireHashes
+from QuizAnalytics import SessionAggregates
+
+
+class SessionAggregatesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.statePath = os.path.join(self.directory, "state.json")
+        self.questionnaires = questionnairesArray()
+        self.modified = 0
+        self.poles = [question[1] for question in sorted(self.questionnaires.getQuestions(2), key=lambda question: question[3])]
+
+    def tearDown(self):
+        forgetQuestionnaireHashes()
+
+    def writeSave(self, name, responses):
+        """Writes a save of questionnaire 2 with the given responses (ordered by absID)."""
+        writeSession(os.path.join(self.directory, name), 2, [[absID, response] for absID, response in enumerate(responses)],
+                     getQuestionnaireHash(self.questionnaires, 2))
+        # A second apart, so a rewrite looks changed however coarse the file system's timestamps are
+        self.modified += 10 ** 9
+        os.utime(os.path.join(self.directory, name), ns=(self.modified, self.modified))
+
+    def allWest(self, points):
+        return [points if (pole == 0) else 0 for pole in self.poles]
+
+    def test_update_counts_each_file_once(self):
+        self.writeSave("a.txt", self.allWest(5))
+        self.writeSave("b.txt", [-1] * len(self.poles))
+        aggregates = SessionAggregates(self.questionnaires)
+        self.assertEqual(aggregates.update(self.directory), 2)
+        self.assertEqual(aggregates.update(self.directory), 0)
+        self.assertEqual(aggregates.verdictCounts[2], [1, 0, 0])
+        self.assertEqual(aggregates.getHistogram(2, 0)[-1], 1)
+        self.assertEqual(sum(aggregates.getHistogram(2, 0).values()), 2)
+
+    def test_changed_and_deleted_files_are_retracted(self):
+        self.writeSave("a.txt", self.allWest(5))
+        self.writeSave("b.txt", self.allWest(1))
+        aggregates = SessionAggregates(self.questionnaires)
+        aggregates.update(self.directory)
+        self.writeSave("a.txt", [5 if (pole == 1) else 0 for pole in self.poles])
+        self.assertEqual(aggregates.update(self.directory), 1)
+        self.assertEqual(aggregates.verdictCounts[2], [1, 1, 0])
+        os.remove(os.path.join(self.directory, "b.txt"))
+        aggregates.update(self.directory)
+        self.assertEqual(aggregates.verdictCounts[2], [0, 1, 0])
+        self.assertEqual(sum(aggregates.marginCounts[2]), 1)
+
+    def test_save_and_load(self):
+        self.writeSave("a.txt", self.allWest(5))
+        aggregates = SessionAggregates(self.questionnaires)
+        aggregates.update(self.directory)
+        aggregates.save(self.statePath)
+        self.assertEqual([name for name in os.listdir(self.directory) if name.endswith(".tmp")], [])
+
+        restored = SessionAggregates(self.questionnaires)
+        self.assertTrue(restored.load(self.statePath))
+        self.assertEqual(restored.answerCounts, aggregates.answerCounts)
+        self.assertEqual(restored.verdictCounts, aggregates.verdictCounts)
+        self.assertEqual(restored.getPercentileRank(2, 0), aggregates.getPercentileRank(2, 0))
+        # Nothing changed, so nothing is read again
+        with mock.patch("QuizAnalytics.readSession", side_effect=AssertionError("file read again")):
+            self.assertEqual(restored.update(self.directory), 0)
+
+    def test_state_for_other_questionnaires_is_not_loaded(self):
+        self.writeSave("a.txt", self.allWest(5))
+        aggregates = SessionAggregates(self.questionnaires)
+        aggregates.update(self.directory)
+        aggregates.save(self.statePath)
+
+        edited = questionnairesArray()
+        edited.getQuestions(2)[0][1] = 1 - edited.getQuestions(2)[0][1]
+        forgetQuestionnaireHashes()
+        restored = SessionAggregates(edited)
+        self.assertFalse(restored.load(self.statePath))
+        self.assertEqual(restored.seenFiles, {})
+
+    def test_unreadable_state_is_not_loaded(self):
+        with open(self.statePath, 'w') as OUTFILE:
+            OUTFILE.write("{not json")
+        self.assertFalse(SessionAggregates(self.questionnaires).load(self.statePath))
+        self.assertFalse(SessionAggregates(self.questionnaires).load(os.path.join(self.directory, "missing.json")))
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,93 @@
+# Save archive audit: results are reused only while the file and the questionnaires are unchanged, and files that
+# are gone are forgotten.
+
+from unittest import mock
+import tempfile
+import unittest
+import shutil
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizCatalogue import questionnairesArray
+from QuizSessions import writeSession, encodeSession, getQuestionnaireHash, forgetQuestionnaireHashes
+from QuizAudit import AuditCache, auditDirectory, auditFile
+import QuizSessions
+
+
+class AuditCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.questionnaires = questionnairesArray()
+        self.cachePath = os.path.join(self.directory, ".quizAudit.json")
+        writeSession(os.path.join(self.directory, "good.txt"), 0,
+                     [[question[3], question[3] % 6] for question in self.questionnaires.getQuestions(0)],
+                     getQuestionnaireHash(self.questionnaires, 0))
+        with open(os.path.join(self.directory, "bad.txt"), 'w') as OUTFILE:
+            OUTFILE.write("0\n0,9\n")
+
+    def tearDown(self):
+        forgetQuestionnaireHashes()
+
+    def audit(self, questionnaires):
+        cache = AuditCache(questionnaires)
+        cache.load(self.cachePath)
+        audited = auditDirectory(self.directory, questionnaires, cache)
+        cache.save(self.cachePath)
+        return {os.path.basename(path): (result[0], isRead) for path, result, isRead in audited}
+
+    def test_unchanged_files_are_not_read_again(self):
+        self.assertEqual(self.audit(self.questionnaires), {"bad.txt": (-1, True), "good.txt": (0, True)})
+        self.assertEqual(self.audit(self.questionnaires), {"bad.txt": (-1, False), "good.txt": (0, False)})
+
+    def test_changed_file_is_read_again(self):
+        self.audit(self.questionnaires)
+        with open(os.path.join(self.directory, "bad.txt"), 'a') as OUTFILE:
+            OUTFILE.write("1,2\n")
+        self.assertEqual(self.audit(self.questionnaires), {"bad.txt": (-1, True), "good.txt": (0, False)})
+
+    def test_deleted_file_is_forgotten(self):
+        self.audit(self.questionnaires)
+        os.remove(os.path.join(self.directory, "bad.txt"))
+        self.assertEqual(self.audit(self.questionnaires), {"good.txt": (0, False)})
+        cache = AuditCache(self.questionnaires)
+        cache.load(self.cachePath)
+        self.assertEqual(list(cache.results), [os.path.abspath(os.path.join(self.directory, "good.txt"))])
+
+    def test_matching_checksum_is_validated(self):
+        # Written with a correct checksum, yet with one absID twice and a response of 9
+        answers = [[question[3], question[3] % 6] for question in self.questionnaires.getQuestions(0)]
+        answers[1][0] = answers[0][0]
+        answers[2][1] = 9
+        path = os.path.join(self.directory, "checksummed.txt")
+        with open(path, 'wb') as OUTFILE:
+            OUTFILE.write(encodeSession(0, answers, getQuestionnaireHash(self.questionnaires, 0)))
+        index, message, detail = auditFile(path, self.questionnaires)
+        self.assertEqual((index, message), (-1, "Error: savefile invalid."))
+        self.assertIn("appears twice", detail)
+        # A good file gets the same full validation
+        with mock.patch.object(QuizSessions, "parseBody", wraps=QuizSessions.parseBody) as parseBody:
+            self.assertEqual(auditFile(os.path.join(self.directory, "good.txt"), self.questionnaires), [0, None, None])
+        self.assertEqual(parseBody.call_count, 1)
+
+    def test_failed_save_leaves_no_temporary_file(self):
+        cache = AuditCache(self.questionnaires)
+        auditDirectory(self.directory, self.questionnaires, cache)
+        with mock.patch("os.replace", side_effect=OSError("read-only")):
+            cache.save(self.cachePath)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["bad.txt", "good.txt"])
+        self.assertTrue(cache.isModified)
+
+    def test_edited_questionnaires_discard_the_cache(self):
+        self.audit(self.questionnaires)
+        edited = questionnairesArray()
+        edited.getQuestions(0)[0][0] = "Edited"
+        forgetQuestionnaireHashes()
+        # Every file is read again, and the save made before the edit is now refused
+        self.assertEqual(self.audit(edited), {"bad.txt": (-1, True), "good.txt": (-1, True)})
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,44 @@
+# The catalogue, scoring and session modules are what the headless runner and the analysis tools use; they must
+# stay importable without PyQt5, and quickly. Each check runs in a fresh interpreter so nothing imported by the
+# test runner (or another test) can hide a stray import.
+
+import subprocess
+import unittest
+import json
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+coreModules = ["QuizCatalogue", "QuizScoring", "QuizSessions"]
+# Seconds allowed for importing all of the core modules, interpreter start-up excluded
+importBudget = 0.1
+
+probe = """
+import importlib, json, sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "qtModules": sorted(name for name in sys.modules if name.split(".")[0] == "PyQt5")}))
+"""
+
+
+def runProbe(modules):
+    """Imports the given modules in a fresh interpreter and returns {"elapsed", "qtModules"}."""
+    output = subprocess.run([sys.executable, "-c", probe] + modules, cwd=repoDirectory, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output)
+
+
+class CoreImportTest(unittest.TestCase):
+    def test_no_qt(self):
+        for name in coreModules + ["QuizHeadless", "QuizAnalytics"]:
+            self.assertEqual(runProbe([name])["qtModules"], [], "%s imports PyQt5" % name)
+
+    def test_import_budget(self):
+        # Best of a few runs, so a busy machine does not fail the test on a single slow start
+        elapsed = min(runProbe(coreModules)["elapsed"] for attempt in range(0, 3))
+        self.assertLess(elapsed, importBudget, "core modules took %.0f ms to import" % (elapsed * 1000))
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,121 @@
+# Columnar export: --append reads only new and changed files, skips invalid files it has seen before, and drops the
+# rows of saves that are gone; once the questionnaires change it writes the archive again, as a fresh export would.
+
+from unittest import mock
+import tempfile
+import unittest
+import shutil
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizCatalogue import questionnairesArray
+from QuizSessions import writeSession, getQuestionnaireHash, forgetQuestionnaireHashes
+from QuizExport import exportSessions, openExport, ExportError
+import QuizExport
+
+
+class ExportAppendTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.saves = os.path.join(self.directory, "saves")
+        self.archive = os.path.join(self.directory, "sessions.npz")
+        os.makedirs(self.saves)
+        self.questionnaires = questionnairesArray()
+        self.modified = 0
+        for name in ["a.txt", "b.txt", "c.txt"]:
+            self.writeSave(name, 3)
+        self.writeFile("bad.txt", "junk\n")
+
+    def tearDown(self):
+        forgetQuestionnaireHashes()
+
+    def touch(self, name):
+        # A second apart, so a rewrite looks changed however coarse the file system's timestamps are
+        self.modified += 10 ** 9
+        os.utime(os.path.join(self.saves, name), ns=(self.modified, self.modified))
+
+    def writeSave(self, name, response):
+        answers = [[question[3], response] for question in self.questionnaires.getQuestions(0)]
+        writeSession(os.path.join(self.saves, name), 0, answers, getQuestionnaireHash(self.questionnaires, 0))
+        self.touch(name)
+
+    def writeFile(self, name, text):
+        with open(os.path.join(self.saves, name), 'w') as OUTFILE:
+            OUTFILE.write(text)
+        self.touch(name)
+
+    def export(self, questionnaires=None):
+        """Appends to the archive, returning the counts and the names of the files that were read."""
+        with mock.patch.object(QuizExport, "readSession", wraps=QuizExport.readSession) as readSession:
+            counts = exportSessions(self.saves, self.archive, questionnaires or self.questionnaires, append=True)
+        return counts, sorted(os.path.basename(call[0][0]) for call in readSession.call_args_list)
+
+    def getRows(self):
+        arrays = openExport(self.archive)
+        return {bytes(path).decode(): int(answers[0]) for path, answers in zip(arrays["path_0"], arrays["answers_0"])}
+
+    def test_first_export(self):
+        counts, read = self.export()
+        self.assertEqual(counts, {"added": 3, "updated": 0, "kept": 0, "removed": 0, "invalid": 1})
+        self.assertEqual(read, ["a.txt", "b.txt", "bad.txt", "c.txt"])
+        self.assertEqual(self.getRows(), {"a.txt": 3, "b.txt": 3, "c.txt": 3})
+
+    def test_unchanged_files_are_not_read_again(self):
+        self.export()
+        counts, read = self.export()
+        self.assertEqual(counts, {"added": 0, "updated": 0, "kept": 3, "removed": 0, "invalid": 1})
+        self.assertEqual(read, [])
+
+    def test_new_changed_and_deleted_files(self):
+        self.export()
+        self.writeSave("b.txt", 5)
+        self.writeSave("d.txt", 1)
+        os.remove(os.path.join(self.saves, "c.txt"))
+        counts, read = self.export()
+        self.assertEqual(counts, {"added": 1, "updated": 1, "kept": 1, "removed": 1, "invalid": 1})
+        self.assertEqual(read, ["b.txt", "d.txt"])
+        self.assertEqual(self.getRows(), {"a.txt": 3, "b.txt": 5, "d.txt": 1})
+
+    def test_invalid_file_read_again_once_changed(self):
+        self.export()
+        self.writeSave("bad.txt", 2)
+        counts, read = self.export()
+        self.assertEqual((counts["added"], counts["invalid"]), (1, 0))
+        self.assertEqual(read, ["bad.txt"])
+        self.writeFile("a.txt", "junk\n")
+        counts, read = self.export()
+        self.assertEqual(counts, {"added": 0, "updated": 0, "kept": 3, "removed": 0, "invalid": 1})
+        self.assertEqual(sorted(self.getRows()), ["b.txt", "bad.txt", "c.txt"])
+
+    def test_questionnaire_edit_rewrites_the_archive(self):
+        # The saves were made before the edit, so a fresh export now finds every one invalid; so must --append
+        self.export()
+        edited = questionnairesArray()
+        edited.getQuestions(0)[0][0] = "Edited"
+        forgetQuestionnaireHashes()
+        counts, read = self.export(edited)
+        self.assertEqual(counts, {"added": 0, "updated": 0, "kept": 0, "removed": 0, "invalid": 4})
+        self.assertEqual(counts, exportSessions(self.saves, os.path.join(self.directory, "fresh.npz"), edited))
+        self.assertEqual(read, ["a.txt", "b.txt", "bad.txt", "c.txt"])
+        self.assertEqual(self.getRows(), {})
+
+    def test_question_count_change_rewrites_the_archive(self):
+        self.export()
+        edited = questionnairesArray()
+        edited.getQuestions(0).append(["A new question", 0, -1, len(edited.getQuestions(0))])
+        forgetQuestionnaireHashes()
+        counts, read = self.export(edited)
+        self.assertEqual((counts["kept"], counts["invalid"]), (0, 4))
+        self.assertEqual(openExport(self.archive)["answers_0"].shape, (0, len(edited.getQuestions(0))))
+
+    def test_not_an_archive(self):
+        self.writeFile("notes.txt", "not a zip file\n")
+        with self.assertRaises(ExportError):
+            openExport(os.path.join(self.saves, "notes.txt"))
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,42 @@
+# Start-up time of the headless runner, the entry point CI and batch jobs use. `EastWestQuiz.py --headless` must
+# cost no more than running QuizHeadless.py itself: the launcher hands off before PyQt5 or the GUI is loaded, and is
+# kept small because the script Python is started with is compiled again on every run. Times are wall clock for a
+# fresh interpreter, less that of an interpreter that does nothing.
+
+import subprocess
+import unittest
+import time
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Seconds allowed for `QuizHeadless.py --list`, interpreter start-up excluded
+startupBudget = 0.1
+# Seconds the launcher may add on top of QuizHeadless.py
+launcherBudget = 0.02
+
+
+def timeRun(args):
+    """Runs the interpreter with the given arguments a few times and returns the fastest wall-clock time, so a busy
+       machine does not fail the test on a single slow start.
+    """
+    best = None
+    for attempt in range(0, 3):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=repoDirectory, check=True, stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if (best is None) else min(best, elapsed)
+    return best
+
+
+class HeadlessStartupTest(unittest.TestCase):
+    def test_startup_budget(self):
+        interpreter = timeRun(["-c", "pass"])
+        headless = timeRun(["QuizHeadless.py", "--list"]) - interpreter
+        launcher = timeRun(["EastWestQuiz.py", "--headless", "--list"]) - interpreter
+        self.assertLess(headless, startupBudget, "QuizHeadless.py --list took %.0f ms" % (headless * 1000))
+        self.assertLess(launcher - headless, launcherBudget, "EastWestQuiz.py --headless took %.0f ms longer than QuizHeadless.py"
+                        % ((launcher - headless) * 1000))
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,61 @@
+# Respondent CSV import: header cells are matched to questions, and rows with a response that loadProgress would
+# refuse are reported and skipped rather than scored.
+
+import unittest
+import sys
+import io
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizImport import mapColumns, parseRow, importResponses, RespondentFileError
+
+
+class ImportTest(unittest.TestCase):
+    def setUp(self):
+        # Two West questions and one East, ordered by absID
+        self.questions = [["Snow is fine.", 0, -1, 0], ["I like hills.", 0, -1, 1], ["Rain is fine.", 1, -1, 2]]
+
+    def runImport(self, text, idColumn=None):
+        scores = io.StringIO()
+        errors = io.StringIO()
+        result = importResponses(io.StringIO(text), scores, errors, self.questions, idColumn, seed=1)
+        return result, scores.getvalue().splitlines()[1:], errors.getvalue().splitlines()[1:]
+
+    def test_map_columns(self):
+        columns, idPosition, ignored = mapColumns(["id", "q2", "SNOW  IS FINE.", "Age", "1", "Q1"], self.questions, "id")
+        self.assertEqual((columns, idPosition), ([2, 4, 1], 0))
+        # A question matched twice keeps its first column
+        self.assertEqual(ignored, ["Age", "Q1"])
+
+    def test_parse_row(self):
+        columns = [0, None, 1]
+        self.assertEqual(parseRow(["5", "-1"], columns), [5, -1, -1])
+        self.assertEqual(parseRow([" 3 ", ""], columns), [3, -1, -1])
+        self.assertEqual(parseRow(["5"], columns), "too few columns (1)")
+        self.assertEqual(parseRow(["x", "1"], columns), "question 0: 'x' is not a number")
+        self.assertEqual(parseRow(["6", "1"], columns), "question 0: 6 is not between -1 and 5")
+
+    def test_bad_rows_are_reported_and_skipped(self):
+        result, scores, errors = self.runImport("who,q0,q1,q2\nann,5,4,1\n\nbob,5,9,0\ncat,1,,2\ndan,1\n", "who")
+        self.assertEqual((result["rows"], result["errors"]), (4, 2))
+        self.assertEqual(scores, ["ann,9,1,8,West", "cat,1,2,-1,incomplete"])
+        self.assertEqual(errors, ["4,bob,question 1: 9 is not between -1 and 5", "6,dan,too few columns (2)"])
+        self.assertEqual((result["scorer"].numScored, result["scorer"].numIncomplete), (1, 1))
+
+    def test_missing_and_ignored_columns(self):
+        result, scores, errors = self.runImport("q0,Rain is fine.,comment\n2,4,hello\n")
+        self.assertEqual((result["missing"], result["ignored"]), ([1], ["comment"]))
+        self.assertEqual(scores, ["2,2,4,-2,incomplete"])
+
+    def test_unusable_files(self):
+        with self.assertRaises(RespondentFileError):
+            self.runImport("")
+        with self.assertRaises(RespondentFileError):
+            self.runImport("name,age\nann,30\n")
+        with self.assertRaises(RespondentFileError):
+            self.runImport("q0,q1,q2\n1,2,3\n", "respondent")
+
+if (__name__ == "__main__"):
+    unittest.main()
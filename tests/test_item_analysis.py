@@ -0,0 +1,70 @@
+# Item analysis: ItemStatistics' chunked integer sums give the same statistics as working them out directly, however
+# the response matrix is split into chunks.
+
+from unittest import mock
+import unittest
+import sys
+import os
+
+import numpy as np
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizItemAnalysis import ItemStatistics
+import QuizItemAnalysis
+
+
+class ItemStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.poles = [0, 1, 0, 1, 0]
+        self.matrix = rng.integers(0, 6, size=(200, len(self.poles))).astype(np.int8)
+        # Make item 0 track the verdict, and leave a few sessions incomplete
+        self.matrix[:, 0] = np.where(self.matrix[:, 2] + self.matrix[:, 4] > self.matrix[:, 1] + self.matrix[:, 3], 5, 0)
+        self.matrix[::17, 3] = -1
+
+    def getExpected(self):
+        """The same statistics computed directly from the complete sessions."""
+        complete = self.matrix[(self.matrix >= 0).all(axis=1)].astype(float)
+        scores = complete * np.where(np.array(self.poles) == 0, 1, -1)
+        totals = scores.sum(axis=1)
+        numItems = len(self.poles)
+        alpha = numItems / (numItems - 1) * (1 - scores.var(axis=0).sum() / totals.var())
+        itemTotal = [np.corrcoef(scores[:, item], totals - scores[:, item])[0, 1] for item in range(0, numItems)]
+        return len(complete), alpha, itemTotal
+
+    def test_matches_direct_computation(self):
+        statistics = ItemStatistics(self.poles)
+        statistics.addMatrix(self.matrix)
+        numComplete, alpha, itemTotal = self.getExpected()
+        self.assertEqual(statistics.numSessions, numComplete)
+        self.assertEqual(statistics.numSkipped, len(self.matrix) - numComplete)
+        self.assertAlmostEqual(statistics.getAlpha(), alpha)
+        np.testing.assert_allclose(statistics.getReport()["itemTotal"], itemTotal)
+
+    def test_chunks_add_up_to_the_whole(self):
+        whole = ItemStatistics(self.poles)
+        whole.addChunk(self.matrix)
+        chunked = ItemStatistics(self.poles)
+        with mock.patch.object(QuizItemAnalysis, "chunkElements", 3 * len(self.poles)):
+            chunked.addMatrix(self.matrix)
+        for name in ["sumScores", "sumSquares", "sumCross", "numConsistent"]:
+            np.testing.assert_array_equal(getattr(chunked, name), getattr(whole, name))
+        self.assertEqual((chunked.sumTotal, chunked.sumTotalSquares, chunked.numDecided),
+                         (whole.sumTotal, whole.sumTotalSquares, whole.numDecided))
+
+    def test_consistency(self):
+        statistics = ItemStatistics(self.poles)
+        statistics.addMatrix(self.matrix)
+        # Item 0 agrees exactly when West wins, which is what its pole says
+        self.assertEqual(statistics.getReport()["consistency"][0], 1.0)
+
+    def test_no_complete_sessions(self):
+        statistics = ItemStatistics(self.poles)
+        statistics.addMatrix(np.full((4, len(self.poles)), -1, dtype=np.int8))
+        self.assertEqual((statistics.numSessions, statistics.numSkipped), (0, 4))
+        self.assertTrue(np.isnan(statistics.getAlpha()))
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,169 @@
+# Live reload of questionnaire definitions: QuizCatalogue.diffQuestions, and MainWidget.applyQuestionnaires patching
+# the quiz on screen (offscreen Qt; skipped where PyQt5 is not installed). absIDs are written by hand, so
+# definitions whose absIDs have gaps are refused, and deleting a question from the middle of a questionnaire (which
+# renumbers the ones after it) keeps every answer with its question, in the quiz and in a save made afterwards.
+
+from unittest import mock
+import tempfile
+import unittest
+import shutil
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizCatalogue import questionnairesArray, diffQuestions, checkQuestionnaires, CatalogueError
+from QuizSessions import writeSession, loadSession, getQuestionnaireHash, forgetQuestionnaireHashes
+import QuizSessions
+
+try:
+    import PyQt5
+    hasQt = True
+except ImportError:
+    hasQt = False
+
+
+class DiffQuestionsTest(unittest.TestCase):
+    def test_unchanged(self):
+        questions = questionnairesArray().getQuestions(0)
+        self.assertEqual(diffQuestions(questions, questionnairesArray().getQuestions(0)), ({}, [], []))
+
+    def test_changed_added_removed(self):
+        old = [["a", 0, -1, 0], ["b", 1, -1, 1], ["c", 0, -1, 2], ["d", 1, 3, 5]]
+        # Shuffled, with a response recorded: neither order nor responses count as changes
+        new = [["d", 1, -1, 5], ["B", 1, -1, 1], ["a", 1, 4, 0], ["e", 0, -1, 7]]
+        changed, added, removed = diffQuestions(old, new)
+        self.assertEqual(sorted(changed), [0, 1])
+        self.assertEqual(changed[1][0], "B")
+        self.assertEqual(added, [7])
+        self.assertEqual(removed, [2])
+
+
+class CheckQuestionnairesTest(unittest.TestCase):
+    def test_built_in(self):
+        checkQuestionnaires(questionnairesArray())
+
+    def test_gap_and_duplicate(self):
+        questionnaires = questionnairesArray()
+        questions = questionnaires.getQuestions(1)
+        questions[:] = [question for question in questions if question[3] != 2]
+        with self.assertRaises(CatalogueError) as raised:
+            checkQuestionnaires(questionnaires)
+        self.assertIn("questionnaire 1", str(raised.exception))
+        self.assertIn("absID 2", str(raised.exception))
+        questions.append(list(questions[0]))
+        with self.assertRaises(CatalogueError):
+            checkQuestionnaires(questionnaires)
+
+
+@unittest.skipUnless(hasQt, "PyQt5 is not installed")
+class ApplyQuestionnairesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        import QuizGui
+        cls.QuizGui = QuizGui
+        cls.app = QuizGui.QApplication.instance() or QuizGui.QApplication([sys.argv[0]])
+
+    def setUp(self):
+        self.widget = self.QuizGui.MainWidget(startQuestionnaire=0)
+        self.buildAll()
+        # Answer every question with a value that identifies it, so answers can be traced to questions afterwards
+        for row, question in enumerate(self.widget.questionsArray):
+            self.widget.answerModel.setAnswer(row, question[3] % 6)
+
+    def tearDown(self):
+        self.widget.deleteLater()
+        forgetQuestionnaireHashes()
+
+    def buildAll(self):
+        while (self.widget.pendingQuestions):
+            self.widget.buildNextChunk()
+
+    def getAnswersByText(self):
+        return {question[0]: answer for question, answer in zip(self.widget.questionsArray, self.widget.answerModel.getAnswers())}
+
+    def getAnswersByAbsID(self):
+        return {question[3]: answer for question, answer in zip(self.widget.questionsArray, self.widget.answerModel.getAnswers())}
+
+    def checkConsistent(self, questionnaires):
+        """Every row is one question of the new catalogue, exactly once, and its widget shows that question."""
+        self.buildAll()
+        newQuestions = {question[3]: question for question in questionnaires.getQuestions(0)}
+        absIDs = [question[3] for question in self.widget.questionsArray]
+        self.assertEqual(sorted(absIDs), sorted(newQuestions))
+        for question, radioButtons in zip(self.widget.questionsArray, self.widget.radioButtonsArray):
+            self.assertIs(question, newQuestions[question[3]])
+            self.assertEqual((radioButtons.questionText, radioButtons.isEast), (question[0], question[1]))
+        self.assertEqual(self.widget.questionsDict, newQuestions)
+
+    def test_edit_in_place(self):
+        before = list(self.widget.radioButtonsArray)
+        answers = self.getAnswersByAbsID()
+        questionnaires = questionnairesArray()
+        question = next(question for question in questionnaires.getQuestions(0) if question[3] == 3)
+        question[0] = "Edited"
+        question[1] = 1 - question[1]
+
+        self.assertTrue(self.widget.applyQuestionnaires(questionnaires))
+        self.checkConsistent(questionnaires)
+        self.assertEqual(self.getAnswersByAbsID(), answers)
+        # Patched, not rebuilt
+        self.assertEqual(len(before), len(self.widget.radioButtonsArray))
+        self.assertTrue(all(old is new for old, new in zip(before, self.widget.radioButtonsArray)))
+
+    def test_gaps_are_refused(self):
+        before = list(self.widget.questionsArray)
+        answers = self.getAnswersByAbsID()
+        questionnaires = questionnairesArray()
+        questions = questionnaires.getQuestions(0)
+        questions[:] = [question for question in questions if question[3] != 2]
+
+        with mock.patch.object(self.widget, "popupBox") as popupBox:
+            self.assertFalse(self.widget.applyQuestionnaires(questionnaires))
+        self.assertIn("absID 2", popupBox.call_args[0][0])
+        self.assertEqual(self.widget.questionsArray, before)
+        self.assertEqual(self.getAnswersByAbsID(), answers)
+
+    def test_remove_from_middle(self):
+        answers = self.getAnswersByText()
+        questionnaires = questionnairesArray()
+        questions = questionnaires.getQuestions(0)
+        removedText = next(question[0] for question in questions if question[3] == 2)
+        questions[:] = [question for question in questions if question[3] != 2]
+        for question in questions:
+            if (question[3] > 2):
+                question[3] -= 1
+
+        self.assertTrue(self.widget.applyQuestionnaires(questionnaires))
+        self.checkConsistent(questionnaires)
+        del answers[removedText]
+        self.assertEqual(self.getAnswersByText(), answers)
+
+        # A save made now is read back, by the checksum fast path and by full validation, with the same answers
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "save.txt")
+        saved = [[question[3], answer] for question, answer in zip(self.widget.questionsArray, self.widget.answerModel.getAnswers())]
+        writeSession(path, 0, saved, getQuestionnaireHash(questionnaires, 0))
+        self.assertEqual(loadSession(path, questionnaires), (0, saved))
+        with mock.patch.object(QuizSessions, "getChecksum", return_value="0"):
+            self.assertEqual(loadSession(path, questionnaires), (0, saved))
+        self.assertIsNone(self.widget.loadProgressFile(path))
+        self.buildAll()
+        self.assertEqual(self.getAnswersByText(), answers)
+
+    def test_add(self):
+        answers = self.getAnswersByAbsID()
+        questionnaires = questionnairesArray()
+        questions = questionnaires.getQuestions(0)
+        questions.append(["A new question", 0, -1, len(questions)])
+
+        self.assertTrue(self.widget.applyQuestionnaires(questionnaires))
+        self.checkConsistent(questionnaires)
+        answers[len(questions) - 1] = -1
+        self.assertEqual(self.getAnswersByAbsID(), answers)
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,104 @@
+# Versioned save files: a v2 save whose body checksum matches is read with only cheap checks instead of validating
+# each line, any other body (hand-edited, in the original format, or failing those checks) goes through parseBody,
+# and a save made before its questionnaire was edited is recognized from the header alone.
+
+from unittest import mock
+import tempfile
+import unittest
+import shutil
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizCatalogue import questionnairesArray
+from QuizSessions import (parseSession, encodeSession, writeSession, loadSession, getQuestionnaireHash, getChecksum,
+                          forgetQuestionnaireHashes, SessionError)
+import QuizSessions
+
+
+class SessionFormatTest(unittest.TestCase):
+    def setUp(self):
+        self.questionnaires = questionnairesArray()
+        # Every question answered, in reverse absID order so file order is not absID order
+        self.answers = [[question[3], question[3] % 6] for question in reversed(self.questionnaires.getQuestions(1))]
+        self.text = encodeSession(1, self.answers, getQuestionnaireHash(self.questionnaires, 1)).decode("utf-8")
+
+    def tearDown(self):
+        forgetQuestionnaireHashes()
+
+    def test_trusted_body_skips_validation(self):
+        with mock.patch.object(QuizSessions, "parseBody", side_effect=AssertionError("body validated")):
+            self.assertEqual(parseSession(self.text, self.questionnaires), (1, self.answers))
+
+    def test_checksum_mismatch_validates_body(self):
+        # A hand edit leaves the old checksum in the header; the edited body is still accepted if it is valid
+        header, body = self.text.split("\n", 1)
+        edited = header + "\n" + body.replace("%d,%d\n" % tuple(self.answers[0]), "%d,-1\n" % self.answers[0][0], 1)
+        with mock.patch.object(QuizSessions, "parseBody", wraps=QuizSessions.parseBody) as parseBody:
+            index, answers = parseSession(edited, self.questionnaires)
+        self.assertEqual(parseBody.call_count, 1)
+        self.assertEqual(answers[0], [self.answers[0][0], -1])
+        self.assertEqual(answers[1:], self.answers[1:])
+
+    def test_checksum_mismatch_rejects_invalid_body(self):
+        header, body = self.text.split("\n", 1)
+        lines = body.splitlines(True)
+        with self.assertRaises(SessionError) as raised:
+            parseSession(header + "\n" + lines[1] + "".join(lines[1:]), self.questionnaires)
+        self.assertEqual(str(raised.exception), "Error: savefile invalid.")
+
+    def test_matching_checksum_with_wrong_length_validates_body(self):
+        # The checksum only proves the body is what was written; it still has to have one line per question
+        body = "".join("%d,%d\n" % tuple(answer) for answer in self.answers[1:])
+        header = ",".join(["1", "v2", str(len(self.answers)), getQuestionnaireHash(self.questionnaires, 1), getChecksum(body)])
+        with self.assertRaises(SessionError) as raised:
+            parseSession(header + "\n" + body, self.questionnaires)
+        self.assertEqual(str(raised.exception), "Error: savefile invalid.")
+
+    def test_matching_checksum_with_invalid_answers_validates_body(self):
+        # A body written with a matching checksum (e.g. by another tool) can still hold answers no quiz could give
+        duplicate = [list(answer) for answer in self.answers]
+        duplicate[1][0] = duplicate[0][0]
+        outOfRange = [list(answer) for answer in self.answers]
+        outOfRange[0][1] = 9
+        for answers, detail in [(duplicate, "appears twice"), (outOfRange, "response 9")]:
+            text = encodeSession(1, answers, getQuestionnaireHash(self.questionnaires, 1)).decode("utf-8")
+            with self.assertRaises(SessionError) as raised:
+                parseSession(text, self.questionnaires)
+            self.assertEqual(str(raised.exception), "Error: savefile invalid.")
+            self.assertIn(detail, raised.exception.detail)
+
+    def test_edited_questionnaire_is_refused(self):
+        self.questionnaires.getQuestions(1)[0][0] = "Edited"
+        forgetQuestionnaireHashes()
+        with self.assertRaises(SessionError) as raised:
+            parseSession(self.text, self.questionnaires)
+        self.assertIn("different version", str(raised.exception))
+
+    def test_original_format(self):
+        body = "".join("%d,%d\n" % tuple(answer) for answer in self.answers)
+        self.assertEqual(parseSession("1\n" + body, self.questionnaires), (1, self.answers))
+
+    def test_compressed_round_trip(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for name, compression in [("a.txt.gz", "gzip"), ("a.txt.xz", "xz")]:
+            path = os.path.join(directory, name)
+            writeSession(path, 1, self.answers, getQuestionnaireHash(self.questionnaires, 1), compression)
+            self.assertEqual(loadSession(path, self.questionnaires), (1, self.answers))
+
+    def test_failed_write_keeps_the_old_save(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "a.txt")
+        writeSession(path, 1, self.answers, getQuestionnaireHash(self.questionnaires, 1))
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                writeSession(path, 1, [[absID, -1] for absID, response in self.answers], getQuestionnaireHash(self.questionnaires, 1))
+        self.assertEqual(os.listdir(directory), ["a.txt"])
+        self.assertEqual(loadSession(path, self.questionnaires), (1, self.answers))
+
+if (__name__ == "__main__"):
+    unittest.main()
@@ -0,0 +1,34 @@
+# Early decisions: a verdict is only decided once the unanswered questions could not even tie it, since ties are
+# settled at random.
+
+import unittest
+import sys
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDirectory)
+
+from QuizScoring import getDecidedVerdict, westVerdict, eastVerdict
+
+
+class DecidedVerdictTest(unittest.TestCase):
+    def test_open_while_unanswered_questions_could_catch_up(self):
+        self.assertEqual(getDecidedVerdict([0, 1, 1], [5, -1, -1]), 0)
+        self.assertEqual(getDecidedVerdict([0, 1], [-1, -1]), 0)
+
+    def test_decided_once_the_lead_cannot_be_caught(self):
+        self.assertEqual(getDecidedVerdict([0, 0, 1], [5, 1, -1]), westVerdict)
+        self.assertEqual(getDecidedVerdict([1, 0, 1], [3, -1, 3]), eastVerdict)
+
+    def test_equal_lead_is_not_decided(self):
+        # Ties are settled at random, so a lead the remaining questions could exactly match is still open
+        self.assertEqual(getDecidedVerdict([0, 1], [5, -1]), 0)
+        self.assertEqual(getDecidedVerdict([1, 1, 0], [3, 2, -1]), 0)
+
+    def test_complete_session(self):
+        self.assertEqual(getDecidedVerdict([0, 1], [4, 3]), westVerdict)
+        self.assertEqual(getDecidedVerdict([0, 1], [2, 3]), eastVerdict)
+        self.assertEqual(getDecidedVerdict([0, 1], [3, 3]), 0)
+
+if (__name__ == "__main__"):
+    unittest.main()